@@ -0,0 +1,61 @@
+"""
+Cities with hospitals, by state abbreviation. The list lives in
+cities_by_state.json and is only read, and indexed for prefix lookups, the
+first time it's asked for.
+"""
+
+from functools import cache
+from pathlib import Path
+
+import bisect
+import json
+
+CITIES_PATH = Path(__file__).with_name("cities_by_state.json")
+
+
+@cache
+def _cities() -> dict[str, tuple[str, ...]]:
+    with open(CITIES_PATH, encoding="utf-8") as f:
+        return {state: tuple(cities) for state, cities in json.load(f).items()}
+
+
+@cache
+def _prefix_index() -> tuple[list[str], list[tuple[str, str]]]:
+    """
+    Every (city, state) pair sorted by casefolded city name, with the sort
+    keys alongside, so a prefix is a contiguous run found by bisection.
+    """
+    pairs = sorted(
+        ((city.casefold(), city, state) for state, cities in _cities().items() for city in cities)
+    )
+    return [key for key, _, _ in pairs], [(city, state) for _, city, state in pairs]
+
+
+def states() -> list[str]:
+    return list(_cities())
+
+
+def cities_in_state(state: str) -> list[str]:
+    """Cities for a state abbreviation, ex. "OH", or an empty list."""
+    return list(_cities().get(state.upper(), ()))
+
+
+def cities_with_prefix(
+    prefix: str, state: str | None = None, limit: int = 10
+) -> list[tuple[str, str]]:
+    """
+    (city, state) pairs whose city starts with prefix, case-insensitive, in
+    alphabetical order. Narrowed to one state abbreviation if given.
+    """
+    prefix = prefix.strip().casefold()
+    if not prefix:
+        return []
+    keys, pairs = _prefix_index()
+    state = state.upper() if state else None
+    matches: list[tuple[str, str]] = []
+    for position in range(bisect.bisect_left(keys, prefix), len(keys)):
+        if not keys[position].startswith(prefix) or len(matches) >= limit:
+            break
+        if state is None or pairs[position][1] == state:
+            matches.append(pairs[position])
+    return matches
@@ -1,30 +1,12 @@
+from .routes import PAGES, Page, lazy_component, register_pages
 
-from .about_us import about_us_page
-from .contact_us import contact_page
-from .create_account import create_account_page
-from .dashboard import dashboard_page
-from .donate import donate_page
-from .for_staff import for_staff_page
-from .for_students import for_students_page
-from .for_travelers import for_travelers_page
-from .forgot_password import forgot_password_page
-from .forgot_password_confirmation import forgot_password_confirmation_page
-from .hospital_overview import hospital_overview_page
-from .index import index_page
-from .login import login_page
-from .logout import logout_page
-from .my_account import my_account_page
-from .onboard_welcome import onboard_welcome_page
-from .onboard_identity import onboard_identity_page
-from .onboard_avatar import onboard_avatar_page
-from .onboard_background import onboard_background_page
-from .policy_ai import ai_policy_page
-from .policy_privacy import privacy_policy_page
-from .report_assignment import assignment_page
-from .report_compensation import compensation_page
-from .report_complete import complete_page
-from .report_overview import overview_page
-from .report_research import research_page
-from .report_staffing import staffing_page
-from .roadmap import roadmap_page
-from .search_hospitals import search_page
+import importlib
+
+
+def __getattr__(name: str):
+    # Page functions stay importable by name, ex. from .pages import dashboard_page,
+    # without importing every page module up front.
+    for page in PAGES:
+        if page.component == name:
+            return getattr(importlib.import_module(f"{__name__}.{page.module}"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
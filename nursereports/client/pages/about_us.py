@@ -3,7 +3,6 @@ from ..components import navbar, footer, flex, text
 import reflex as rx
 
 
-@rx.page(route="/about-us", title="Nurse Reports")
 def about_us_page() -> rx.Component:
     return rx.flex(
         navbar(),
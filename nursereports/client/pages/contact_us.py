@@ -9,9 +9,6 @@ from ...states import BaseState
 import reflex as rx
 
 
-@rx.page(
-    route="/contact-us", title="Nurse Reports", on_load=BaseState.event_state_refresh_login,
-)
 def contact_page() -> rx.Component:
     return flex(
         content(),
@@ -10,10 +10,6 @@ from ...states import UserState, BaseState
 
 import reflex as rx
 
-@rx.page(
-    route="/create-account",
-    title="Nurse Reports",
-)
 def create_account_page() -> rx.Component:
     return rx.flex(
         navbar(),
@@ -9,18 +9,10 @@ from ..components import (
 )
 from .navbar import navbar
 from .footer import footer
-from ...states import BaseState, HospitalState, UserState
+from ...states import HospitalState, UserState
 
 import reflex as rx
 
-@rx.page(
-    route="/dashboard",
-    title="Nurse Reports",
-    on_load=[
-        BaseState.event_state_refresh_login,
-        BaseState.event_state_requires_report,
-    ],
-)
 @report_protected
 def dashboard_page() -> rx.Component:
     return rx.flex(
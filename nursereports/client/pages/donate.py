@@ -2,9 +2,6 @@
 import reflex as rx
 
 
-@rx.page(
-    route="/donate", title="Nurse Reports"
-)
 def donate_page() -> rx.Component:
     return rx.flex(
         content(),
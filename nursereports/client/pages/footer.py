@@ -8,6 +8,8 @@ import reflex as rx
 # Public API
 # ---------------------------------------------------------------------------
 
+# Compiled once into a shared component that every page renders.
+@rx.memo
 def footer() -> rx.Component:
     return rx.flex(
         rx.flex(
@@ -5,7 +5,6 @@ from .footer import footer
 import reflex as rx
 
 
-@rx.page(route="/for-students", title="Nurse Reports")
 def for_students_page() -> rx.Component:
     return rx.flex(
         navbar(),
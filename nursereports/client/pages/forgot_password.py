@@ -10,10 +10,6 @@ from ...states import BaseState, UserState
 
 import reflex as rx
 
-@rx.page(
-    route="/login/forgot-password",
-    title="Nurse Reports"
-)
 def forgot_password_page() -> rx.Component:
     return rx.flex(
         navbar(),
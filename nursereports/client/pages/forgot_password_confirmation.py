@@ -7,10 +7,6 @@ from .navbar import navbar
 
 import reflex as rx
 
-@rx.page(
-    route="/login/forgot-password/confirmation",
-    title="Nurse Reports",
-)
 def forgot_password_confirmation_page() -> rx.Component:
     return rx.flex(
         navbar(),
@@ -8,20 +8,11 @@ from ..components import (
 )
 from .navbar import navbar
 from .footer import footer
-from ...states import BaseState, HospitalState, ReportState, UserState
+from ...states import HospitalState, ReportState, UserState
 
 import reflex as rx
 
 
-@rx.page(
-    route="/hospital/[cms_id]",
-    title="Nurse Reports",
-    on_load=[
-        BaseState.event_state_refresh_login,
-        BaseState.event_state_requires_report,
-        HospitalState.event_state_load_hospital_info,
-    ],
-)
 @report_protected
 def hospital_overview_page() -> rx.Component:
     return rx.flex(
@@ -151,7 +142,7 @@ def _hospital_header() -> rx.Component:
 def _stat_strip() -> rx.Component:
     return rx.flex(
         _stat_tile(
-            HospitalState.report_info.length(),
+            HospitalState.report_count,
             "Reports",
             sky=False,
         ),
@@ -769,9 +760,9 @@ def _ratings_table_row(row: dict) -> rx.Component:
             text(row["units_areas_roles"], size="sm", class_name="truncate"),
             class_name="flex-1 min-w-0",
         ),
-        _ratings_float_cell(row["comp_display"], row["comp_tier"]),
-        _ratings_float_cell(row["assign_display"], row["assign_tier"]),
-        _ratings_float_cell(row["staff_display"], row["staff_tier"]),
+        _ratings_float_cell(row["comp_overall_display"], row["comp_overall_tier"]),
+        _ratings_float_cell(row["assign_overall_display"], row["assign_overall_tier"]),
+        _ratings_float_cell(row["staff_overall_display"], row["staff_overall_tier"]),
         _ratings_float_cell(row["overall_display"], row["overall_tier"]),
         class_name=(
             "flex-row items-center gap-2 px-4 py-2.5 min-h-11 overflow-hidden shrink-0 "
@@ -923,7 +914,7 @@ def _reviews_section() -> rx.Component:
                 rx.select(
                     HospitalState.units_areas_roles_for_units,
                     value=HospitalState.selected_review_unit,
-                    on_change=HospitalState.set_selected_review_unit,
+                    on_change=HospitalState.event_state_select_review_unit,
                     size="1",
                 ),
                 class_name=(
@@ -934,10 +925,10 @@ def _reviews_section() -> rx.Component:
             ),
         ),
         rx.cond(
-            HospitalState.review_info,
+            HospitalState.review_count > 0,
             rx.flex(
                 rx.flex(
-                    rx.foreach(HospitalState.paginated_review_info, _review_card),
+                    rx.foreach(HospitalState.review_page, _review_card),
                     class_name=(
                         "flex-col divide-y "
                         "divide-neutral-300 dark:divide-neutral-800/50"
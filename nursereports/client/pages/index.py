@@ -8,19 +8,10 @@ from ..components import (
 )
 from .navbar import navbar
 from .footer import footer
-from ...states import BaseState, UserState
 
 import reflex as rx
 
 
-@rx.page(
-    route="/",
-    title="Nurse Reports",
-    on_load=[
-        UserState.event_state_hydrate_user,
-        BaseState.event_state_handle_sso_redirect,
-    ],
-)
 def index_page() -> rx.Component:
     return rx.flex(
         navbar(),
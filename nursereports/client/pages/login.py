@@ -6,15 +6,10 @@ from ..components import (
     link,
 )
 from .navbar import navbar
-from ...states import BaseState, UserState
+from ...states import UserState
 
 import reflex as rx
 
-@rx.page(
-    route="/login",
-    title="Nurse Reports",
-    on_load=BaseState.event_state_check_expired_login,
-)
 def login_page() -> rx.Component:
     return rx.flex(
         navbar(),
@@ -11,14 +11,6 @@ from ...states import BaseState, UserState
 
 import reflex as rx
 
-@rx.page(
-    route="/my-account",
-    title="Nurse Reports",
-    on_load=[
-        BaseState.event_state_refresh_login,
-        BaseState.event_state_requires_login,
-    ],
-)
 def my_account_page() -> rx.Component:
     return rx.flex(
         navbar(),
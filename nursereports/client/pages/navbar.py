@@ -11,6 +11,8 @@ import reflex as rx
 # Public API
 # ---------------------------------------------------------------------------
 
+# Compiled once into a shared component that every page renders.
+@rx.memo
 def navbar() -> rx.Component:
     return rx.flex(
         _feedback_dialog(),
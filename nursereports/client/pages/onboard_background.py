@@ -1,7 +1,7 @@
 from ..components import button, heading, icon, login_protected, text
 from .navbar import navbar
 from .footer import footer
-from ...states import BaseState, OnboardState, SearchState
+from ...states import OnboardState, SearchState
 
 import reflex as rx
 
@@ -16,15 +16,6 @@ _CARD = (
 _DIVIDER = "border-b border-neutral-300 dark:border-neutral-800/50"
 
 
-@rx.page(
-    route="/onboard/background",
-    title="Nurse Reports",
-    on_load=[
-        BaseState.event_state_refresh_login,
-        BaseState.event_state_requires_login,
-        OnboardState.event_state_onboard_flow,
-    ],
-)
 @login_protected
 def onboard_background_page() -> rx.Component:
     return rx.flex(
@@ -7,9 +7,6 @@ from ..components import (
 import reflex as rx
 
 
-@rx.page(
-    route="/policy/ai", title="Nurse Reports"
-)
 def ai_policy_page() -> rx.Component:
     return flex(
         content(),
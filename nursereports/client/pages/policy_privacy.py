@@ -7,10 +7,6 @@ from ..components import(
 import reflex as rx
 
 
-@rx.page(
-    route="/policy/privacy",
-    title="Nurse Reports"
-)
 def privacy_policy_page() -> rx.Component:
     return flex(
         content(),
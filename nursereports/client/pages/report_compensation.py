@@ -6,20 +6,11 @@ from ..components import (
     text,
 )
 from .navbar import navbar
-from ...states import BaseState, ReportState, constants_types
+from ...states import ReportState, constants_types
 
 import reflex as rx
 
 
-@rx.page(
-    route="/report/[report_mode]/compensation",
-    title="Nurse Reports",
-    on_load=[
-        BaseState.event_state_refresh_login,
-        BaseState.event_state_requires_login,
-        ReportState.event_state_report_flow,
-    ],
-)
 @login_protected
 def compensation_page() -> rx.Component:
     return rx.flex(
@@ -7,19 +7,10 @@ from ..components import (
     text,
 )
 from .navbar import navbar
-from ...states import BaseState
 
 import reflex as rx
 
 
-@rx.page(
-    route="/report/[report_mode]/complete",
-    title="Nurse Reports",
-    on_load=[
-        BaseState.event_state_refresh_login,
-        BaseState.event_state_requires_login,
-    ],
-)
 @login_protected
 def complete_page() -> rx.Component:
     return rx.flex(
@@ -6,20 +6,11 @@ from ..components import (
     text,
 )
 from .navbar import navbar
-from ...states import BaseState, ReportState, UserState
+from ...states import ReportState, UserState
 
 import reflex as rx
 
 
-@rx.page(
-    route="/report/[report_mode]/overview",
-    title="Nurse Reports",
-    on_load=[
-        BaseState.event_state_refresh_login,
-        BaseState.event_state_requires_login,
-        ReportState.event_state_report_flow,
-    ],
-)
 @login_protected
 def overview_page() -> rx.Component:
     return rx.flex(
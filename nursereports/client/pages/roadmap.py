@@ -2,9 +2,6 @@ from ..components import navbar, footer, flex, text
 import reflex as rx
 
 
-@rx.page(
-    route="/roadmap", title="Nurse Reports"
-)
 def roadmap_page() -> rx.Component:
     return rx.flex(
         navbar(),
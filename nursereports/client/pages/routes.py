@@ -0,0 +1,270 @@
+"""
+Route table for every page. Pages are registered from here instead of with
+@rx.page in their modules, so a page module is only imported once Reflex
+evaluates the page.
+"""
+
+# Components import states, and states read the state name dicts from the
+# components package, so components have to finish importing first.
+from .. import components  # noqa: F401
+from ...states import AuthState, BaseState, HospitalState, OnboardState, ReportState, UserState
+
+from typing import Any, Callable, NamedTuple
+
+import importlib
+import reflex as rx
+
+
+class Page(NamedTuple):
+    module: str
+    component: str
+    route: str
+    title: str = "Nurse Reports"
+    on_load: Any = None
+
+
+PAGES = (
+    Page(
+        "about_us",
+        "about_us_page",
+        "/about-us",
+    ),
+    Page(
+        "contact_us",
+        "contact_page",
+        "/contact-us",
+        on_load=BaseState.event_state_refresh_login,
+    ),
+    Page(
+        "create_account",
+        "create_account_page",
+        "/create-account",
+    ),
+    Page(
+        "dashboard",
+        "dashboard_page",
+        "/dashboard",
+        on_load=[
+            BaseState.event_state_refresh_login,
+            BaseState.event_state_requires_report,
+        ],
+    ),
+    Page(
+        "donate",
+        "donate_page",
+        "/donate",
+    ),
+    Page(
+        "for_staff",
+        "for_staff_page",
+        "/for-staff",
+    ),
+    Page(
+        "for_students",
+        "for_students_page",
+        "/for-students",
+    ),
+    Page(
+        "for_travelers",
+        "for_travelers_page",
+        "/for-travelers",
+    ),
+    Page(
+        "forgot_password",
+        "forgot_password_page",
+        "/login/forgot-password",
+    ),
+    Page(
+        "forgot_password_confirmation",
+        "forgot_password_confirmation_page",
+        "/login/forgot-password/confirmation",
+    ),
+    Page(
+        "hospital_overview",
+        "hospital_overview_page",
+        "/hospital/[cms_id]",
+        on_load=[
+            BaseState.event_state_refresh_login,
+            BaseState.event_state_requires_report,
+            HospitalState.event_state_load_hospital_info,
+        ],
+    ),
+    Page(
+        "index",
+        "index_page",
+        "/",
+        on_load=[
+            UserState.event_state_hydrate_user,
+            BaseState.event_state_handle_sso_redirect,
+        ],
+    ),
+    Page(
+        "login",
+        "login_page",
+        "/login",
+        on_load=BaseState.event_state_check_expired_login,
+    ),
+    Page(
+        "logout",
+        "logout_page",
+        "/logout/[logout_reason]",
+        title="Logging out...",
+        on_load=AuthState.event_state_logout,
+    ),
+    Page(
+        "my_account",
+        "my_account_page",
+        "/my-account",
+        on_load=[
+            BaseState.event_state_refresh_login,
+            BaseState.event_state_requires_login,
+        ],
+    ),
+    Page(
+        "onboard_avatar",
+        "onboard_avatar_page",
+        "/onboard/avatar",
+        on_load=[
+            BaseState.event_state_refresh_login,
+            BaseState.event_state_requires_login,
+            OnboardState.event_state_onboard_flow,
+        ],
+    ),
+    Page(
+        "onboard_background",
+        "onboard_background_page",
+        "/onboard/background",
+        on_load=[
+            BaseState.event_state_refresh_login,
+            BaseState.event_state_requires_login,
+            OnboardState.event_state_onboard_flow,
+        ],
+    ),
+    Page(
+        "onboard_identity",
+        "onboard_identity_page",
+        "/onboard/identity",
+        on_load=[
+            BaseState.event_state_refresh_login,
+            BaseState.event_state_requires_login,
+            OnboardState.event_state_onboard_flow,
+            OnboardState.event_state_generate_display_name,
+        ],
+    ),
+    Page(
+        "onboard_welcome",
+        "onboard_welcome_page",
+        "/onboard/welcome",
+        on_load=[
+            BaseState.event_state_refresh_login,
+            BaseState.event_state_requires_login,
+            OnboardState.event_state_onboard_flow,
+        ],
+    ),
+    Page(
+        "policy_ai",
+        "ai_policy_page",
+        "/policy/ai",
+    ),
+    Page(
+        "policy_privacy",
+        "privacy_policy_page",
+        "/policy/privacy",
+    ),
+    Page(
+        "report_assignment",
+        "assignment_page",
+        "/report/[report_mode]/assignment",
+        on_load=[
+            BaseState.event_state_refresh_login,
+            BaseState.event_state_requires_login,
+            ReportState.event_state_report_flow,
+        ],
+    ),
+    Page(
+        "report_compensation",
+        "compensation_page",
+        "/report/[report_mode]/compensation",
+        on_load=[
+            BaseState.event_state_refresh_login,
+            BaseState.event_state_requires_login,
+            ReportState.event_state_report_flow,
+        ],
+    ),
+    Page(
+        "report_complete",
+        "complete_page",
+        "/report/[report_mode]/complete",
+        on_load=[
+            BaseState.event_state_refresh_login,
+            BaseState.event_state_requires_login,
+        ],
+    ),
+    Page(
+        "report_overview",
+        "overview_page",
+        "/report/[report_mode]/overview",
+        on_load=[
+            BaseState.event_state_refresh_login,
+            BaseState.event_state_requires_login,
+            ReportState.event_state_report_flow,
+        ],
+    ),
+    Page(
+        "report_research",
+        "research_page",
+        "/report/[report_mode]/research",
+        on_load=[
+            BaseState.event_state_refresh_login,
+            BaseState.event_state_requires_login,
+            ReportState.event_state_report_flow,
+        ],
+    ),
+    Page(
+        "report_staffing",
+        "staffing_page",
+        "/report/[report_mode]/staffing",
+        on_load=[
+            BaseState.event_state_refresh_login,
+            BaseState.event_state_requires_login,
+            ReportState.event_state_report_flow,
+        ],
+    ),
+    Page(
+        "roadmap",
+        "roadmap_page",
+        "/roadmap",
+    ),
+    Page(
+        "search_hospitals",
+        "search_page",
+        "/search/hospital",
+        title="Search",
+        on_load=[
+            BaseState.event_state_refresh_login,
+            BaseState.event_state_requires_login,
+        ],
+    ),
+)
+
+
+def lazy_component(module: str, component: str) -> Callable[[], rx.Component]:
+    """Page function that imports its module the first time it's rendered."""
+    module_name = f"{__package__}.{module}"
+
+    def render() -> rx.Component:
+        return getattr(importlib.import_module(module_name), component)()
+
+    render.__name__ = render.__qualname__ = component
+    render.__module__ = module_name
+    return render
+
+
+def register_pages(app: rx.App) -> None:
+    for page in PAGES:
+        app.add_page(
+            lazy_component(page.module, page.component),
+            route=page.route,
+            title=page.title,
+            on_load=page.on_load,
+        )
@@ -6,18 +6,10 @@ from ..components import (
     login_protected,
 )
 from .navbar import navbar
-from ...states import BaseState, HospitalState, ReportState, SearchState, UserState
+from ...states import HospitalState, ReportState, SearchState, UserState
 
 import reflex as rx
 
-@rx.page(
-    title="Search",
-    route="/search/hospital",
-    on_load=[
-        BaseState.event_state_refresh_login,
-        BaseState.event_state_requires_login,
-    ],
-)
 @login_protected
 def search_page() -> rx.Component:
     return rx.flex(
@@ -1,5 +1,8 @@
 
-from .client.pages import *
+from .client.pages import register_pages
+from .server.api import stats_api
+from .server.hospitals import load_hospital_directory
+from .server.search import load_hospital_search_index
 # from .tests.pages import *
 
 import reflex as rx
@@ -15,4 +18,9 @@ app = rx.App(
         "https://cdn.jsdelivr.net/npm/@fontsource/geist-mono/index.css",
         "stylesheet.css",
     ],
-)
\ No newline at end of file
+    api_transformer=stats_api,
+)
+register_pages(app)
+app.register_lifespan_task(load_hospital_directory)
+# Builds from the directory, so it's registered after it.
+app.register_lifespan_task(load_hospital_search_index)
@@ -0,0 +1,5 @@
+from .hospital import materialize_hospital_analytics
+from .store import HospitalAnalyticsStore, hospital_analytics
+from .projections import OVERVIEW_PROFILES, project_report, projection_select
+from .state_baselines import StatePayBaselines, build_state_baselines, state_pay_baselines
+from .reviews import ALL_UNITS, ReviewIndex
@@ -0,0 +1,100 @@
+"""
+Microbenchmark for the hospital pay-curve engine against the per-value
+implementation it replaced. Run with:
+
+    python -m nursereports.server.analytics.benchmark
+"""
+
+import numpy as np
+import polars as pl
+
+from .pay import fit_pay_curves
+
+import timeit
+
+
+def _legacy_remove_pay_outliers(df: pl.DataFrame, y_name: str, multiplier: float = 2) -> pl.DataFrame:
+    if len(df) < 4:
+        return df
+    y_values = df[y_name].to_numpy()
+    q1 = np.percentile(y_values, 25)
+    q3 = np.percentile(y_values, 75)
+    iqr = q3 - q1
+    return df.filter((df[y_name] >= q1 - multiplier * iqr) & (df[y_name] <= q3 + multiplier * iqr))
+
+
+def _legacy_flatten_pay(df: pl.DataFrame, x_name: str, y_name: str) -> pl.DataFrame:
+    x = df[x_name].to_numpy()
+    y = df[y_name].to_numpy()
+    unique_x = np.unique(x)
+    averaged_y = [np.mean(y[x == val]) for val in unique_x]
+    return pl.DataFrame({x_name: unique_x, y_name: averaged_y})
+
+
+def _legacy_linear_regression_pay(df: pl.DataFrame, x_name: str, y_name: str) -> dict:
+    years = df[x_name].to_numpy()
+    pay = df[y_name].to_numpy()
+    x_range = np.arange(0, 27)
+    if len(df) == 0:
+        return {}
+    if len(df) == 1:
+        y_range = np.full_like(x_range, pay[0], dtype=float)
+    else:
+        m, b = np.polyfit(years, pay, 1)
+        if len(df) < 10:
+            b = max(20, min(b, 55))
+            m = max(0.5, min(m, 4))
+        y_range = m * x_range + b
+    return {int(x): round(float(y), 2) for x, y in zip(x_range, y_range)}
+
+
+def legacy_fit(groups: np.ndarray, years: np.ndarray, pay: np.ndarray, n_groups: int) -> list[dict]:
+    """Previous implementation: one polars pipeline per employment type."""
+    df = pl.DataFrame({"group": groups, "total": years, "hourly": pay})
+    curves = []
+    for group in range(n_groups):
+        group_df = df.filter(pl.col("group") == group).select("hourly", "total").sort("total")
+        group_df = _legacy_remove_pay_outliers(group_df, "hourly")
+        group_df = _legacy_flatten_pay(group_df, "total", "hourly")
+        curves.append(_legacy_linear_regression_pay(group_df, "total", "hourly"))
+    return curves
+
+
+def sample(n_reports: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    groups = rng.integers(0, 2, n_reports)
+    years = rng.integers(0, 27, n_reports)
+    pay = np.round(32 + 1.1 * years + rng.normal(0, 6, n_reports))
+    return groups, years, pay
+
+
+def main(sizes: tuple[int, ...] = (10, 1_000, 100_000), repeat: int = 5) -> None:
+    print(f"{'reports':>10} {'legacy ms':>12} {'vectorized ms':>14} {'speedup':>9} {'max diff':>9}")
+    for size in sizes:
+        groups, years, pay = sample(size)
+        number = max(1, 2_000 // max(1, size // 50))
+
+        legacy_s = min(timeit.repeat(lambda: legacy_fit(groups, years, pay, 2), number=number, repeat=repeat)) / number
+        vector_s = min(timeit.repeat(lambda: fit_pay_curves(groups, years, pay, 2), number=number, repeat=repeat)) / number
+
+        legacy_curves = legacy_fit(groups, years, pay, 2)
+        curves, points = fit_pay_curves(groups, years, pay, 2)
+        max_diff = max(
+            (
+                float(np.max(np.abs(curves[g] - np.array(list(legacy_curves[g].values())))))
+                for g in range(2)
+                if points[g]
+            ),
+            default=0.0,
+        )
+        print(
+            f"{size:>10,} {legacy_s * 1000:>12.3f} {vector_s * 1000:>14.3f} "
+            f"{legacy_s / vector_s:>8.1f}x {max_diff:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    from loguru import logger
+
+    logger.remove()
+    main()
@@ -0,0 +1,63 @@
+import polars as pl
+
+from typing import Any
+
+# Flat, typed view of a report holding only what the overview loaders read.
+REPORT_SCHEMA: dict[str, pl.DataType] = {
+    "report_id": pl.String,
+    "created_at": pl.String,
+    "timestamp": pl.String,
+    "emp_type": pl.String,
+    "hourly": pl.Float64,
+    "weekly": pl.Float64,
+    "total_experience": pl.Int16,
+    "unit": pl.String,
+    "area": pl.String,
+    "role": pl.String,
+    "comp_overall": pl.Int8,
+    "assign_overall": pl.Int8,
+    "staff_overall": pl.Int8,
+    "comp_comments": pl.String,
+    "assign_comments": pl.String,
+    "staff_comments": pl.String,
+    "likes": pl.Object,
+    "tags": pl.Object,
+}
+
+
+def _entered_or_selected(row: dict, name: str) -> str | None:
+    """Entered value wins over selected, empty strings become None."""
+    return row.get(f"entered_{name}") or row.get(f"selected_{name}") or None
+
+
+def reports_to_frame(rows: list[dict[str, Any]]) -> pl.DataFrame:
+    """
+    Builds one columnar frame with REPORT_SCHEMA from report rows fetched
+    with the overview projection, in a single pass and without copying.
+    Columns missing from the rows are left null. Values are cast to the
+    column type where they can be, ex. "5" for total_experience, and
+    nulled where they can't, so one malformed report doesn't fail the
+    whole hospital.
+    """
+    columns: dict[str, list] = {name: [] for name in REPORT_SCHEMA}
+    for row in rows:
+        columns["report_id"].append(row.get("report_id"))
+        columns["created_at"].append(row.get("created_at"))
+        columns["timestamp"].append(row.get("modified_at") or row.get("submitted_at"))
+        columns["emp_type"].append(row.get("emp_type"))
+        columns["hourly"].append(row.get("hourly"))
+        columns["weekly"].append(row.get("weekly"))
+        columns["total_experience"].append(row.get("total_experience"))
+        columns["unit"].append(_entered_or_selected(row, "unit"))
+        columns["area"].append(_entered_or_selected(row, "area"))
+        columns["role"].append(_entered_or_selected(row, "role"))
+        columns["comp_overall"].append(row.get("comp_overall"))
+        columns["assign_overall"].append(row.get("assign_overall"))
+        columns["staff_overall"].append(row.get("staff_overall"))
+        columns["comp_comments"].append(row.get("comp_comments") or None)
+        columns["assign_comments"].append(row.get("assign_comments") or None)
+        columns["staff_comments"].append(row.get("staff_comments") or None)
+        columns["likes"].append(row.get("likes"))
+        columns["tags"].append(row.get("tags"))
+
+    return pl.DataFrame(columns, schema=REPORT_SCHEMA, strict=False)
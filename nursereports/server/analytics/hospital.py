@@ -0,0 +1,201 @@
+import polars as pl
+
+from .columnar import reports_to_frame
+from .pay import fit_pay_curves
+
+from loguru import logger
+from typing import Any
+
+import traceback
+
+# Employment types with hourly pay curves, mapped to their fit group.
+HOURLY_EMP_TYPES = {"Full-time": 0, "Part-time": 1}
+
+
+def materialize_hospital_analytics(reports: list[dict]) -> dict[str, Any]:
+    """
+    Computes everything the hospital overview displays from a hospital's
+    report rows, fetched with the overview projection. Keys match the
+    HospitalState vars they populate, except review_info which the store
+    indexes for paging. Relative times (time_ago) are left to the caller
+    since they go stale.
+    """
+    analytics = empty_hospital_analytics()
+    analytics["report_count"] = len(reports)
+    if reports:
+        report_df = reports_to_frame(reports)
+        analytics.update(load_pay_info(report_df))
+        analytics.update(load_unit_info(report_df))
+        analytics.update(load_review_info(report_df))
+    return analytics
+
+
+def empty_hospital_analytics() -> dict[str, Any]:
+    return {
+        "report_count": 0,
+        "extrapolated_ft_pay_hospital": [],
+        "extrapolated_pt_pay_hospital": [],
+        "averaged_contract_pay_hospital": {},
+        "ft_pay_hospital_info_limited": False,
+        "pt_pay_hospital_info_limited": False,
+        "contract_pay_info_hospital_limited": False,
+        "units_areas_roles_for_units": [],
+        "units_areas_roles_hospital_scores": [],
+        "overall_hospital_scores": {},
+        "review_info": [],
+    }
+
+
+def load_pay_info(report_df: pl.DataFrame) -> dict[str, Any]:
+    """
+    Pulls pay data out of the report frame and processes data to partition
+    into user digestible chunks for display. Hourly curves are lists of pay
+    indexed by years of experience.
+    """
+    pay_info: dict[str, Any] = {}
+    try:
+        hourly_df = report_df.filter(
+            pl.col("emp_type").is_in(list(HOURLY_EMP_TYPES))
+            & pl.col("hourly").is_not_null()
+            & pl.col("total_experience").is_not_null()
+        )
+        curves, points = fit_pay_curves(
+            hourly_df["emp_type"].replace_strict(HOURLY_EMP_TYPES, return_dtype=pl.Int64).to_numpy(),
+            hourly_df["total_experience"].to_numpy(),
+            hourly_df["hourly"].to_numpy(),
+            n_groups=len(HOURLY_EMP_TYPES),
+        )
+        for emp_type, code in HOURLY_EMP_TYPES.items():
+            key = "ft" if emp_type == "Full-time" else "pt"
+            pay_info[f"{key}_pay_hospital_info_limited"] = bool(points[code] < 10)
+            pay_info[f"extrapolated_{key}_pay_hospital"] = (
+                curves[code].tolist() if points[code] else []
+            )
+            logger.debug(f"Fitted {emp_type} pay on {points[code]} year(s) of experience.")
+
+        contract_pay_df = (
+            report_df.filter(pl.col("emp_type") == "Contract")
+            .select(pl.col("weekly"), pl.col("created_at"))
+            .sort(by=pl.col("created_at"))
+        )
+
+        pay_info["contract_pay_info_hospital_limited"] = bool(len(contract_pay_df) < 10)
+
+        if len(contract_pay_df) > 0:
+            pay_info["averaged_contract_pay_hospital"] = simple_average_pay(
+                contract_pay_df, "weekly"
+            )
+            logger.debug(
+                f"Pulled {len(contract_pay_df)} contract report(s) and averaged them."
+            )
+        else:
+            logger.debug("No contract pay data present to be loaded to state...")
+
+    except Exception as e:
+        traceback.print_exc()
+        logger.critical(e)
+
+    return pay_info
+
+
+def simple_average_pay(pay_df: pl.DataFrame, y_name: str) -> dict:
+    """Mean of y_name formatted for display under key averaged_{y_name}."""
+    averaged = pay_df[y_name].mean()
+    if averaged is None:
+        return {}
+    return {f"averaged_{y_name}": f"${round(averaged):,}"}
+
+
+def load_unit_info(report_df: pl.DataFrame) -> dict[str, Any]:
+    unit_info: dict[str, Any] = {}
+    try:
+        sorted_units = sorted(report_df["unit"].drop_nulls().unique().to_list())
+        sorted_areas = sorted(report_df["area"].drop_nulls().unique().to_list())
+        sorted_roles = sorted(report_df["role"].drop_nulls().unique().to_list())
+
+        unit_info["units_areas_roles_for_units"] = (
+            ["Hospital Overall"] + sorted_units + sorted_areas + sorted_roles
+        )
+
+        hospital_score_df = report_df.select(
+            pl.lit("HOSPITAL").alias("units_areas_roles"),
+            pl.col("comp_overall").mean(),
+            pl.col("assign_overall").mean(),
+            pl.col("staff_overall").mean(),
+        ).with_columns(
+            pl.mean_horizontal("comp_overall", "assign_overall", "staff_overall")
+            .alias("overall")
+        )
+
+        scores_df = pl.concat(
+            [
+                _score_by(report_df, "unit"),
+                _score_by(report_df, "area"),
+                _score_by(report_df, "role"),
+            ],
+            how="vertical",
+        )
+
+        unit_info["overall_hospital_scores"] = hospital_score_df.to_dicts()[0]
+        unit_info["units_areas_roles_hospital_scores"] = scores_df.to_dicts()
+
+    except Exception as e:
+        traceback.print_exc()
+        logger.critical(e)
+
+    return unit_info
+
+
+def _score_by(report_df: pl.DataFrame, column: str) -> pl.DataFrame:
+    """Mean section and overall scores grouped by unit, area, or role."""
+    return (
+        report_df.group_by(column)
+        .agg(
+            pl.col("comp_overall").mean().alias("comp_overall"),
+            pl.col("assign_overall").mean().alias("assign_overall"),
+            pl.col("staff_overall").mean().alias("staff_overall"),
+            ((pl.col("comp_overall").mean() + pl.col("assign_overall").mean() + pl.col("staff_overall").mean()) / 3).alias("overall"),
+        )
+        .drop_nulls(column)
+        .rename({column: "units_areas_roles"})
+    )
+
+
+def load_review_info(report_df: pl.DataFrame) -> dict[str, Any]:
+    review_info: dict[str, Any] = {}
+    try:
+        refined_df = (
+            report_df
+            .filter(
+                pl.any_horizontal(
+                    [
+                        pl.col("comp_comments").is_not_null(),
+                        pl.col("assign_comments").is_not_null(),
+                        pl.col("staff_comments").is_not_null(),
+                    ]
+                )
+            )
+            .select(
+                pl.col("report_id"),
+                pl.coalesce(
+                    [
+                        pl.col("unit"),
+                        pl.col("area"),
+                        pl.col("role")
+                    ]
+                ).alias("units_areas_roles"),
+                pl.col("comp_comments"),
+                pl.col("assign_comments"),
+                pl.col("staff_comments"),
+                pl.col("likes"),
+                pl.col("tags"),
+                pl.col("timestamp"),
+            )
+        )
+
+        review_info["review_info"] = refined_df.to_dicts()
+
+    except Exception as e:
+        logger.critical(e)
+
+    return review_info
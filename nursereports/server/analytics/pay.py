@@ -0,0 +1,130 @@
+import numpy as np
+
+# Experience is reported as 0-25 years, with 26 meaning "more than 25 years".
+EXPERIENCE_YEARS = np.arange(0, 27)
+
+# Bounds applied to the fitted line when a curve has fewer than 10 points.
+MIN_NEW_RN_PAY = 20
+MAX_NEW_RN_PAY = 55
+MIN_PAY_PROGRESSION_SLOPE = 0.5
+MAX_PAY_PROGRESSION_SLOPE = 4
+LIMITED_POINTS = 10
+
+# Hourly pay is entered as whole dollars under $1000, which lets quartiles be
+# read off per-group histograms instead of sorting.
+HISTOGRAM_PAY_LIMIT = 1000
+
+
+def _order_statistics(
+    groups: np.ndarray, pay: np.ndarray, counts: np.ndarray, ranks: np.ndarray
+) -> np.ndarray:
+    """
+    Values at ranks[g, i] (0-based, ascending) within each group. Uses one
+    bincount histogram when pay is whole dollars, otherwise partitions each
+    group's slice.
+    """
+    n_groups = len(counts)
+    integral = pay.min() >= 0 and pay.max() < HISTOGRAM_PAY_LIMIT and np.all(pay == np.floor(pay))
+    if integral:
+        histogram = np.bincount(
+            groups * HISTOGRAM_PAY_LIMIT + pay.astype(np.intp),
+            minlength=n_groups * HISTOGRAM_PAY_LIMIT,
+        ).reshape(n_groups, HISTOGRAM_PAY_LIMIT)
+        cumulative = np.cumsum(histogram, axis=1)
+        values = np.empty(ranks.shape, dtype=float)
+        for group in range(n_groups):
+            values[group] = np.searchsorted(cumulative[group], ranks[group], side="right")
+        return values
+
+    order = np.argsort(groups, kind="stable")
+    grouped_pay = pay[order]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    values = np.zeros(ranks.shape, dtype=float)
+    for group in np.flatnonzero(counts):
+        segment = grouped_pay[starts[group] : starts[group] + counts[group]]
+        partitioned = np.partition(segment, np.unique(ranks[group]))
+        values[group] = partitioned[ranks[group]]
+    return values
+
+
+def _inlier_mask(
+    groups: np.ndarray, pay: np.ndarray, n_groups: int, multiplier: float
+) -> np.ndarray:
+    """
+    IQR outlier filter computed for every group at once. Quartiles use the
+    same linear interpolation as np.percentile. Groups with fewer than 4
+    entries keep everything.
+    """
+    counts = np.bincount(groups, minlength=n_groups)
+    last = np.maximum(counts - 1, 0)[:, None]
+    position = np.array([0.25, 0.75]) * last
+    lo = np.floor(position).astype(np.intp)
+    hi = np.minimum(lo + 1, last)
+    stats = _order_statistics(groups, pay, counts, np.concatenate((lo, hi), axis=1))
+    quartiles = stats[:, :2] + (stats[:, 2:] - stats[:, :2]) * (position - lo)
+    q1, q3 = quartiles[:, 0], quartiles[:, 1]
+    iqr = q3 - q1
+    enough = counts >= 4
+    lower = np.where(enough, q1 - multiplier * iqr, -np.inf)
+    upper = np.where(enough, q3 + multiplier * iqr, np.inf)
+    return (pay >= lower[groups]) & (pay <= upper[groups])
+
+
+def fit_pay_curves(
+    groups: np.ndarray,
+    years: np.ndarray,
+    pay: np.ndarray,
+    n_groups: int,
+    multiplier: float = 2,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Fits a pay-over-experience line for every group (ex. employment type) in
+    one batch. Per group: drop IQR outliers, average pay per experience year,
+    then least-squares fit the yearly averages. Sparse groups get their
+    intercept and slope clamped to sane ranges.
+
+    Returns (curves, points): curves is an (n_groups, 27) array of hourly pay
+    by experience year, points the number of distinct years each line was
+    fitted on. Groups with no points have a curve of zeros.
+    """
+    groups = np.asarray(groups, dtype=np.intp)
+    years = np.clip(np.asarray(years, dtype=np.intp), 0, len(EXPERIENCE_YEARS) - 1)
+    pay = np.asarray(pay, dtype=float)
+    n_years = len(EXPERIENCE_YEARS)
+
+    if len(pay):
+        keep = _inlier_mask(groups, pay, n_groups, multiplier)
+        groups, years, pay = groups[keep], years[keep], pay[keep]
+
+    # Average pay per (group, year) cell.
+    cells = groups * n_years + years
+    sums = np.bincount(cells, weights=pay, minlength=n_groups * n_years)
+    counts = np.bincount(cells, minlength=n_groups * n_years)
+    occupied = np.flatnonzero(counts)
+    point_groups, x = np.divmod(occupied, n_years)
+    y = sums[occupied] / counts[occupied]
+
+    # Closed-form least squares per group over the yearly averages.
+    points = np.bincount(point_groups, minlength=n_groups)
+    sum_x = np.bincount(point_groups, weights=x, minlength=n_groups)
+    sum_y = np.bincount(point_groups, weights=y, minlength=n_groups)
+    sum_xx = np.bincount(point_groups, weights=x * x, minlength=n_groups)
+    sum_xy = np.bincount(point_groups, weights=x * y, minlength=n_groups)
+
+    denominator = points * sum_xx - sum_x**2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(
+            denominator > 0, (points * sum_xy - sum_x * sum_y) / denominator, 0.0
+        )
+        intercept = np.where(points > 0, (sum_y - slope * sum_x) / points, 0.0)
+
+    clamp = (points > 1) & (points < LIMITED_POINTS)
+    intercept = np.where(
+        clamp, np.clip(intercept, MIN_NEW_RN_PAY, MAX_NEW_RN_PAY), intercept
+    )
+    slope = np.where(
+        clamp, np.clip(slope, MIN_PAY_PROGRESSION_SLOPE, MAX_PAY_PROGRESSION_SLOPE), slope
+    )
+
+    curves = np.round(slope[:, None] * EXPERIENCE_YEARS + intercept[:, None], 2)
+    return curves, points
@@ -0,0 +1,95 @@
+from typing import Any
+
+# Fetch profiles for the reports table as (alias, PostgREST JSON path) pairs.
+# '->>' returns text, '->' keeps the JSON type (numbers, arrays).
+REPORT_PROJECTIONS: dict[str, tuple[tuple[str, str], ...]] = {
+    "pay": (
+        ("report_id", "report_id"),
+        ("created_at", "created_at"),
+        ("emp_type", "compensation->>emp_type"),
+        ("hourly", "compensation->pay->hourly"),
+        ("weekly", "compensation->pay->weekly"),
+        ("total_experience", "compensation->experience->total"),
+    ),
+    "state_pay": (
+        ("report_id", "report_id"),
+        ("state", "hospital->>state"),
+        ("emp_type", "compensation->>emp_type"),
+        ("hourly", "compensation->pay->hourly"),
+        ("weekly", "compensation->pay->weekly"),
+        ("total_experience", "compensation->experience->total"),
+    ),
+    "scores": (
+        ("report_id", "report_id"),
+        ("entered_unit", "assignment->unit->>entered_unit"),
+        ("selected_unit", "assignment->unit->>selected_unit"),
+        ("entered_area", "assignment->area->>entered_area"),
+        ("selected_area", "assignment->area->>selected_area"),
+        ("entered_role", "assignment->role->>entered_role"),
+        ("selected_role", "assignment->role->>selected_role"),
+        ("comp_overall", "compensation->ratings->overall"),
+        ("assign_overall", "assignment->ratings->overall"),
+        ("staff_overall", "staffing->ratings->overall"),
+    ),
+    "reviews": (
+        ("report_id", "report_id"),
+        ("submitted_at", "submitted_at"),
+        ("modified_at", "modified_at"),
+        ("entered_unit", "assignment->unit->>entered_unit"),
+        ("selected_unit", "assignment->unit->>selected_unit"),
+        ("entered_area", "assignment->area->>entered_area"),
+        ("selected_area", "assignment->area->>selected_area"),
+        ("entered_role", "assignment->role->>entered_role"),
+        ("selected_role", "assignment->role->>selected_role"),
+        ("comp_comments", "compensation->>comments"),
+        ("assign_comments", "assignment->>comments"),
+        ("staff_comments", "staffing->>comments"),
+        ("likes", "social->likes"),
+        ("tags", "social->tags"),
+    ),
+    "moderation": (
+        ("report_id", "report_id"),
+        ("hospital_id", "hospital_id"),
+        ("user_id", "user_id"),
+        ("entered_unit", "assignment->unit->>entered_unit"),
+        ("entered_area", "assignment->area->>entered_area"),
+        ("entered_role", "assignment->role->>entered_role"),
+        ("comp_comments", "compensation->>comments"),
+        ("assign_comments", "assignment->>comments"),
+        ("staff_comments", "staffing->>comments"),
+    ),
+}
+
+
+def _columns(*profiles: str) -> list[tuple[str, str]]:
+    """Union of profile columns, deduplicated, in first-seen order."""
+    columns: dict[str, str] = {}
+    for profile in profiles:
+        for alias, path in REPORT_PROJECTIONS[profile]:
+            columns.setdefault(alias, path)
+    return list(columns.items())
+
+
+def projection_select(*profiles: str) -> str:
+    """PostgREST select string for one or more profiles, ex. 'report_id,emp_type:compensation->>emp_type'."""
+    return ",".join(
+        alias if alias == path else f"{alias}:{path}"
+        for alias, path in _columns(*profiles)
+    )
+
+
+def project_report(report: dict[str, Any], *profiles: str) -> dict[str, Any]:
+    """
+    Applies the same projection to a full report dict held in memory, so a
+    freshly written report matches rows fetched with projection_select.
+    """
+    projected = {}
+    for alias, path in _columns(*profiles):
+        value: Any = report
+        for key in path.replace("->>", "->").split("->"):
+            value = value.get(key) if isinstance(value, dict) else None
+        projected[alias] = value
+    return projected
+
+
+OVERVIEW_PROFILES = ("pay", "scores", "reviews")
@@ -0,0 +1,96 @@
+from ..cache.ttl_cache import estimate_size
+
+from bisect import bisect_left
+from datetime import datetime, timezone
+from loguru import logger
+from typing import Any
+
+# Display label that means "no unit filter".
+ALL_UNITS = "Hospital Overall"
+
+ReviewCursor = tuple[str, str]
+
+
+def review_timestamp(value: Any) -> datetime | None:
+    """Timestamp as an aware datetime (naive ones are UTC), or None if missing or invalid."""
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def review_key(review: dict[str, Any]) -> tuple[datetime, str] | None:
+    """Sort key for a review, or None if its timestamp can't be ordered."""
+    timestamp = review_timestamp(review.get("timestamp"))
+    if timestamp is None:
+        return None
+    return (timestamp, review.get("report_id") or "")
+
+
+class ReviewIndex:
+    """
+    A hospital's reviews ordered by (timestamp, report_id), overall and per
+    unit/area/role. Pages are read newest first by keyset: the cursor is the
+    (timestamp, report_id) of the last review on the previous page, so a page
+    costs a binary search plus a slice however many reviews there are.
+    Reviews without a valid timestamp can't be placed and are left out.
+    """
+
+    def __init__(self, reviews: list[dict[str, Any]]):
+        keyed = [(review_key(review), review) for review in reviews]
+        ordered = sorted(
+            ((key, review) for key, review in keyed if key is not None), key=lambda pair: pair[0]
+        )
+        if len(ordered) < len(keyed):
+            logger.warning(f"Left {len(keyed) - len(ordered)} review(s) without a valid timestamp out of the index.")
+        self._all = ([key for key, _ in ordered], [review for _, review in ordered])
+        self._by_unit: dict[str, tuple[list, list]] = {}
+        for key, review in zip(*self._all):
+            keys, rows = self._by_unit.setdefault(review.get("units_areas_roles"), ([], []))
+            keys.append(key)
+            rows.append(review)
+        self._by_id = {review.get("report_id"): review for review in self._all[1]}
+
+    def __len__(self) -> int:
+        return len(self._all[1])
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + estimate_size(self._all[1]) + 64 * len(self._all[0]) * 2
+
+    def _select(self, unit: str | None) -> tuple[list, list]:
+        """Reviews for a unit, or all reviews if the unit has none (or no unit is given)."""
+        if unit and unit != ALL_UNITS and unit in self._by_unit:
+            return self._by_unit[unit]
+        return self._all
+
+    def update(self, report_id: str, **fields: Any) -> bool:
+        """Set fields on an indexed review. Returns False if it isn't indexed."""
+        review = self._by_id.get(report_id)
+        if review is None:
+            return False
+        review.update(fields)
+        return True
+
+    def count(self, unit: str | None = None) -> int:
+        return len(self._select(unit)[1])
+
+    def page(
+        self, unit: str | None = None, after: ReviewCursor | None = None, limit: int = 10
+    ) -> tuple[list[dict[str, Any]], ReviewCursor | None]:
+        """
+        Up to limit reviews older than the cursor, newest first, and the
+        cursor for the following page (None on the last page). Rows are
+        shared with the index, copy them before mutating.
+        """
+        keys, rows = self._select(unit)
+        end = len(keys)
+        timestamp = review_timestamp(after[0]) if after is not None else None
+        if timestamp is not None:
+            end = bisect_left(keys, (timestamp, after[1]))
+        start = max(end - limit, 0)
+        page = rows[start:end][::-1]
+        cursor = (page[-1]["timestamp"], page[-1].get("report_id") or "") if start > 0 else None
+        return page, cursor
@@ -0,0 +1,163 @@
+"""
+Statewide pay baselines for the hospital overview. A batch job reads every
+report once, fits full/part-time pay curves and contract averages for all
+states together, and writes them to a JSON file the app serves from memory.
+
+    python -m nursereports.server.analytics.state_baselines
+"""
+
+from ..supabase import supabase_select_all
+from .hospital import HOURLY_EMP_TYPES, simple_average_pay
+from .pay import LIMITED_POINTS, fit_pay_curves
+from .projections import projection_select
+
+from datetime import datetime, timezone
+from loguru import logger
+from pathlib import Path
+from typing import Any
+
+import json
+import os
+import polars as pl
+import threading
+import time
+
+STATE_BASELINES_PATH = Path(os.getenv("STATE_BASELINES_PATH", "data/state_pay_baselines.json"))
+
+STATE_PAY_SCHEMA = {
+    "state": pl.String,
+    "emp_type": pl.String,
+    "hourly": pl.Float64,
+    "weekly": pl.Float64,
+    "total_experience": pl.Int16,
+}
+
+
+def compute_state_baselines(rows: list[dict]) -> dict[str, dict[str, Any]]:
+    """
+    Pay baselines for every state present in rows (state_pay projection),
+    keyed by state abbreviation. Keys match the HospitalState vars they feed.
+    """
+    report_df = pl.DataFrame(
+        {name: [row.get(name) for row in rows] for name in STATE_PAY_SCHEMA},
+        schema=STATE_PAY_SCHEMA,
+        # Off-type values become null instead of failing every state's baselines.
+        strict=False,
+    ).filter(pl.col("state").is_not_null() & (pl.col("state") != ""))
+    states = sorted(report_df["state"].unique().to_list())
+    state_codes = {state: code for code, state in enumerate(states)}
+    n_types = len(HOURLY_EMP_TYPES)
+
+    # Every (state, employment type) curve is fitted in the same batch.
+    hourly_df = report_df.filter(
+        pl.col("emp_type").is_in(list(HOURLY_EMP_TYPES))
+        & pl.col("hourly").is_not_null()
+        & pl.col("total_experience").is_not_null()
+    )
+    groups = (
+        hourly_df["state"].replace_strict(state_codes, return_dtype=pl.Int64).to_numpy() * n_types
+        + hourly_df["emp_type"].replace_strict(HOURLY_EMP_TYPES, return_dtype=pl.Int64).to_numpy()
+    )
+    curves, points = fit_pay_curves(
+        groups,
+        hourly_df["total_experience"].to_numpy(),
+        hourly_df["hourly"].to_numpy(),
+        n_groups=len(states) * n_types,
+    )
+
+    contract_df = report_df.filter(
+        (pl.col("emp_type") == "Contract") & pl.col("weekly").is_not_null()
+    )
+    contract_by_state = contract_df.partition_by("state", as_dict=True)
+
+    baselines: dict[str, dict[str, Any]] = {}
+    for state, code in state_codes.items():
+        baseline: dict[str, Any] = {}
+        for emp_type, type_code in HOURLY_EMP_TYPES.items():
+            key = "ft" if emp_type == "Full-time" else "pt"
+            group = code * n_types + type_code
+            baseline[f"extrapolated_{key}_pay_state"] = (
+                curves[group].tolist() if points[group] else []
+            )
+            baseline[f"{key}_pay_state_info_limited"] = bool(points[group] < LIMITED_POINTS)
+
+        state_contract_df = contract_by_state.get((state,))
+        contract_count = 0 if state_contract_df is None else len(state_contract_df)
+        baseline["averaged_contract_pay_state"] = (
+            simple_average_pay(state_contract_df, "weekly") if contract_count else {}
+        )
+        baseline["contract_pay_info_state_limited"] = bool(contract_count < 10)
+        baselines[state] = baseline
+
+    return baselines
+
+
+def build_state_baselines(path: Path = STATE_BASELINES_PATH) -> dict[str, dict[str, Any]]:
+    """Reads all reports in one keyset-paged pass and writes baselines to path."""
+    rows = supabase_select_all(
+        "reports", projection_select("state_pay"), key="report_id", admin=True
+    )
+    baselines = compute_state_baselines(rows)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text(
+        json.dumps(
+            {
+                "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "report_count": len(rows),
+                "states": baselines,
+            }
+        )
+    )
+    temporary.replace(path)
+    logger.info(f"Wrote pay baselines for {len(baselines)} state(s) from {len(rows)} report(s) to {path}.")
+    return baselines
+
+
+class StatePayBaselines:
+    """
+    Serves baselines written by build_state_baselines. The file is read once
+    and re-read only when its modification time changes, which is checked at
+    most every check_interval seconds.
+    """
+
+    def __init__(self, path: Path = STATE_BASELINES_PATH, check_interval: float = 60):
+        self._path = path
+        self._check_interval = check_interval
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._mtime: float | None = None
+        self._states: dict[str, dict[str, Any]] = {}
+
+    def _reload_if_changed(self) -> None:
+        now = time.monotonic()
+        if self._mtime is not None and now - self._checked_at < self._check_interval:
+            return
+        self._checked_at = now
+        try:
+            mtime = self._path.stat().st_mtime
+        except FileNotFoundError:
+            return
+        if mtime == self._mtime:
+            return
+        with self._lock:
+            if mtime == self._mtime:
+                return
+            try:
+                self._states = json.loads(self._path.read_text())["states"]
+                self._mtime = mtime
+                logger.debug(f"Loaded state pay baselines from {self._path}.")
+            except Exception as e:
+                logger.critical(f"Unable to load state pay baselines - {e}")
+
+    def get(self, state_abbr: str) -> dict[str, Any]:
+        """Baseline for a state abbreviation, or {} if none has been built."""
+        self._reload_if_changed()
+        return self._states.get(state_abbr, {})
+
+
+state_pay_baselines = StatePayBaselines()
+
+
+if __name__ == "__main__":
+    build_state_baselines()
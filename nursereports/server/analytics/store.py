@@ -0,0 +1,115 @@
+from ..cache import AsyncSingleFlight, TTLCache
+from .hospital import materialize_hospital_analytics
+from .projections import OVERVIEW_PROFILES, project_report
+from .reviews import ReviewIndex
+
+from loguru import logger
+from typing import Any, Callable
+
+
+class HospitalAnalyticsStore:
+    """
+    Materialized hospital overview analytics keyed by CMS ID, shared by every
+    session in the process. A hospital's reports are fetched and crunched once;
+    after that, writes to one of its reports are folded into the stored report
+    list and only that hospital is recomputed.
+
+    Entries live in an LRU cache with a TTL, so reports written by other
+    workers are picked up once an entry expires.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 3600,
+        max_entries: int = 512,
+        max_bytes: int = 256 * 1024 * 1024,
+    ):
+        self._entries = TTLCache(
+            "hospital_analytics", ttl=ttl, max_entries=max_entries, max_bytes=max_bytes
+        )
+        self._flights = AsyncSingleFlight()
+
+    def get(self, hosp_id: str) -> dict[str, Any] | None:
+        """
+        Returns {"reports": [...], "analytics": {...}, "reviews": ReviewIndex}
+        or None if not materialized. Reports are rows in the overview
+        projection.
+        """
+        return self._entries.get(hosp_id)
+
+    async def get_or_materialize(
+        self, hosp_id: str, fetch_reports: Callable[[], list[dict]]
+    ) -> dict[str, Any]:
+        """
+        Entry for a hospital, materialized from fetch_reports on a miss. The
+        fetch and materialization run in a worker thread, and sessions
+        opening the same cold hospital await one of them.
+        """
+        entry = self._entries.get(hosp_id)
+        if entry is None:
+            entry, _ = await self._flights.do(
+                hosp_id,
+                lambda: self._entries.get(hosp_id, count=False)
+                or self._materialize(hosp_id, fetch_reports()),
+            )
+        return entry
+
+    def _materialize(self, hosp_id: str, reports: list[dict]) -> dict[str, Any]:
+        analytics = materialize_hospital_analytics(reports)
+        entry = {
+            "reports": reports,
+            "analytics": analytics,
+            # Reviews are served a page at a time, not copied into sessions.
+            "reviews": ReviewIndex(analytics.pop("review_info")),
+        }
+        self._entries.set(hosp_id, entry)
+        logger.debug(f"Materialized analytics for {hosp_id} from {len(reports)} report(s).")
+        return entry
+
+    def apply_report(self, hosp_id: str, report: dict) -> None:
+        """
+        Folds a new or edited full report into a materialized hospital.
+        Hospitals that aren't materialized yet are left alone and built on
+        next visit.
+        """
+        entry = self._entries.get(hosp_id, count=False)
+        if entry is None:
+            return
+        reports = [r for r in entry["reports"] if r.get("report_id") != report.get("report_id")]
+        reports.append(project_report(report, *OVERVIEW_PROFILES))
+        self._materialize(hosp_id, reports)
+
+    def remove_report(self, hosp_id: str, report_id: str) -> None:
+        entry = self._entries.get(hosp_id, count=False)
+        if entry is None:
+            return
+        reports = [r for r in entry["reports"] if r.get("report_id") != report_id]
+        self._materialize(hosp_id, reports)
+
+    def update_likes(self, hosp_id: str, report_id: str, likes: list[str]) -> None:
+        """
+        Sets a report's likes on a materialized hospital. Likes don't feed
+        the analytics, so the review and stored report are patched in place
+        instead of recomputing the hospital.
+        """
+        entry = self._entries.get(hosp_id, count=False)
+        if entry is None:
+            return
+        for report in entry["reports"]:
+            if report.get("report_id") == report_id:
+                report["likes"] = list(likes)
+        if not entry["reviews"].update(report_id, likes=list(likes)):
+            self.invalidate(hosp_id)
+
+    def invalidate(self, hosp_id: str | None = None) -> None:
+        """Drop one hospital, or everything if hosp_id is None."""
+        if hosp_id is None:
+            self._entries.clear()
+        else:
+            self._entries.invalidate(hosp_id)
+
+    def stats(self) -> dict[str, int | float]:
+        return self._entries.stats()
+
+
+hospital_analytics = HospitalAnalyticsStore()
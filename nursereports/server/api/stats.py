@@ -0,0 +1,45 @@
+from ..cache import cache_stats
+from ..mailgun import mail_outbox
+from ..supabase import query_stats
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+import hmac
+import os
+import reflex as rx
+
+_config = rx.config.get_config()
+
+
+def _authorized(request: Request) -> bool:
+    """Bearer token check against stats_token. The endpoints are disabled when it's unset."""
+    token = _config.stats_token
+    supplied = request.headers.get("authorization", "").removeprefix("Bearer ")
+    return bool(token) and hmac.compare_digest(supplied, token)
+
+
+async def stats(request: Request) -> Response:
+    """Supabase round trip histograms, cache and mail outbox counters for this worker process."""
+    if not _authorized(request):
+        return Response(status_code=404)
+    return JSONResponse(
+        {"pid": os.getpid(), **query_stats(), "caches": cache_stats(), "mail": mail_outbox.stats()}
+    )
+
+
+async def mail_status(request: Request) -> Response:
+    """Delivery status of a message queued on this worker's mail outbox."""
+    if not _authorized(request):
+        return Response(status_code=404)
+    status = mail_outbox.status(request.path_params["message_id"])
+    if status is None:
+        return JSONResponse({"error": "Unknown message id."}, status_code=404)
+    return JSONResponse(status)
+
+
+stats_api = Starlette(
+    routes=[Route("/stats", stats), Route("/stats/mail/{message_id}", mail_status)]
+)
@@ -0,0 +1,5 @@
+from .single_flight import AsyncSingleFlight, SingleFlight
+from .ttl_cache import TTLCache, cache_stats
+
+# Hospital rows from hospitals_v2 keyed by CMS ID.
+hospital_row_cache = TTLCache("hospital_rows", ttl=3600, max_entries=8192, max_bytes=16 * 1024 * 1024)
@@ -0,0 +1,115 @@
+from typing import Any, Callable, Hashable
+
+import asyncio
+import threading
+
+
+class _Flight:
+    __slots__ = ("done", "value", "error", "followers")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.followers = 0
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls for the same key into one. The first caller
+    runs the loader while later callers block until it finishes and receive
+    the same result or exception. Nothing is kept once the call completes,
+    so results are never staler than the read itself.
+
+    Followers block their thread, so this is for worker threads and jobs.
+    Event handlers on the event loop use AsyncSingleFlight.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: dict[Hashable, _Flight] = {}
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, loader: Callable[[], Any]) -> tuple[Any, bool]:
+        """
+        Result of loader for key, and whether it went to more than one caller.
+        Shared results are the same object for every caller, so anyone who
+        mutates them should copy first.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.calls += 1
+            else:
+                flight.followers += 1
+                self.shared += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value, True
+
+        try:
+            flight.value = loader()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+        # Followers can only join before the flight is removed above, so the count is final.
+        return flight.value, flight.followers > 0
+
+
+class AsyncSingleFlight:
+    """
+    SingleFlight for coroutines on an event loop. The first caller runs the
+    loader in a worker thread, so the loop keeps serving other sessions, and
+    later callers await the same future instead of blocking. Flights are
+    keyed by loop as well, since a future can only be awaited on its own.
+    """
+
+    def __init__(self):
+        self._flights: dict[tuple[asyncio.AbstractEventLoop, Hashable], list] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, loader: Callable[[], Any]) -> tuple[Any, bool]:
+        """
+        Result of loader for key, and whether it went to more than one caller.
+        Shared results are the same object for every caller, so anyone who
+        mutates them should copy first.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+        # [future, followers]. Only touched from this loop's thread.
+        flight = self._flights.get(flight_key)
+        if flight is not None:
+            flight[1] += 1
+            self.shared += 1
+            return await asyncio.shield(flight[0]), True
+
+        future = loop.create_future()
+        flight = self._flights[flight_key] = [future, 0]
+        self.calls += 1
+        try:
+            value = await asyncio.to_thread(loader)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            if not flight[1]:
+                # Nobody else is waiting, mark the exception retrieved.
+                future.exception()
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            self._flights.pop(flight_key, None)
+        return value, flight[1] > 0
@@ -0,0 +1,144 @@
+from .single_flight import SingleFlight
+
+from loguru import logger
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+import sys
+import threading
+import time
+
+# Every cache created in the process, for reporting stats.
+_registry: dict[str, "TTLCache"] = {}
+
+
+def estimate_size(value: Any) -> int:
+    """Rough deep size in bytes of JSON-like data (dicts, lists, scalars)."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(estimate_size(item) for item in value)
+    return size
+
+
+class TTLCache:
+    """
+    Thread-safe, process-wide LRU cache with per-entry TTL and a memory
+    budget. Least recently used entries are evicted once either max_entries
+    or max_bytes is exceeded. Values are shared between sessions, so callers
+    must copy before mutating.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        sizer: Callable[[Any], int] = estimate_size,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizer = sizer
+        self._lock = threading.Lock()
+        self._flights = SingleFlight()
+        # key -> (expires_at, size, value)
+        self._entries: OrderedDict[Hashable, tuple[float, int, Any]] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        _registry[name] = self
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, count=False) is not None
+
+    def get(self, key: Hashable, count: bool = True) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                self._drop(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                if count:
+                    self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if count:
+                self.hits += 1
+            return entry[2]
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        size = self._sizer(value)
+        if size > self.max_bytes:
+            logger.warning(f"{self.name}: {key} is {size} bytes, larger than the cache budget.")
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (expires_at, size, value)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+
+    def get_or_set(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Cached value for key, loading it on a miss. Concurrent misses share one load."""
+        value = self.get(key)
+        if value is None:
+            value, _ = self._flights.do(key, lambda: self._load(key, loader))
+        return value
+
+    def _load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        # Another caller may have filled the key while we waited to lead.
+        value = self.get(key, count=False)
+        if value is None:
+            value = loader()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _drop(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def stats(self) -> dict[str, int | float]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+def cache_stats() -> dict[str, dict[str, int | float]]:
+    """Hit/miss/size counters for every TTLCache in the process."""
+    return {name: cache.stats() for name, cache in _registry.items()}
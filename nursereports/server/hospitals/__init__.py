@@ -0,0 +1,2 @@
+from .ingest import diff_hospitals, ingest, normalize_cms_id, read_hospital_rows
+from .snapshot import HospitalDirectory, build_snapshot, hospital_directory, load_hospital_directory
@@ -0,0 +1,190 @@
+"""
+Load the yearly hospital list workbook into hospitals_v2. Rows are streamed
+from the workbook, compared against the directory already in supabase, and
+only new or changed hospitals are written, so rerunning on the same file
+writes nothing.
+
+    python -m nursereports.server.hospitals.ingest [--path assets/HospitaList2025.xlsx] [--dry-run]
+"""
+
+from ..supabase import supabase_select_all, supabase_upsert
+
+from loguru import logger
+from typing import Any, Iterable, Iterator
+
+import argparse
+import itertools
+import openpyxl
+import re
+import time
+
+HOSPITAL_LIST_PATH = "assets/HospitaList2025.xlsx"
+HOSPITAL_SHEETS = ("Acute Hospitals",)
+
+# Same rule HospitalState.hosp_id enforces on page params.
+CMS_ID_PATTERN = re.compile(r"^[a-zA-Z0-9]{5,6}$")
+
+# Workbook header to hospitals_v2 column.
+COLUMNS = {
+    "ID": "hosp_id",
+    "NAME": "hosp_name",
+    "ADDRESS": "hosp_addr",
+    "CITY": "hosp_city",
+    "STATE": "hosp_state",
+    "ZIP": "hosp_zip",
+}
+INGEST_COLUMNS = ",".join(COLUMNS.values())
+
+# New hospitals start with no departments. Existing ones keep theirs.
+EMPTY_DEPARTMENTS = {"units": [], "areas": [], "roles": []}
+
+BATCH_SIZE = 1000
+
+
+def normalize_cms_id(value: Any) -> str | None:
+    """
+    CMS certification number as text, or None if it doesn't look like one.
+    Numeric cells lose their leading zeros in Excel, so they're padded back
+    to six digits.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        value = f"{int(value):06d}"
+    cms_id = str(value).strip().upper()
+    return cms_id if CMS_ID_PATTERN.match(cms_id) else None
+
+
+def normalize_text(value: Any) -> str | None:
+    if value is None:
+        return None
+    text = " ".join(str(value).split())
+    return text or None
+
+
+def normalize_zip(value: Any) -> str | None:
+    if isinstance(value, (int, float)):
+        return f"{int(value):05d}"
+    return normalize_text(value)
+
+
+def read_hospital_rows(
+    path: str = HOSPITAL_LIST_PATH, sheets: Iterable[str] = HOSPITAL_SHEETS
+) -> Iterator[dict[str, str | None]]:
+    """
+    Yields hospitals_v2 rows from the workbook one at a time. The workbook
+    is opened read-only so rows are parsed as they're iterated instead of
+    loading every sheet into memory. Rows without a valid CMS ID are
+    skipped.
+    """
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        for sheet in sheets:
+            rows = workbook[sheet].iter_rows(values_only=True)
+            # Title rows come before the header on some sheets.
+            header = next(
+                (row for row in rows if row and str(row[0] or "").strip().upper() == "ID"), None
+            )
+            if header is None:
+                logger.warning(f"No header row found on sheet {sheet}.")
+                continue
+            positions = {
+                COLUMNS[name]: index
+                for index, cell in enumerate(header)
+                if (name := str(cell or "").strip().upper()) in COLUMNS
+            }
+            skipped = 0
+            for row in rows:
+                values = {column: row[index] for column, index in positions.items()}
+                hosp_id = normalize_cms_id(values.pop("hosp_id"))
+                if hosp_id is None:
+                    if any(row):
+                        skipped += 1
+                    continue
+                hospital = {"hosp_id": hosp_id}
+                for column, value in values.items():
+                    hospital[column] = (
+                        normalize_zip(value) if column == "hosp_zip" else normalize_text(value)
+                    )
+                yield hospital
+            if skipped:
+                logger.warning(f"Skipped {skipped} row(s) on {sheet} without a valid CMS ID.")
+    finally:
+        workbook.close()
+
+
+def diff_hospitals(
+    incoming: Iterable[dict], existing: dict[str, dict]
+) -> tuple[list[dict], list[dict]]:
+    """
+    Splits workbook rows into (new, changed) against existing rows keyed by
+    CMS ID. Unchanged rows are dropped. A CMS ID repeated in the workbook
+    keeps its last row.
+    """
+    latest: dict[str, dict] = {}
+    for hospital in incoming:
+        latest[hospital["hosp_id"]] = hospital
+
+    new, changed = [], []
+    for hosp_id, hospital in latest.items():
+        current = existing.get(hosp_id)
+        if current is None:
+            new.append(hospital)
+        elif any(current.get(column) != value for column, value in hospital.items()):
+            changed.append(hospital)
+    return new, changed
+
+
+def batched(rows: list[dict], size: int) -> Iterator[list[dict]]:
+    iterator = iter(rows)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def ingest(
+    path: str = HOSPITAL_LIST_PATH,
+    sheets: Iterable[str] = HOSPITAL_SHEETS,
+    batch_size: int = BATCH_SIZE,
+    dry_run: bool = False,
+) -> dict[str, int]:
+    """Writes new and changed hospitals from the workbook. Returns counts."""
+    start = time.perf_counter()
+    existing = {
+        row["hosp_id"]: row
+        for row in supabase_select_all("hospitals_v2", INGEST_COLUMNS, key="hosp_id", admin=True)
+    }
+    new, changed = diff_hospitals(read_hospital_rows(path, sheets), existing)
+    logger.info(
+        f"Read {path} against {len(existing)} existing hospital(s): "
+        f"{len(new)} new, {len(changed)} changed."
+    )
+
+    if not dry_run:
+        # Separate writes so existing rows keep their departments, since a
+        # bulk upsert sets the same columns on every row.
+        for batch in batched(changed, batch_size):
+            supabase_upsert("hospitals_v2", batch, on_conflict="hosp_id")
+        for batch in batched(new, batch_size):
+            supabase_upsert(
+                "hospitals_v2",
+                [{**hospital, "departments": EMPTY_DEPARTMENTS} for hospital in batch],
+                on_conflict="hosp_id",
+            )
+        logger.info(f"Ingest finished in {time.perf_counter() - start:.1f}s.")
+
+    return {"existing": len(existing), "new": len(new), "changed": len(changed)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load the hospital list workbook into hospitals_v2.")
+    parser.add_argument("--path", default=HOSPITAL_LIST_PATH)
+    parser.add_argument("--sheet", action="append", dest="sheets", help="Sheet to read, repeatable.")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="Diff without writing.")
+    args = parser.parse_args()
+
+    ingest(args.path, args.sheets or HOSPITAL_SHEETS, args.batch_size, args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Columnar snapshot of the hospital directory, so hospital lookups don't go
+to supabase. Rebuild after the directory changes in bulk:
+
+    python -m nursereports.server.hospitals.snapshot [--path data/hospitals.arrow]
+"""
+
+from ..supabase import supabase_select_all
+
+from loguru import logger
+from pathlib import Path
+from typing import Any, Iterable
+
+import argparse
+import os
+import polars as pl
+import threading
+import time
+
+HOSPITAL_SNAPSHOT_PATH = Path(os.getenv("HOSPITAL_SNAPSHOT_PATH", "data/hospitals.arrow"))
+
+# Departments aren't included. The moderation queue adds to them between
+# rebuilds, so they're read from supabase.
+SNAPSHOT_SCHEMA = {
+    "hosp_id": pl.String,
+    "hosp_name": pl.String,
+    "hosp_addr": pl.String,
+    "hosp_city": pl.String,
+    "hosp_state": pl.String,
+    "hosp_zip": pl.String,
+    "hosp_county": pl.String,
+}
+SNAPSHOT_COLUMNS = ",".join(SNAPSHOT_SCHEMA)
+
+
+def build_snapshot(rows: list[dict], path: Path = HOSPITAL_SNAPSHOT_PATH) -> int:
+    """
+    Writes hospitals_v2 rows to an uncompressed Arrow IPC file, which can be
+    memory-mapped on load. The file is replaced atomically so running
+    servers never read a partial snapshot.
+    """
+    records = [{column: row.get(column) for column in SNAPSHOT_SCHEMA} for row in rows]
+    frame = pl.DataFrame(records, schema=SNAPSHOT_SCHEMA).sort("hosp_id")
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix(".partial")
+    frame.write_ipc(partial, compression="uncompressed")
+    os.replace(partial, path)
+    logger.info(f"Wrote {len(frame)} hospital(s) to {path}.")
+    return len(frame)
+
+
+class HospitalDirectory:
+    """
+    Read-only view of the hospital directory snapshot, keyed by CMS ID. The
+    file is memory-mapped, so loading only reads the ID column to build the
+    lookup table. Rows are materialized as dicts on request.
+
+    The snapshot is reloaded when the file changes on disk. Callers fall
+    back to supabase when there is no snapshot or a hospital is missing
+    from it.
+    """
+
+    def __init__(self, path: Path = HOSPITAL_SNAPSHOT_PATH, check_interval: float = 60):
+        self.path = Path(path)
+        self._check_interval = check_interval
+        self._lock = threading.Lock()
+        self._checked_at = 0.0
+        self._mtime: float | None = None
+        # (frame, CMS ID -> row position), replaced as a unit on reload.
+        self._snapshot: tuple[pl.DataFrame, dict[str, int]] | None = None
+
+    def __len__(self) -> int:
+        snapshot = self._current()
+        return len(snapshot[0]) if snapshot else 0
+
+    def load(self) -> bool:
+        """Load or reload the snapshot. Returns False if there isn't one."""
+        with self._lock:
+            self._checked_at = time.monotonic()
+            try:
+                mtime = self.path.stat().st_mtime
+            except FileNotFoundError:
+                logger.warning(f"No hospital snapshot at {self.path}, reading hospitals from supabase.")
+                return False
+            if mtime == self._mtime:
+                return True
+
+            start = time.perf_counter()
+            # Uncompressed IPC files are memory-mapped by default.
+            frame = pl.read_ipc(self.path)
+            positions = {hosp_id: i for i, hosp_id in enumerate(frame["hosp_id"].to_list())}
+            self._snapshot = (frame, positions)
+            self._mtime = mtime
+            logger.debug(
+                f"Loaded {len(frame)} hospital(s) from {self.path} "
+                f"in {(time.perf_counter() - start) * 1000:.1f}ms."
+            )
+            return True
+
+    @property
+    def version(self) -> float | None:
+        """Modification time of the loaded snapshot, which changes on each rebuild."""
+        self._current()
+        return self._mtime
+
+    def _current(self) -> tuple[pl.DataFrame, dict[str, int]] | None:
+        if time.monotonic() - self._checked_at > self._check_interval:
+            self.load()
+        return self._snapshot
+
+    def get(self, hosp_id: str) -> dict[str, Any] | None:
+        """Full directory row for a hospital, or None if it isn't in the snapshot."""
+        snapshot = self._current()
+        if snapshot is None:
+            return None
+        frame, positions = snapshot
+        position = positions.get(hosp_id)
+        if position is None:
+            return None
+        return frame.row(position, named=True)
+
+    def get_many(self, hosp_ids: Iterable[str], columns: list[str] | None = None) -> list[dict]:
+        """Rows for the hospitals found in the snapshot, in the order asked for."""
+        snapshot = self._current()
+        if snapshot is None:
+            return []
+        frame, positions = snapshot
+        found = [positions[hosp_id] for hosp_id in hosp_ids if hosp_id in positions]
+        rows = frame[found]
+        if columns:
+            rows = rows.select(columns)
+        return rows.to_dicts()
+
+    def rows(self, columns: list[str]) -> list[dict] | None:
+        """Every hospital with the given columns, or None without a snapshot."""
+        snapshot = self._current()
+        if snapshot is None:
+            return None
+        return snapshot[0].select(columns).to_dicts()
+
+
+def load_hospital_directory() -> None:
+    """Lifespan task that loads the snapshot before the first request."""
+    hospital_directory.load()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write the hospital directory snapshot.")
+    parser.add_argument("--path", type=Path, default=HOSPITAL_SNAPSHOT_PATH)
+    args = parser.parse_args()
+
+    rows = supabase_select_all("hospitals_v2", SNAPSHOT_COLUMNS, key="hosp_id", admin=True)
+    build_snapshot(rows, args.path)
+
+
+hospital_directory = HospitalDirectory()
+
+
+if __name__ == "__main__":
+    main()
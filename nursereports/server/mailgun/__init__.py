@@ -1,2 +1 @@
-
-from .email import mailgun_send_email
\ No newline at end of file
+from .outbox import MailOutbox, mail_outbox
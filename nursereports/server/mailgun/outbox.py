@@ -0,0 +1,181 @@
+from collections import OrderedDict
+from loguru import logger
+from typing import Any
+
+import asyncio
+import httpx
+import random
+import reflex as rx
+import threading
+import time
+import uuid
+
+_config = rx.config.get_config()
+
+
+def _mailgun_id(response: httpx.Response) -> str | None:
+    """Message id Mailgun assigns on acceptance, used to trace delivery in its logs."""
+    try:
+        return response.json().get("id")
+    except ValueError:
+        return None
+
+
+class MailOutbox:
+    """
+    Outbound mail queue. Messages are handed to enqueue() from any thread and
+    sent from a dedicated event loop with one pooled httpx.AsyncClient, at
+    most concurrency sends at a time. Rate limits, server errors and dropped
+    connections are retried with exponential backoff. Each message gets an id
+    whose delivery status can be read back with status().
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 4,
+        max_attempts: int = 5,
+        backoff: float = 2.0,
+        max_statuses: int = 1000,
+        url: str | None = None,
+        api_key: str | None = None,
+    ):
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_statuses = max_statuses
+        self.url = url
+        self.api_key = api_key
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue | None = None
+        self._start_lock = threading.Lock()
+        self._statuses: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._status_lock = threading.Lock()
+        self.sent = 0
+        self.failed = 0
+
+    def enqueue(
+        self, sender: str, recipient: str | list, subject: str, text: str, **fields: Any
+    ) -> str:
+        """
+        Queue a message and return its id. Extra fields are passed through to
+        Mailgun, ex. html or recipient-variables for batch sends.
+        """
+        message_id = uuid.uuid4().hex
+        message = {
+            "id": message_id,
+            "data": {"from": sender, "to": recipient, "subject": subject, "text": text, **fields},
+        }
+        self._set_status(message_id, status="queued", attempts=0, queued_at=time.time())
+        loop = self._ensure_started()
+        loop.call_soon_threadsafe(self._queue.put_nowait, message)
+        logger.debug(f"Queued email from {sender} to {self._describe(recipient)}.")
+        return message_id
+
+    def status(self, message_id: str) -> dict[str, Any] | None:
+        """Delivery status of a queued message: queued, sending, sent or failed."""
+        with self._status_lock:
+            status = self._statuses.get(message_id)
+            return dict(status) if status else None
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "pending": self._queue.qsize() if self._queue else 0,
+            "sent": self.sent,
+            "failed": self.failed,
+        }
+
+    def join(self, timeout: float | None = None) -> None:
+        """Block until every queued message has been sent or given up on."""
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._queue.join(), self._loop).result(timeout)
+
+    @staticmethod
+    def _describe(recipient: str | list) -> str:
+        return recipient if isinstance(recipient, str) else f"{len(recipient)} recipient(s)"
+
+    def _set_status(self, message_id: str, **values: Any) -> None:
+        with self._status_lock:
+            self._statuses.setdefault(message_id, {}).update(values)
+            self._statuses.move_to_end(message_id)
+            while len(self._statuses) > self.max_statuses:
+                self._statuses.popitem(last=False)
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        if self._loop is not None:
+            return self._loop
+        with self._start_lock:
+            if self._loop is None:
+                ready = threading.Event()
+                threading.Thread(
+                    target=self._run, args=(ready,), name="mail-outbox", daemon=True
+                ).start()
+                ready.wait()
+        return self._loop
+
+    def _run(self, ready: threading.Event) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._queue = asyncio.Queue()
+        self._loop = loop
+        ready.set()
+        loop.run_until_complete(self._serve())
+
+    async def _serve(self) -> None:
+        limits = httpx.Limits(
+            max_connections=self.concurrency, max_keepalive_connections=self.concurrency
+        )
+        async with httpx.AsyncClient(
+            auth=("api", self.api_key or _config.mailgun_api_key),
+            limits=limits,
+            timeout=30.0,
+        ) as client:
+            workers = [asyncio.create_task(self._work(client)) for _ in range(self.concurrency)]
+            await asyncio.gather(*workers)
+
+    async def _work(self, client: httpx.AsyncClient) -> None:
+        while True:
+            message = await self._queue.get()
+            try:
+                await self._deliver(client, message)
+            except Exception as e:
+                self.failed += 1
+                self._set_status(message["id"], status="failed", error=str(e))
+                logger.critical(f"Email {message['id']} failed - {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _deliver(self, client: httpx.AsyncClient, message: dict[str, Any]) -> None:
+        data = message["data"]
+        for attempt in range(1, self.max_attempts + 1):
+            self._set_status(message["id"], status="sending", attempts=attempt)
+            try:
+                response = await client.post(self.url or _config.mailgun_url, data=data)
+                retry = response.status_code == 429 or response.status_code >= 500
+                error = f"Mailgun returned {response.status_code}."
+            except httpx.TransportError as e:
+                response, retry, error = None, True, str(e)
+
+            if response is not None and response.is_success:
+                self.sent += 1
+                self._set_status(
+                    message["id"],
+                    status="sent",
+                    sent_at=time.time(),
+                    mailgun_id=_mailgun_id(response),
+                )
+                logger.debug(f"{data['from']} sent email to {self._describe(data['to'])} successfully.")
+                return
+
+            if not retry or attempt == self.max_attempts:
+                break
+            delay = self.backoff * 2 ** (attempt - 1) * (1 + random.random())
+            logger.warning(f"Email {message['id']} attempt {attempt} failed ({error}), retrying in {delay:.1f}s.")
+            await asyncio.sleep(delay)
+
+        self.failed += 1
+        self._set_status(message["id"], status="failed", error=error)
+        logger.critical(f"{data['from']} failed to send email to {self._describe(data['to'])} - {error}")
+
+
+mail_outbox = MailOutbox()
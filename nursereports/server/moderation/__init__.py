@@ -0,0 +1,4 @@
+from .batch import BatchModerator, pack_batches
+from .client import moderate_entries, moderation_text
+from .queue import PENDING_MODERATION, ModerationQueue, moderation_queue
+from .verdicts import ModerationVerdictCache, moderation_verdicts
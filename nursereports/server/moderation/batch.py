@@ -0,0 +1,155 @@
+from .client import (
+    MODERATION_PROMPT,
+    UNMODERATED_MALFORMED,
+    ModerationUnavailable,
+    chat_completion,
+    parse_verdict,
+    with_retries,
+)
+from .verdicts import ModerationVerdictCache, moderation_verdicts, verdict_key
+
+from concurrent.futures import ThreadPoolExecutor
+from loguru import logger
+from typing import Any, Iterator
+
+import httpx
+import json
+import textwrap
+
+BATCH_PROMPT = MODERATION_PROMPT + textwrap.dedent("""
+    You will receive a JSON array of entries, each with 'id', 'location' and
+    'comments'. Judge each entry on its own. Output a JSON object with key
+    'verdicts' holding one object per entry with keys 'id', 'flagged' and 'reason'.
+    """)
+
+# Upper bounds for one request. Characters stand in for tokens, the output
+# budget grows with the number of entries.
+MAX_BATCH_CHARS = 12000
+MAX_BATCH_ENTRIES = 25
+TOKENS_PER_VERDICT = 80
+
+
+def pack_batches(
+    jobs: list[dict[str, Any]],
+    max_chars: int = MAX_BATCH_CHARS,
+    max_entries: int = MAX_BATCH_ENTRIES,
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Greedily group jobs into batches under max_chars of entry text and
+    max_entries jobs. An oversized job gets a batch to itself.
+    """
+    batch: list[dict[str, Any]] = []
+    size = 0
+    for job in jobs:
+        job_size = len(job["job_location"]) + len(job["comments"])
+        if batch and (size + job_size > max_chars or len(batch) >= max_entries):
+            yield batch
+            batch, size = [], 0
+        batch.append(job)
+        size += job_size
+    if batch:
+        yield batch
+
+
+class BatchModerator:
+    """
+    Moderates many reports per chat completion. Jobs (shaped as for
+    ModerationQueue) are packed into bounded batches, sent with at most
+    concurrency requests in flight, and the per-entry verdicts mapped back to
+    report ids. Entries the model leaves out, or batches that fail after
+    retries, come back as unmoderated (flagged 2).
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 4,
+        max_chars: int = MAX_BATCH_CHARS,
+        max_entries: int = MAX_BATCH_ENTRIES,
+        max_attempts: int = 4,
+        backoff: float = 1.0,
+        api_url: str | None = None,
+        api_key: str | None = None,
+        model: str | None = None,
+        verdicts: ModerationVerdictCache | None = moderation_verdicts,
+    ):
+        self.concurrency = concurrency
+        self.max_chars = max_chars
+        self.max_entries = max_entries
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.api_url = api_url
+        self.api_key = api_key
+        self.model = model
+        self.verdicts = verdicts
+        self._client = httpx.Client(
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        )
+
+    def moderate(self, jobs: list[dict[str, Any]]) -> dict[str, dict]:
+        """
+        Verdicts for every job keyed by report_id. Cached entries are answered
+        locally and identical entries are only sent once.
+        """
+        verdicts: dict[str, dict] = {}
+        pending: dict[str, list[dict[str, Any]]] = {}
+        for job in jobs:
+            cached = self.verdicts.get(job["job_location"], job["comments"]) if self.verdicts else None
+            if cached is not None:
+                verdicts[job["report_id"]] = cached
+            else:
+                pending.setdefault(verdict_key(job["job_location"], job["comments"]), []).append(job)
+
+        unique = [duplicates[0] for duplicates in pending.values()]
+        batches = list(pack_batches(unique, self.max_chars, self.max_entries))
+        logger.debug(
+            f"Moderating {len(jobs)} report(s): {len(verdicts)} cached, "
+            f"{len(unique)} unique in {len(batches)} batch(es)."
+        )
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            for result in pool.map(self.moderate_batch, batches):
+                verdicts.update(result)
+
+        for duplicates in pending.values():
+            first = duplicates[0]
+            if self.verdicts:
+                self.verdicts.set(first["job_location"], first["comments"], verdicts[first["report_id"]])
+            for job in duplicates[1:]:
+                verdicts[job["report_id"]] = dict(verdicts[first["report_id"]])
+        return verdicts
+
+    def moderate_batch(self, batch: list[dict[str, Any]]) -> dict[str, dict]:
+        # Short positional ids keep report UUIDs out of the prompt.
+        entries = [
+            {"id": position, "location": job["job_location"] or "EMPTY", "comments": job["comments"] or "EMPTY"}
+            for position, job in enumerate(batch)
+        ]
+        try:
+            content = with_retries(
+                lambda: chat_completion(
+                    [
+                        {"role": "system", "content": BATCH_PROMPT},
+                        {"role": "user", "content": json.dumps(entries)},
+                    ],
+                    client=self._client,
+                    api_url=self.api_url,
+                    api_key=self.api_key,
+                    model=self.model,
+                    max_tokens=TOKENS_PER_VERDICT * len(batch) + 256,
+                ),
+                max_attempts=self.max_attempts,
+                backoff=self.backoff,
+            )
+        except (ModerationUnavailable, httpx.HTTPStatusError) as e:
+            logger.warning(f"Batch of {len(batch)} report(s) left unmoderated - {e}")
+            content = None
+
+        by_position: dict[int, dict] = {}
+        if isinstance(content, dict) and isinstance(content.get("verdicts"), list):
+            for verdict in content["verdicts"]:
+                if isinstance(verdict, dict) and isinstance(verdict.get("id"), int):
+                    by_position[verdict["id"]] = parse_verdict(verdict)
+
+        return {
+            job["report_id"]: by_position.get(position, dict(UNMODERATED_MALFORMED))
+            for position, job in enumerate(batch)
+        }
@@ -0,0 +1,133 @@
+from loguru import logger
+from typing import Callable, TypeVar
+
+import httpx
+import json
+import random
+import reflex as rx
+import textwrap
+import time
+
+_config = rx.config.get_config()
+
+MODERATION_PROMPT = textwrap.dedent("""
+    Moderate entries for nurse review site. Output responses as JSON.
+    Nurses are allowed to submit info about pay, staffing, or work environment.
+    Under key 'flagged', output 1 for bad submissions containing violence, protected
+    health info, off-topic entries, spam, advertisements, racism, sexism, or doxxing.
+    If valid output a 0. Profanity and strong emotions OK given it's on topic.
+    Under key 'reason', if entry flagged give brief rationale otherwise output ''.
+    """)
+
+T = TypeVar("T")
+
+UNMODERATED_MALFORMED = {
+    "flagged": 2,
+    "reason": "Unmoderated due to incorrectly structured moderation output.",
+}
+
+
+class ModerationUnavailable(Exception):
+    """Moderation endpoint failed in a way worth retrying."""
+
+
+def with_retries(call: Callable[[], T], max_attempts: int = 4, backoff: float = 1.0) -> T:
+    """Run call, retrying ModerationUnavailable with exponential backoff and jitter."""
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return call()
+        except ModerationUnavailable as e:
+            if attempt == max_attempts:
+                raise
+            delay = backoff * 2 ** (attempt - 1) * (1 + random.random())
+            logger.warning(f"Moderation attempt {attempt} failed ({e}), retrying in {delay:.1f}s.")
+            time.sleep(delay)
+    raise ModerationUnavailable("No moderation attempts were made.")
+
+
+def chat_completion(
+    messages: list[dict],
+    client: httpx.Client,
+    api_url: str | None = None,
+    api_key: str | None = None,
+    model: str | None = None,
+    max_tokens: int = 1024,
+) -> dict | list | None:
+    """
+    Post a JSON-mode chat completion and return the parsed message content,
+    or None if the model didn't return valid JSON. Raises
+    ModerationUnavailable for transport errors, rate limits and server errors.
+    """
+    try:
+        response = client.post(
+            url=api_url or _config.openrouter_api_url,
+            headers={
+                "Authorization": f"Bearer {api_key or _config.openrouter_key}",
+                "X-OpenRouter-Title": "NurseReports",
+            },
+            json={
+                "model": model or _config.openrouter_moderator_model,
+                "messages": messages,
+                "temperature": 0.7,
+                "max_tokens": max_tokens,
+                "response_format": {"type": "json_object"},
+            },
+            timeout=30.0 + max_tokens / 100,
+        )
+    except httpx.HTTPError as e:
+        raise ModerationUnavailable(str(e)) from e
+
+    if response.status_code == 429 or response.status_code >= 500:
+        raise ModerationUnavailable(f"Moderation endpoint returned {response.status_code}.")
+    response.raise_for_status()
+
+    try:
+        return json.loads(response.json()["choices"][0]["message"]["content"])
+    except (KeyError, IndexError, TypeError, ValueError):
+        logger.warning("Moderation output was not valid JSON.")
+        return None
+
+
+def parse_verdict(content) -> dict:
+    """Verdict from model output, or an unmoderated verdict if it's malformed."""
+    if isinstance(content, dict) and "flagged" in content and "reason" in content:
+        return {"flagged": content["flagged"], "reason": content["reason"]}
+    return dict(UNMODERATED_MALFORMED)
+
+
+def moderation_text(
+    unit: str, area: str, role: str, comp_comments: str, assign_comments: str, staff_comments: str
+) -> tuple[str, str]:
+    """Job location and comments as sent for moderation. Both empty means nothing to moderate."""
+    job_location = " ".join(filter(None, [unit, area, role])).strip()
+    comments = " ".join(filter(None, [comp_comments, assign_comments, staff_comments])).strip()
+    return job_location, comments
+
+
+def moderate_entries(
+    job_location: str,
+    comments: str,
+    client: httpx.Client,
+    api_url: str | None = None,
+    api_key: str | None = None,
+    model: str | None = None,
+) -> dict:
+    """
+    Send user entered fields to the moderation model and return its verdict,
+    {"flagged": 0 | 1 | 2, "reason": str}. Raises ModerationUnavailable for
+    transport errors, rate limits and server errors.
+    """
+    content = chat_completion(
+        [
+            {"role": "system", "content": MODERATION_PROMPT},
+            {
+                "role": "user",
+                "content": f"User location or role: {job_location or 'EMPTY'}. User comments: {comments or 'EMPTY'}",
+            },
+        ],
+        client=client,
+        api_url=api_url,
+        api_key=api_key,
+        model=model,
+    )
+    return parse_verdict(content)
@@ -0,0 +1,194 @@
+from ..cache import hospital_row_cache
+from ..notifications import record_event
+from ..supabase import supabase_select, supabase_update
+from .client import ModerationUnavailable, moderate_entries, with_retries
+from .verdicts import ModerationVerdictCache, moderation_verdicts
+
+from loguru import logger
+from typing import Any
+
+import httpx
+import json
+import queue
+import threading
+
+# Written to a report on submit; replaced once moderation completes.
+PENDING_MODERATION = {"flagged": 2, "reason": "Awaiting moderation."}
+
+# Compare-and-set attempts for one department update before giving up.
+DEPARTMENT_UPDATE_ATTEMPTS = 5
+
+
+class ModerationQueue:
+    """
+    Moderates submitted reports off the request path. Reports are enqueued as
+    jobs and a pool of worker threads sends them to the moderation model,
+    retrying with exponential backoff. Each worker writes the verdict back to
+    the report and then adds any entered unit/area/role to the hospital.
+
+    A job is a dict with report_id, hospital_id, user_id, job_location,
+    comments, and the entered unit, area and role. Reports are submitted as
+    PENDING_MODERATION, so a job lost to a restart stays visible to the
+    backlog sweep as unmoderated.
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_attempts: int = 4,
+        backoff: float = 1.0,
+        api_url: str | None = None,
+        api_key: str | None = None,
+        model: str | None = None,
+        verdicts: ModerationVerdictCache | None = moderation_verdicts,
+    ):
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.api_url = api_url
+        self.api_key = api_key
+        self.model = model
+        self.verdicts = verdicts
+        self._jobs: queue.Queue[dict[str, Any]] = queue.Queue()
+        self._threads: list[threading.Thread] = []
+        self._start_lock = threading.Lock()
+        self._client = httpx.Client()
+        self.completed = 0
+        self.failed = 0
+
+    def enqueue(self, job: dict[str, Any]) -> None:
+        self._ensure_started()
+        self._jobs.put(job)
+        logger.debug(f"Queued report {job['report_id']} for moderation ({self._jobs.qsize()} waiting).")
+
+    def join(self) -> None:
+        """Block until every queued job has been processed."""
+        self._jobs.join()
+
+    def _ensure_started(self) -> None:
+        if self._threads:
+            return
+        with self._start_lock:
+            if self._threads:
+                return
+            for number in range(self.workers):
+                thread = threading.Thread(
+                    target=self._work, name=f"moderation-{number}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _work(self) -> None:
+        while True:
+            job = self._jobs.get()
+            try:
+                self.process(job)
+                self.completed += 1
+            except Exception as e:
+                self.failed += 1
+                logger.critical(f"Moderation for report {job.get('report_id')} failed - {e}")
+            finally:
+                self._jobs.task_done()
+
+    def moderate(self, job: dict[str, Any]) -> dict:
+        """
+        Verdict for a job, from the verdict cache when these entries have been
+        seen before, otherwise retrying transient failures with backoff.
+        """
+        def request() -> dict:
+            return with_retries(
+                lambda: moderate_entries(
+                    job["job_location"],
+                    job["comments"],
+                    client=self._client,
+                    api_url=self.api_url,
+                    api_key=self.api_key,
+                    model=self.model,
+                ),
+                max_attempts=self.max_attempts,
+                backoff=self.backoff,
+            )
+
+        if self.verdicts is None:
+            return request()
+        return self.verdicts.get_or_moderate(job["job_location"], job["comments"], request)
+
+    def process(self, job: dict[str, Any]) -> dict:
+        """
+        Moderate a job and write the verdict. If the endpoint can't be reached
+        the report is left as PENDING_MODERATION for a later sweep, which
+        like any unmoderated entry still updates departments.
+        """
+        try:
+            verdict = self.moderate(job)
+        except (ModerationUnavailable, httpx.HTTPStatusError) as e:
+            logger.warning(f"Report {job['report_id']} left unmoderated - {e}")
+            verdict = dict(PENDING_MODERATION)
+        else:
+            supabase_update(
+                "reports", {"report_id": f"eq.{job['report_id']}"}, {"moderation": verdict}
+            )
+            logger.debug(f"Report {job['report_id']} by {job['user_id']} moderated: {verdict}")
+
+        if verdict.get("flagged", 0) in {0, 2}:
+            apply_department_updates(job)
+        else:
+            record_event(
+                "report_flagged",
+                user_id=job["user_id"],
+                report_id=job["report_id"],
+                reason=verdict.get("reason", ""),
+            )
+        return verdict
+
+
+def apply_department_updates(job: dict[str, Any]) -> None:
+    """
+    Add entered unit/area/role names to the hospital's department lists.
+    The write only applies while departments still hold what was read, so
+    jobs for the same hospital in other workers or processes can't drop
+    each other's names. A lost race rereads and merges again.
+    """
+    entered = {
+        "units": (job.get("unit") or "").upper(),
+        "areas": (job.get("area") or "").upper(),
+        "roles": (job.get("role") or "").upper(),
+    }
+    if not any(entered.values()):
+        return
+
+    hospital = {"hosp_id": f"eq.{job['hospital_id']}"}
+    for _ in range(DEPARTMENT_UPDATE_ATTEMPTS):
+        # Not shared with a concurrent read, which could predate another job's write.
+        result = supabase_select(
+            "hospitals_v2", "departments", filters=hospital, admin=True, shared=False
+        )
+        if not result:
+            logger.warning(f"Hospital {job['hospital_id']} not found for department updates.")
+            return
+        current = result[0].get("departments")
+        departments = current or {}
+        if all(not value or value in (departments.get(key) or []) for key, value in entered.items()):
+            return
+
+        updated = {
+            key: sorted(set(departments.get(key) or []) | set(filter(None, [value])))
+            for key, value in entered.items()
+        }
+        unchanged = (
+            {"departments": "is.null"}
+            if current is None
+            else {"departments": f"eq.{json.dumps(current)}"}
+        )
+        if supabase_update(
+            "hospitals_v2", {**hospital, **unchanged}, {"departments": updated}, returning="hosp_id"
+        ):
+            hospital_row_cache.invalidate(job["hospital_id"])
+            return
+    raise RuntimeError(
+        f"Departments for hospital {job['hospital_id']} kept changing, "
+        f"gave up after {DEPARTMENT_UPDATE_ATTEMPTS} attempts."
+    )
+
+
+moderation_queue = ModerationQueue()
@@ -0,0 +1,92 @@
+"""
+Local stand-in for the OpenRouter chat completions endpoint, for exercising
+the moderation queue without spending tokens. Flags any entry containing a
+word from FLAGGED_WORDS, answers batched requests entry by entry, and can fail the first N requests to test retries.
+
+    python -m nursereports.server.moderation.stub --port 8765 --fail-first 2
+
+Then point the app at it with OPENROUTER_API_URL=http://127.0.0.1:8765.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import argparse
+import json
+import threading
+
+FLAGGED_WORDS = ("spam", "advertisement", "violence")
+
+
+def stub_verdict(content: str) -> dict:
+    lowered = content.lower()
+    for word in FLAGGED_WORDS:
+        if word in lowered:
+            return {"flagged": 1, "reason": f"Entry contains {word}."}
+    return {"flagged": 0, "reason": ""}
+
+
+class StubModerationServer(ThreadingHTTPServer):
+    def __init__(self, address: tuple[str, int], fail_first: int = 0):
+        super().__init__(address, StubModerationHandler)
+        self.fail_remaining = fail_first
+        self.requests = 0
+        self.lock = threading.Lock()
+
+
+class StubModerationHandler(BaseHTTPRequestHandler):
+    server: StubModerationServer
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        with self.server.lock:
+            self.server.requests += 1
+            failing = self.server.fail_remaining > 0
+            if failing:
+                self.server.fail_remaining -= 1
+
+        if failing:
+            self._respond(503, {"error": "stub failure"})
+            return
+
+        content = body["messages"][-1]["content"]
+        try:
+            entries = json.loads(content)
+        except ValueError:
+            entries = None
+        if isinstance(entries, list):
+            # Batched request, one verdict per entry.
+            verdict = {
+                "verdicts": [
+                    {"id": entry["id"], **stub_verdict(f"{entry['location']} {entry['comments']}")}
+                    for entry in entries
+                ]
+            }
+        else:
+            verdict = stub_verdict(content)
+        self._respond(200, {"choices": [{"message": {"content": json.dumps(verdict)}}]})
+
+    def _respond(self, status: int, payload: dict) -> None:
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve stub moderation verdicts.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fail-first", type=int, default=0)
+    args = parser.parse_args()
+    server = StubModerationServer((args.host, args.port), fail_first=args.fail_first)
+    print(f"Stub moderation endpoint on http://{args.host}:{args.port}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Re-moderate every report still marked unmoderated (flagged 2), in batches.
+
+    python -m nursereports.server.moderation.sweep [--dry-run] [--concurrency 4]
+"""
+
+from ..analytics.projections import projection_select
+from ..supabase import supabase_select_all, supabase_update
+from .batch import MAX_BATCH_CHARS, MAX_BATCH_ENTRIES, BatchModerator
+from .client import moderation_text
+
+from loguru import logger
+from typing import Any
+
+import argparse
+
+
+def job_from_row(row: dict[str, Any]) -> dict[str, Any]:
+    """Moderation job from a report row fetched with the moderation projection."""
+    job_location, comments = moderation_text(
+        row.get("entered_unit"),
+        row.get("entered_area"),
+        row.get("entered_role"),
+        row.get("comp_comments"),
+        row.get("assign_comments"),
+        row.get("staff_comments"),
+    )
+    return {
+        "report_id": row["report_id"],
+        "hospital_id": row.get("hospital_id"),
+        "user_id": row.get("user_id"),
+        "job_location": job_location,
+        "comments": comments,
+        "unit": row.get("entered_unit") or "",
+        "area": row.get("entered_area") or "",
+        "role": row.get("entered_role") or "",
+    }
+
+
+def fetch_unmoderated() -> list[dict[str, Any]]:
+    return supabase_select_all(
+        "reports",
+        projection_select("moderation"),
+        key="report_id",
+        filters={"moderation->>flagged": "eq.2"},
+        admin=True,
+    )
+
+
+def sweep(moderator: BatchModerator, dry_run: bool = False) -> dict[int, int]:
+    """
+    Moderate all unmoderated reports and write back verdicts that resolved.
+    Returns a count of reports per resulting flag. Departments aren't touched,
+    unmoderated entries were already added to them on submit.
+    """
+    jobs = [job_from_row(row) for row in fetch_unmoderated()]
+    empty = [job for job in jobs if not (job["job_location"] or job["comments"])]
+    jobs = [job for job in jobs if job["job_location"] or job["comments"]]
+    verdicts = moderator.moderate(jobs)
+    verdicts.update({job["report_id"]: {"flagged": 0, "reason": ""} for job in empty})
+
+    tally: dict[int, int] = {}
+    for report_id, verdict in verdicts.items():
+        tally[verdict["flagged"]] = tally.get(verdict["flagged"], 0) + 1
+        if dry_run or verdict["flagged"] == 2:
+            continue
+        try:
+            supabase_update("reports", {"report_id": f"eq.{report_id}"}, {"moderation": verdict})
+        except Exception as e:
+            logger.warning(f"Failed to write verdict for report {report_id} - {e}")
+    return tally
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Re-moderate unmoderated reports.")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--max-chars", type=int, default=MAX_BATCH_CHARS)
+    parser.add_argument("--max-entries", type=int, default=MAX_BATCH_ENTRIES)
+    parser.add_argument("--dry-run", action="store_true", help="Moderate without writing verdicts.")
+    args = parser.parse_args()
+
+    moderator = BatchModerator(
+        concurrency=args.concurrency, max_chars=args.max_chars, max_entries=args.max_entries
+    )
+    tally = sweep(moderator, dry_run=args.dry_run)
+    logger.info(
+        f"Swept {sum(tally.values())} report(s): {tally.get(0, 0)} cleared, "
+        f"{tally.get(1, 0)} flagged, {tally.get(2, 0)} still unmoderated."
+    )
+
+
+if __name__ == "__main__":
+    main()
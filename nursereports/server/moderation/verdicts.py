@@ -0,0 +1,143 @@
+from loguru import logger
+from pathlib import Path
+from typing import Callable
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+MODERATION_CACHE_PATH = Path(
+    os.getenv("MODERATION_CACHE_PATH", "data/moderation_verdicts.sqlite3")
+)
+
+
+def verdict_key(job_location: str, comments: str) -> str:
+    """Content hash of entries after casefolding and collapsing whitespace."""
+    normalized = "\x1f".join(
+        " ".join((text or "").casefold().split()) for text in (job_location, comments)
+    )
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+class ModerationVerdictCache:
+    """
+    Moderation verdicts keyed by a hash of the normalized entries, kept in a
+    SQLite file so they survive restarts and are shared by every worker
+    process on the host. Only resolved verdicts (flagged 0 or 1) are stored.
+    Once max_entries is exceeded the least recently used tenth is evicted.
+
+    get_or_moderate() also holds a per-key lock while moderating, so
+    identical entries submitted at the same time make one request.
+    """
+
+    def __init__(self, path: Path = MODERATION_CACHE_PATH, max_entries: int = 100_000):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._entries = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS verdicts ("
+                "key TEXT PRIMARY KEY, flagged INTEGER NOT NULL, "
+                "reason TEXT NOT NULL, used_at REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS verdicts_used_at ON verdicts (used_at)")
+            connection.commit()
+            self._entries = connection.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+            self._connection = connection
+            logger.debug(f"Opened moderation cache at {self.path} with {self._entries} verdict(s).")
+        return self._connection
+
+    def get(self, job_location: str, comments: str) -> dict | None:
+        key = verdict_key(job_location, comments)
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT flagged, reason FROM verdicts WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            connection.execute(
+                "UPDATE verdicts SET used_at = ? WHERE key = ?", (time.time(), key)
+            )
+            connection.commit()
+            self.hits += 1
+        return {"flagged": row[0], "reason": row[1]}
+
+    def set(self, job_location: str, comments: str, verdict: dict) -> None:
+        if verdict.get("flagged") not in {0, 1}:
+            return
+        key = verdict_key(job_location, comments)
+        with self._lock:
+            connection = self._connect()
+            existing = connection.execute(
+                "SELECT 1 FROM verdicts WHERE key = ?", (key,)
+            ).fetchone()
+            connection.execute(
+                "INSERT OR REPLACE INTO verdicts (key, flagged, reason, used_at) VALUES (?, ?, ?, ?)",
+                (key, int(verdict["flagged"]), str(verdict.get("reason") or ""), time.time()),
+            )
+            # Replacing a verdict doesn't add an entry.
+            if existing is None:
+                self._entries += 1
+            if self._entries > self.max_entries:
+                self._evict(connection)
+            connection.commit()
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        self._entries = connection.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+        excess = self._entries - int(self.max_entries * 0.9)
+        if excess <= 0:
+            return
+        connection.execute(
+            "DELETE FROM verdicts WHERE key IN "
+            "(SELECT key FROM verdicts ORDER BY used_at LIMIT ?)",
+            (excess,),
+        )
+        self._entries -= excess
+        self.evictions += excess
+
+    def get_or_moderate(
+        self, job_location: str, comments: str, moderate: Callable[[], dict]
+    ) -> dict:
+        """Cached verdict for the entries, or moderate() once and store the result."""
+        key = verdict_key(job_location, comments)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                verdict = self.get(job_location, comments)
+                if verdict is None:
+                    verdict = moderate()
+                    self.set(job_location, comments, verdict)
+                return verdict
+        finally:
+            with self._lock:
+                if not key_lock.locked():
+                    self._key_locks.pop(key, None)
+
+    def stats(self) -> dict[str, int | float]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": self._entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+
+moderation_verdicts = ModerationVerdictCache()
@@ -0,0 +1 @@
+from .spool import NotificationSpool, notification_spool, record_event
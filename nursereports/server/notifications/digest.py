@@ -0,0 +1,305 @@
+"""
+Periodic notification digests. Events recorded to the spool are grouped per
+user, filtered by their opt-in preferences, rendered, and sent in Mailgun
+batch calls of up to 1000 recipients with per-recipient variables.
+
+    python -m nursereports.server.notifications.digest [--dry-run] [--every 86400] [--announce TEXT]
+"""
+
+from ..mailgun import MailOutbox, mail_outbox
+from ..supabase import supabase_select, supabase_select_all
+from .spool import NotificationSpool, notification_spool, record_event
+
+from loguru import logger
+from typing import Any
+
+import argparse
+import json
+import textwrap
+import time
+
+# Preference a user must have enabled to receive each kind of event.
+EVENT_PREFERENCES = {
+    "hospital_report": "status_opt_in",
+    "report_flagged": "status_opt_in",
+    "review_liked": "social_opt_in",
+    "announcement": "update_opt_in",
+}
+
+DIGEST_SENDER = "NurseReports <notifications@nursereports.org>"
+DIGEST_USER_COLUMNS = (
+    "id,email:preferences->>email,"
+    "status_opt_in:preferences->status_opt_in,"
+    "update_opt_in:preferences->update_opt_in,"
+    "social_opt_in:preferences->social_opt_in,"
+    "saved_hospitals:saved->hospitals"
+)
+OPTED_IN_FILTER = (
+    "(preferences->>status_opt_in.eq.true,"
+    "preferences->>update_opt_in.eq.true,"
+    "preferences->>social_opt_in.eq.true)"
+)
+
+# Mailgun accepts at most 1000 recipients per batch send.
+MAILGUN_BATCH_LIMIT = 1000
+
+
+def fetch_digest_users() -> list[dict[str, Any]]:
+    """Users with at least one notification preference enabled."""
+    return supabase_select_all(
+        "users", DIGEST_USER_COLUMNS, key="id", filters={"or": OPTED_IN_FILTER}, admin=True
+    )
+
+
+def fetch_report_owners(report_ids: list[str]) -> dict[str, str]:
+    owners: dict[str, str] = {}
+    for start in range(0, len(report_ids), 200):
+        chunk = report_ids[start : start + 200]
+        rows = supabase_select(
+            "reports",
+            "report_id,user_id",
+            filters={"report_id": f"in.({','.join(chunk)})"},
+            admin=True,
+        )
+        owners.update({row["report_id"]: row["user_id"] for row in rows})
+    return owners
+
+
+def collect_digests(
+    events: list[dict[str, Any]],
+    users: list[dict[str, Any]],
+    report_owners: dict[str, str],
+) -> dict[str, dict[str, Any]]:
+    """
+    Group events into per-user digests, {user_id: {"email", "reports",
+    "flagged", "likes", "announcements", "events"}}, keeping only users who
+    opted in to each kind of event and have an email on file. "events" holds
+    the positions of the events that went into the digest. An event with
+    "recipients" only reaches those user ids.
+    """
+    eligible = [user for user in users if user.get("email")]
+    by_id = {user["id"]: user for user in eligible}
+    savers: dict[str, list[dict]] = {}
+    for user in eligible:
+        for hosp_id in user.get("saved_hospitals") or []:
+            savers.setdefault(hosp_id, []).append(user)
+
+    digests: dict[str, dict[str, Any]] = {}
+    # Net likers per report, so liking, unliking and liking again counts once,
+    # with the positions of the events behind them.
+    likers: dict[str, tuple[set[str], list[int]]] = {}
+
+    def digest_for(
+        user: dict[str, Any], event: dict[str, Any], positions: list[int]
+    ) -> dict[str, Any] | None:
+        recipients = event.get("recipients")
+        if not user.get(EVENT_PREFERENCES[event["kind"]]):
+            return None
+        if recipients is not None and user["id"] not in recipients:
+            return None
+        digest = digests.setdefault(
+            user["id"],
+            {
+                "email": user["email"],
+                "reports": {},
+                "flagged": [],
+                "likes": {},
+                "announcements": [],
+                "events": set(),
+            },
+        )
+        digest["events"].update(positions)
+        return digest
+
+    for position, event in enumerate(events):
+        kind = event.get("kind")
+        if kind == "hospital_report":
+            for user in savers.get(event["hosp_id"], []):
+                digest = user["id"] != event.get("user_id") and digest_for(user, event, [position])
+                if digest:
+                    hospital = digest["reports"].setdefault(
+                        event["hosp_id"], {"name": event.get("hosp_name") or event["hosp_id"], "count": 0}
+                    )
+                    hospital["count"] += 1
+        elif kind == "report_flagged":
+            user = by_id.get(event.get("user_id"))
+            digest = user and digest_for(user, event, [position])
+            if digest:
+                digest["flagged"].append(event.get("reason") or "No reason given.")
+        elif kind in {"review_liked", "review_unliked"}:
+            owner = report_owners.get(event["report_id"])
+            if event.get("recipients") is not None and owner not in event["recipients"]:
+                continue
+            users, positions = likers.setdefault(event["report_id"], (set(), []))
+            positions.append(position)
+            if kind == "review_liked":
+                users.add(event.get("user_id"))
+            else:
+                users.discard(event.get("user_id"))
+        elif kind == "announcement":
+            for user in eligible:
+                digest = digest_for(user, event, [position])
+                if digest:
+                    digest["announcements"].append(event["text"])
+
+    for report_id, (users, positions) in likers.items():
+        owner = report_owners.get(report_id)
+        user = by_id.get(owner)
+        count = len(users - {owner})
+        digest = user and count and digest_for(user, {"kind": "review_liked"}, positions)
+        if digest:
+            digest["likes"][report_id] = count
+    return digests
+
+
+def render_digest(digest: dict[str, Any]) -> tuple[str, int]:
+    """Plain text body for one digest and the number of updates in it."""
+    sections = []
+    count = 0
+    if digest["reports"]:
+        lines = [
+            f"  - {hospital['name']}: {hospital['count']} new report(s)"
+            for hospital in digest["reports"].values()
+        ]
+        sections.append("New reports at your saved hospitals:\n" + "\n".join(lines))
+        count += sum(hospital["count"] for hospital in digest["reports"].values())
+    if digest["likes"]:
+        likes = sum(digest["likes"].values())
+        sections.append(f"Your reviews received {likes} new like(s).")
+        count += likes
+    if digest["flagged"]:
+        lines = [f"  - {reason}" for reason in digest["flagged"]]
+        sections.append("Report(s) flagged by moderation:\n" + "\n".join(lines))
+        count += len(digest["flagged"])
+    if digest["announcements"]:
+        sections.append("\n\n".join(digest["announcements"]))
+        count += len(digest["announcements"])
+
+    body = "\n\n".join(sections)
+    footer = textwrap.dedent("""
+
+        You can change which notifications you receive from your account page.
+        """)
+    return body + footer, count
+
+
+def send_digests(
+    digests: dict[str, dict[str, Any]], outbox: MailOutbox = mail_outbox
+) -> dict[str, list[str]]:
+    """
+    Render every digest and queue them as Mailgun batch sends. Each call
+    covers up to MAILGUN_BATCH_LIMIT users, with their rendered digest passed
+    as a recipient variable. Returns {outbox message id: recipient emails}.
+    """
+    variables: dict[str, dict[str, Any]] = {}
+    for digest in digests.values():
+        body, count = render_digest(digest)
+        if count:
+            variables[digest["email"]] = {"digest": body, "count": count}
+
+    recipients = list(variables)
+    batches = {}
+    for start in range(0, len(recipients), MAILGUN_BATCH_LIMIT):
+        batch = recipients[start : start + MAILGUN_BATCH_LIMIT]
+        message_id = outbox.enqueue(
+            DIGEST_SENDER,
+            batch,
+            "Your NurseReports digest: %recipient.count% update(s)",
+            "%recipient.digest%",
+            **{"recipient-variables": json.dumps({email: variables[email] for email in batch})},
+        )
+        batches[message_id] = batch
+    logger.info(f"Queued digests for {len(recipients)} user(s) in {len(batches)} batch(es).")
+    return batches
+
+
+def build_digests(events: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Per-user digests for events, with the users and report owners they need."""
+    if not events:
+        logger.debug("No notification events to digest.")
+        return {}
+    liked = sorted({event["report_id"] for event in events if event.get("kind") == "review_liked"})
+    return collect_digests(events, fetch_digest_users(), fetch_report_owners(liked))
+
+
+def respool_unsent(
+    spool: NotificationSpool,
+    events: list[dict[str, Any]],
+    digests: dict[str, dict[str, Any]],
+    emails: set[str],
+) -> int:
+    """
+    Record the events behind the digests sent to emails again, limited to
+    those users, so the next run retries them without emailing anyone who
+    already got theirs. Returns the number of events recorded.
+    """
+    recipients: dict[int, set[str]] = {}
+    for user_id, digest in digests.items():
+        if digest["email"] in emails:
+            for position in digest["events"]:
+                recipients.setdefault(position, set()).add(user_id)
+    for position, user_ids in sorted(recipients.items()):
+        details = {key: value for key, value in events[position].items() if key not in {"kind", "at"}}
+        spool.record(events[position]["kind"], **{**details, "recipients": sorted(user_ids)})
+    return len(recipients)
+
+
+def run_digest(
+    spool: NotificationSpool = notification_spool,
+    outbox: MailOutbox = mail_outbox,
+    dry_run: bool = False,
+) -> dict[str, dict[str, Any]]:
+    """
+    Drain the spool and send a digest to everyone with pending events. A dry
+    run logs the digests and leaves events in the spool. Events for the
+    recipients of a batch that isn't sent are spooled again for the next
+    run. If the run fails before sending, the drained events are kept.
+    """
+    if dry_run:
+        digests = build_digests(spool.read())
+        for digest in digests.values():
+            logger.info(f"Digest for {digest['email']}:\n{render_digest(digest)[0]}")
+        return digests
+
+    with spool.drain() as events:
+        digests = build_digests(events)
+        batches = send_digests(digests, outbox) if digests else {}
+        outbox.join()
+        unsent = {
+            email
+            for message_id, batch in batches.items()
+            if (outbox.status(message_id) or {}).get("status") != "sent"
+            for email in batch
+        }
+        if unsent:
+            respooled = respool_unsent(spool, events, digests, unsent)
+            logger.critical(
+                f"Digests for {len(unsent)} user(s) weren't sent, "
+                f"spooled {respooled} event(s) again for the next run."
+            )
+    return digests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Send notification digests.")
+    parser.add_argument("--dry-run", action="store_true", help="Log digests instead of sending.")
+    parser.add_argument("--every", type=float, help="Keep running, sending digests every N seconds.")
+    parser.add_argument("--announce", help="Announcement for users opted in to updates.")
+    args = parser.parse_args()
+
+    if args.announce:
+        record_event("announcement", text=args.announce)
+    while True:
+        try:
+            run_digest(dry_run=args.dry_run)
+        except Exception as e:
+            if not args.every:
+                raise
+            logger.critical(f"Digest run failed - {e}")
+        if not args.every:
+            break
+        time.sleep(args.every)
+
+
+if __name__ == "__main__":
+    main()
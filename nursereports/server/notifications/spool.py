@@ -0,0 +1,86 @@
+from contextlib import contextmanager
+from loguru import logger
+from pathlib import Path
+from typing import Any, Iterator
+
+import json
+import os
+import threading
+import time
+
+NOTIFICATION_SPOOL_PATH = Path(
+    os.getenv("NOTIFICATION_SPOOL_PATH", "data/notification_events.jsonl")
+)
+
+
+class NotificationSpool:
+    """
+    Append-only JSON lines file of notification events. App processes append
+    as things happen and the digest job drains the file on each run, so
+    events survive restarts and are shared across worker processes.
+    """
+
+    def __init__(self, path: Path = NOTIFICATION_SPOOL_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def record(self, kind: str, **details: Any) -> None:
+        line = json.dumps({"kind": kind, "at": time.time(), **details}) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as spool:
+                spool.write(line)
+
+    def read(self) -> list[dict[str, Any]]:
+        """Events recorded so far, including unsent drains, left in place."""
+        paths = self._drained()
+        if self.path.exists():
+            paths.append(self.path)
+        return [event for path in paths for event in self._read(path)]
+
+    @contextmanager
+    def drain(self) -> Iterator[list[dict[str, Any]]]:
+        """
+        Take every event recorded so far. The spool is renamed before reading
+        so events recorded meanwhile land in a fresh file. Drained files are
+        only removed once the block exits cleanly, so events a failed run
+        didn't send are picked up again by the next drain.
+        """
+        with self._lock:
+            if self.path.exists():
+                os.replace(
+                    self.path, self.path.with_name(f"{self.path.name}.{time.time_ns()}.draining")
+                )
+        paths = self._drained()
+        yield [event for path in paths for event in self._read(path)]
+        for path in paths:
+            path.unlink(missing_ok=True)
+
+    def _drained(self) -> list[Path]:
+        """Drained files not yet removed, oldest first."""
+        return sorted(
+            self.path.parent.glob(f"{self.path.name}.*.draining"),
+            key=lambda path: int(path.name.split(".")[-2]),
+        )
+
+    @staticmethod
+    def _read(path: Path) -> list[dict[str, Any]]:
+        events = []
+        with open(path, encoding="utf-8") as spool:
+            for line in spool:
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    logger.warning("Skipped malformed notification event.")
+        return events
+
+
+notification_spool = NotificationSpool()
+
+
+def record_event(kind: str, **details: Any) -> None:
+    """Record a notification event. Failures are logged, never raised to the caller."""
+    try:
+        notification_spool.record(kind, **details)
+    except Exception as e:
+        logger.warning(f"Failed to record {kind} notification - {e}")
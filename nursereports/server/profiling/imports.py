@@ -0,0 +1,158 @@
+"""
+Import-time profile of the app from python -X importtime. Each run is
+aggregated per module and per package and appended to IMPORT_PROFILE_PATH,
+so startup cost can be compared against earlier runs.
+
+    python -m nursereports.server.profiling.imports [--module nursereports.nursereports] [--runs 5] [--top 25]
+"""
+
+from pathlib import Path
+from typing import Any
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+IMPORT_PROFILE_PATH = Path(os.getenv("IMPORT_PROFILE_PATH", "data/import_profile.jsonl"))
+
+# Modules kept per recorded run, by cumulative time.
+RECORDED_MODULES = 100
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)\s*$")
+
+
+def parse_importtime(output: str) -> dict[str, tuple[int, int]]:
+    """{module: (self us, cumulative us)} from -X importtime stderr."""
+    timings = {}
+    for line in output.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            timings[match.group(3)] = (int(match.group(1)), int(match.group(2)))
+    return timings
+
+
+def package_of(module: str) -> str:
+    """Project modules group by subpackage, ex. nursereports.client.pages. Others by distribution."""
+    parts = module.split(".")
+    if parts[0] == "nursereports":
+        return ".".join(parts[:3])
+    return parts[0]
+
+
+def profile_imports(module: str, runs: int = 5) -> dict[str, Any]:
+    """
+    Imports module in a fresh interpreter runs times and takes the median
+    of each module's timings, which evens out the first run compiling
+    bytecode.
+    """
+    samples: dict[str, list[tuple[int, int]]] = {}
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+        for name, timing in parse_importtime(result.stderr).items():
+            samples.setdefault(name, []).append(timing)
+
+    modules = {
+        name: {
+            "self_ms": statistics.median(t[0] for t in timings) / 1000,
+            "cumulative_ms": statistics.median(t[1] for t in timings) / 1000,
+        }
+        for name, timings in samples.items()
+    }
+    packages: dict[str, float] = {}
+    for name, timing in modules.items():
+        package = package_of(name)
+        packages[package] = packages.get(package, 0.0) + timing["self_ms"]
+
+    return {
+        "module": module,
+        "at": time.time(),
+        "runs": runs,
+        "total_ms": sum(timing["self_ms"] for timing in modules.values()),
+        "module_count": len(modules),
+        "modules": modules,
+        "packages": packages,
+    }
+
+
+def load_profiles(module: str, path: Path = IMPORT_PROFILE_PATH) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+    with open(path, encoding="utf-8") as f:
+        profiles = [json.loads(line) for line in f if line.strip()]
+    return [profile for profile in profiles if profile["module"] == module]
+
+
+def record_profile(profile: dict[str, Any], path: Path = IMPORT_PROFILE_PATH) -> None:
+    """Append a run, keeping only the slowest modules to bound the file."""
+    slowest = sorted(
+        profile["modules"].items(), key=lambda item: -item[1]["cumulative_ms"]
+    )[:RECORDED_MODULES]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({**profile, "modules": dict(slowest)}) + "\n")
+
+
+def _delta(current: float, previous: float | None) -> str:
+    return "" if previous is None else f"{current - previous:+9.1f}"
+
+
+def render_report(
+    profile: dict[str, Any], previous: dict[str, Any] | None = None, top: int = 25
+) -> str:
+    """Text summary of a run, with changes against the previous run if any."""
+    before_packages = previous["packages"] if previous else {}
+    before_modules = previous["modules"] if previous else {}
+    summary = (
+        f"{profile['module']}: {profile['total_ms']:.1f}ms over "
+        f"{profile['module_count']} module(s), median of {profile['runs']} run(s)"
+    )
+    if previous:
+        summary += f" ({_delta(profile['total_ms'], previous['total_ms']).strip()}ms)"
+    lines = [
+        summary,
+        "",
+        f"{'self ms':>9} {'change':>9}  package",
+    ]
+    for package, ms in sorted(profile["packages"].items(), key=lambda item: -item[1])[:top]:
+        lines.append(f"{ms:9.1f} {_delta(ms, before_packages.get(package)):>9}  {package}")
+
+    lines += ["", f"{'cum ms':>9} {'change':>9} {'self ms':>9}  module"]
+    slowest = sorted(profile["modules"].items(), key=lambda item: -item[1]["cumulative_ms"])
+    for name, timing in slowest[:top]:
+        before = before_modules.get(name, {}).get("cumulative_ms")
+        lines.append(
+            f"{timing['cumulative_ms']:9.1f} {_delta(timing['cumulative_ms'], before):>9} "
+            f"{timing['self_ms']:9.1f}  {name}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Profile and record app import time.")
+    parser.add_argument("--module", default="nursereports.nursereports")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--path", type=Path, default=IMPORT_PROFILE_PATH)
+    parser.add_argument("--no-record", action="store_true", help="Report without appending the run.")
+    args = parser.parse_args()
+
+    history = load_profiles(args.module, args.path)
+    profile = profile_imports(args.module, args.runs)
+    print(render_report(profile, history[-1] if history else None, args.top))
+    if not args.no_record:
+        record_profile(profile, args.path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+from .index import HospitalSearchIndex, hospital_search_index, load_hospital_search_index
@@ -0,0 +1,186 @@
+from ..hospitals import hospital_directory
+from ..supabase import supabase_select_all
+
+from loguru import logger
+from typing import Any, Callable
+
+import re
+import threading
+import time
+
+SEARCH_COLUMNS = "hosp_name,hosp_city,hosp_state,hosp_id,hosp_addr"
+
+# Fields searched, in the order results are ranked.
+SEARCH_FIELDS = ("hosp_name", "hosp_city", "hosp_addr")
+
+
+def normalize(text: str) -> str:
+    """Lowercase and collapse punctuation/whitespace to single spaces."""
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", (text or "").lower()).split())
+
+
+def ngrams(text: str, n: int) -> set[str]:
+    return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+
+def load_hospital_rows() -> list[dict]:
+    rows = hospital_directory.rows(SEARCH_COLUMNS.split(","))
+    if rows is None:
+        rows = supabase_select_all("hospitals_v2", SEARCH_COLUMNS, key="hosp_id")
+    return rows
+
+
+def hospital_snapshot_version() -> float | None:
+    return hospital_directory.version
+
+
+class HospitalSearchIndex:
+    """
+    In-memory substring index over the hospital directory. Each searched
+    field is normalized and broken into bigram and trigram postings, so a
+    lookup intersects a handful of small sets and confirms candidates with
+    a substring check instead of running ilike queries against supabase.
+
+    Loaded by a lifespan task at startup. Reloaded in a background thread
+    when the hospital snapshot is rebuilt, checked by its modification time
+    like HospitalDirectory, and otherwise every refresh_interval seconds.
+    Searches never wait on a load: they keep using the previous index, or
+    find nothing until the first load completes. Failed loads back off from
+    retry_interval up to refresh_interval before trying again.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], list[dict]] = load_hospital_rows,
+        version: Callable[[], Any] = hospital_snapshot_version,
+        refresh_interval: float = 900,
+        retry_interval: float = 30,
+    ):
+        self._loader = loader
+        self._version = version
+        self._refresh_interval = refresh_interval
+        self._retry_interval = retry_interval
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._loaded_at = 0.0
+        self._built_version: Any = None
+        self._failures = 0
+        self._retry_at = 0.0
+        # (rows, normalized fields, postings), replaced as a unit on rebuild.
+        self._snapshot: tuple[list[dict], dict, dict] = ([], {}, {})
+
+    def __len__(self) -> int:
+        return len(self._snapshot[0])
+
+    def build(self, rows: list[dict], version: Any = None) -> None:
+        """Replace index contents with rows from hospitals_v2."""
+        rows = sorted(rows, key=lambda row: row.get("hosp_name") or "")
+        for row in rows:
+            row["hosp_city"] = (row.get("hosp_city") or "").title()
+            row["hosp_addr"] = (row.get("hosp_addr") or "").title()
+
+        fields: dict[str, list[str]] = {}
+        postings: dict[str, dict[str, list[int]]] = {}
+        for field in SEARCH_FIELDS:
+            values = [normalize(row.get(field)) for row in rows]
+            field_postings: dict[str, list[int]] = {}
+            for position, value in enumerate(values):
+                for gram in ngrams(value, 2) | ngrams(value, 3):
+                    field_postings.setdefault(gram, []).append(position)
+            fields[field] = values
+            postings[field] = field_postings
+
+        # Swap in one assignment so concurrent searches never see a partial index.
+        self._snapshot = (rows, fields, postings)
+        self._loaded_at = time.monotonic()
+        self._built_version = version
+        logger.debug(f"Indexed {len(rows)} hospital(s) for search.")
+
+    def refresh(self) -> bool:
+        """Reload rows from the loader and rebuild. Returns False if the load failed."""
+        try:
+            # Read before the rows, so a rebuild in between triggers another reload.
+            version = self._version()
+            self.build(self._loader(), version)
+            self._failures = 0
+            self._retry_at = 0.0
+            return True
+        except Exception as e:
+            self._failures += 1
+            delay = min(self._retry_interval * 2 ** (self._failures - 1), self._refresh_interval)
+            self._retry_at = time.monotonic() + delay
+            logger.critical(f"Hospital search index refresh failed, retrying in {delay:.0f}s - {e}")
+            return False
+        finally:
+            self._refreshing = False
+
+    def _ensure_fresh(self) -> None:
+        """Start a background reload if the index is empty, expired or behind the snapshot."""
+        now = time.monotonic()
+        if self._refreshing or now < self._retry_at:
+            return
+        stale = (
+            not self._snapshot[0]
+            or now - self._loaded_at > self._refresh_interval
+            or self._version() != self._built_version
+        )
+        if not stale:
+            return
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self.refresh, daemon=True).start()
+
+    @staticmethod
+    def _match(values: list[str], postings: dict[str, list[int]], query: str) -> list[int]:
+        """Positions whose normalized value contains query, in index order."""
+        if len(query) < 2:
+            return [i for i, value in enumerate(values) if query in value]
+
+        n = 3 if len(query) >= 3 else 2
+        lists = sorted(
+            (postings.get(gram, []) for gram in ngrams(query, n)), key=len
+        )
+        if not lists or not lists[0]:
+            return []
+        candidates = set(lists[0])
+        for positions in lists[1:]:
+            candidates.intersection_update(positions)
+            if not candidates:
+                return []
+        return sorted(i for i in candidates if query in values[i])
+
+    def search(self, query: str, limit: int) -> list[dict]:
+        """
+        Return up to limit hospitals matching query. Name matches come
+        first, then city, then address. Rows are copies so callers can
+        store or mutate them freely.
+        """
+        self._ensure_fresh()
+        query = normalize(query)
+        if not query:
+            return []
+
+        rows, fields, postings = self._snapshot
+        if not rows:
+            return []
+        results: list[dict] = []
+        seen: set[int] = set()
+        for field in SEARCH_FIELDS:
+            for position in self._match(fields[field], postings[field], query):
+                if position in seen:
+                    continue
+                seen.add(position)
+                results.append(dict(rows[position]))
+                if len(results) >= limit:
+                    return results
+        return results
+
+
+hospital_search_index = HospitalSearchIndex()
+
+
+def load_hospital_search_index() -> None:
+    """Lifespan task that builds the index before the first search."""
+    hospital_search_index.refresh()
@@ -0,0 +1,5 @@
+from .concurrent import fan_out, query_executor
+from .instrument import InstrumentedQuery
+from .metrics import QueryMetrics, query_metrics, query_stats
+from .rest import supabase_select, supabase_select_all, supabase_update, supabase_upsert
+from .transport import supabase_client
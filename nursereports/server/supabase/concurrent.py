@@ -0,0 +1,23 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+# Shared by every session; queries spend nearly all their time waiting on PostgREST.
+query_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="supabase-query")
+
+
+def fan_out(*calls: Callable[[], Any]) -> list[Any]:
+    """
+    Run independent blocking reads at once and return their results in call
+    order, so the wait is the slowest read instead of the sum. Calls run on
+    pool threads, so they must not touch a Reflex state: give them plain
+    values and assign the results on the caller. The first exception raised
+    is re-raised after all finish.
+    """
+    if len(calls) < 2:
+        return [call() for call in calls]
+    futures = [query_executor.submit(call) for call in calls]
+    errors = [future.exception() for future in futures]
+    for error in errors:
+        if error is not None:
+            raise error
+    return [future.result() for future in futures]
@@ -0,0 +1,85 @@
+from .metrics import QueryMetrics, query_metrics
+
+from typing import Any
+
+import json
+import time
+
+# Builder methods that set the operation a query performs.
+OPERATIONS = {"select", "insert", "update", "upsert", "delete"}
+
+
+def payload_size(result: Any) -> int:
+    """Approximate response size in bytes, measured as JSON."""
+    try:
+        return len(json.dumps(result, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+class InstrumentedQuery:
+    """
+    Wraps a Suplex query builder and records table, operation, latency, rows
+    and bytes to QueryMetrics when execute() runs. Every other call is passed
+    through to the builder, with its returned builder wrapped in turn.
+    """
+
+    def __init__(
+        self,
+        query: Any,
+        page: str | None = None,
+        metrics: QueryMetrics = query_metrics,
+        table: str = "",
+        operation: str = "",
+    ):
+        self._query = query
+        self._page = page
+        self._metrics = metrics
+        self._table = table
+        self._operation = operation
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._query, name)
+        if not callable(attribute):
+            return attribute
+        if name == "execute":
+            return self._execute(attribute)
+
+        def chained(*args, **kwargs):
+            result = attribute(*args, **kwargs)
+            return InstrumentedQuery(
+                result,
+                page=self._page,
+                metrics=self._metrics,
+                table=args[0] if name == "table" and args else self._table,
+                operation=name if name in OPERATIONS else self._operation,
+            )
+
+        return chained
+
+    def _execute(self, execute):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = execute(*args, **kwargs)
+            except Exception:
+                self._metrics.record(
+                    self._table or "unknown",
+                    self._operation or "unknown",
+                    time.perf_counter() - start,
+                    page=self._page,
+                    failed=True,
+                )
+                raise
+            rows = len(result) if isinstance(result, list) else int(bool(result))
+            self._metrics.record(
+                self._table or "unknown",
+                self._operation or "unknown",
+                time.perf_counter() - start,
+                rows=rows,
+                nbytes=payload_size(result),
+                page=self._page,
+            )
+            return result
+
+        return timed
@@ -0,0 +1,139 @@
+from bisect import bisect_left
+from loguru import logger
+from typing import Any
+
+import math
+import threading
+import time
+
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, math.inf)
+ROW_BUCKETS = (0, 1, 10, 100, 1000, 10000, math.inf)
+BYTE_BUCKETS = (1024, 10 * 1024, 100 * 1024, 1024 * 1024, 10 * 1024 * 1024, math.inf)
+
+
+class Histogram:
+    """Fixed-bucket histogram; percentiles are read off as bucket upper bounds, capped at the max seen."""
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * len(bounds)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, fraction: float) -> float:
+        target = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= target and count:
+                return round(min(bound, self.max), 2)
+        return 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 2) if self.count else 0.0,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "max": round(self.max, 2),
+            "buckets": {
+                ("inf" if math.isinf(bound) else bound): count
+                for bound, count in zip(self.bounds, self.counts)
+            },
+        }
+
+
+class QueryMetrics:
+    """
+    Latency, row and byte histograms for PostgREST round trips keyed by
+    (table, operation), plus round trips per page. A summary is logged every
+    log_interval seconds while queries are being recorded.
+    """
+
+    def __init__(self, log_interval: float = 900):
+        self.log_interval = log_interval
+        self._lock = threading.Lock()
+        self._series: dict[tuple[str, str], dict[str, Histogram]] = {}
+        self._pages: dict[str, dict[str, float]] = {}
+        self._errors: dict[tuple[str, str], int] = {}
+        self._logged_at = time.monotonic()
+
+    def record(
+        self,
+        table: str,
+        operation: str,
+        seconds: float,
+        rows: int = 0,
+        nbytes: int = 0,
+        page: str | None = None,
+        failed: bool = False,
+    ) -> None:
+        key = (table, operation)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {
+                    "latency_ms": Histogram(LATENCY_BUCKETS_MS),
+                    "rows": Histogram(ROW_BUCKETS),
+                    "bytes": Histogram(BYTE_BUCKETS),
+                }
+            series["latency_ms"].observe(seconds * 1000)
+            series["rows"].observe(rows)
+            series["bytes"].observe(nbytes)
+            if failed:
+                self._errors[key] = self._errors.get(key, 0) + 1
+            if page:
+                totals = self._pages.setdefault(page, {"queries": 0, "seconds": 0.0})
+                totals["queries"] += 1
+                totals["seconds"] += seconds
+
+            log_due = time.monotonic() - self._logged_at > self.log_interval
+            if log_due:
+                self._logged_at = time.monotonic()
+        if log_due:
+            self.log_summary()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "queries": {
+                    f"{table}.{operation}": {
+                        "errors": self._errors.get((table, operation), 0),
+                        **{name: histogram.snapshot() for name, histogram in series.items()},
+                    }
+                    for (table, operation), series in sorted(self._series.items())
+                },
+                "pages": {
+                    page: {"queries": int(totals["queries"]), "seconds": round(totals["seconds"], 3)}
+                    for page, totals in sorted(
+                        self._pages.items(), key=lambda item: -item[1]["queries"]
+                    )
+                },
+            }
+
+    def log_summary(self) -> None:
+        stats = self.stats()
+        for name, series in stats["queries"].items():
+            latency = series["latency_ms"]
+            logger.info(
+                f"{name}: {latency['count']} quer(ies), p50 {latency['p50']}ms, "
+                f"p95 {latency['p95']}ms, mean {series['rows']['mean']} row(s), "
+                f"mean {series['bytes']['mean']} byte(s), {series['errors']} error(s)"
+            )
+        for page, totals in stats["pages"].items():
+            logger.info(f"{page}: {totals['queries']} round trip(s) in {totals['seconds']}s")
+
+
+query_metrics = QueryMetrics()
+
+
+def query_stats() -> dict[str, Any]:
+    """Per table/operation histograms and per page round trips for this process."""
+    return query_metrics.stats()
@@ -0,0 +1,181 @@
+from ..cache import SingleFlight
+from ..exceptions import RequestFailed
+from .instrument import payload_size
+from .metrics import query_metrics
+from .transport import supabase_client
+
+from loguru import logger
+
+import copy
+import reflex as rx
+import time
+
+_config = rx.config.get_config()
+
+# PostgREST caps responses at 1000 rows by default.
+MAX_PAGE_SIZE = 1000
+
+# Identical concurrent reads from worker threads and jobs share one request.
+query_flights = SingleFlight()
+
+
+def _headers(admin: bool, access_token: str | None = None) -> dict[str, str]:
+    """
+    Anon key for public reads, service role for admin work. A signed-in
+    user's access token runs the request under their row level security.
+    """
+    key = _config.suplex["service_role"] if admin else _config.suplex["api_key"]
+    return {"apikey": key, "Authorization": f"Bearer {access_token or key}"}
+
+
+def supabase_select(
+    table: str,
+    columns: str = "*",
+    filters: dict[str, str] | None = None,
+    order: str | None = None,
+    limit: int | None = None,
+    admin: bool = False,
+    access_token: str | None = None,
+    shared: bool = True,
+) -> list[dict]:
+    """
+    Read from Supabase PostgREST over the pooled client. Without an access
+    token the read is session-independent, for server processes, jobs and
+    public tables. With one it sees what that user's row level security
+    allows. Filters use PostgREST syntax, ex. {"hosp_id": "gt.010001"} or
+    {"hosp_state": "eq.OH"}. Identical concurrent reads by the same caller
+    share one request, unless shared is False, for reads that must see
+    writes made after a concurrent read started.
+    """
+    params = {"select": columns, **(filters or {})}
+    if order:
+        params["order"] = order
+    if limit:
+        params["limit"] = str(limit)
+
+    if not shared:
+        return _get(table, params, admin, access_token)
+    key = ("rest", table, admin, access_token, tuple(sorted(params.items())))
+    rows, shared = query_flights.do(key, lambda: _get(table, params, admin, access_token))
+    return copy.deepcopy(rows) if shared else rows
+
+
+def _get(
+    table: str, params: dict[str, str], admin: bool, access_token: str | None = None
+) -> list[dict]:
+    start = time.perf_counter()
+    response = supabase_client.get(
+        f"{_config.suplex['api_url']}/rest/v1/{table}",
+        headers=_headers(admin, access_token),
+        params=params,
+    )
+    if not response.is_success:
+        query_metrics.record(table, "select", time.perf_counter() - start, failed=True)
+        logger.warning(f"Select on {table} returned {response.status_code}.")
+        raise RequestFailed(f"Unable to read from {table}.")
+    rows = response.json()
+    query_metrics.record(
+        table, "select", time.perf_counter() - start, rows=len(rows), nbytes=len(response.content)
+    )
+    return rows
+
+
+def supabase_select_all(
+    table: str,
+    columns: str,
+    key: str,
+    filters: dict[str, str] | None = None,
+    page_size: int = MAX_PAGE_SIZE,
+    admin: bool = False,
+) -> list[dict]:
+    """
+    Reads every row matching filters by walking keyset pages on a unique,
+    sortable column. Key must be included in columns.
+    """
+    rows: list[dict] = []
+    last_key = None
+    while True:
+        page_filters = dict(filters or {})
+        if last_key is not None:
+            page_filters[key] = f"gt.{last_key}"
+        page = supabase_select(
+            table,
+            columns,
+            filters=page_filters,
+            order=f"{key}.asc",
+            limit=page_size,
+            admin=admin,
+        )
+        rows.extend(page)
+        if len(page) < page_size:
+            return rows
+        last_key = page[-1][key]
+
+
+def supabase_update(
+    table: str,
+    filters: dict[str, str],
+    data: dict,
+    admin: bool = True,
+    returning: str | None = None,
+) -> list[dict]:
+    """
+    Session-independent update of rows matching PostgREST filters. With
+    returning, ex. "hosp_id", those columns of the updated rows are returned,
+    so callers can tell whether any row matched.
+    """
+    start = time.perf_counter()
+    params = dict(filters)
+    if returning:
+        params["select"] = returning
+    response = supabase_client.patch(
+        f"{_config.suplex['api_url']}/rest/v1/{table}",
+        headers={
+            **_headers(admin),
+            "Prefer": "return=representation" if returning else "return=minimal",
+        },
+        params=params,
+        json=data,
+    )
+    query_metrics.record(
+        table,
+        "update",
+        time.perf_counter() - start,
+        nbytes=payload_size(data),
+        failed=not response.is_success,
+    )
+    if not response.is_success:
+        logger.warning(f"Update on {table} returned {response.status_code}.")
+        raise RequestFailed(f"Unable to update {table}.")
+    return response.json() if returning else []
+
+
+def supabase_upsert(
+    table: str,
+    rows: list[dict],
+    on_conflict: str,
+    admin: bool = True,
+) -> None:
+    """
+    Session-independent bulk write. Rows whose on_conflict column already
+    exists have the given columns updated, everything else is inserted.
+    Every row must have the same keys.
+    """
+    start = time.perf_counter()
+    response = supabase_client.post(
+        f"{_config.suplex['api_url']}/rest/v1/{table}",
+        headers={**_headers(admin), "Prefer": "resolution=merge-duplicates,return=minimal"},
+        params={"on_conflict": on_conflict},
+        json=rows,
+    )
+    query_metrics.record(
+        table,
+        "upsert",
+        time.perf_counter() - start,
+        rows=len(rows),
+        nbytes=payload_size(rows),
+        failed=not response.is_success,
+    )
+    if not response.is_success:
+        logger.warning(f"Upsert on {table} returned {response.status_code}.")
+        raise RequestFailed(f"Unable to upsert into {table}.")
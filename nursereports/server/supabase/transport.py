@@ -0,0 +1,16 @@
+from loguru import logger
+
+import httpx
+import importlib.util
+
+# HTTP/2 needs the optional h2 package (httpx[http2]).
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# One keep-alive pool for every server-side PostgREST call in the process.
+supabase_client = httpx.Client(
+    http2=HTTP2_AVAILABLE,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=30),
+    timeout=30.0,
+)
+
+logger.debug(f"Supabase transport pooled over HTTP/{'2' if HTTP2_AVAILABLE else '1.1'}.")
@@ -1,3 +1,5 @@
+from ..server.supabase import InstrumentedQuery, supabase_select
+
 from suplex import Suplex
 
 from loguru import logger
@@ -8,6 +10,26 @@ import reflex as rx
 
 class AuthState(Suplex):
 
+    def query(self):
+        """Suplex query builder with per table/operation round trip metrics."""
+        try:
+            page = self.router.page.path
+        except AttributeError:
+            page = None
+        # Suplex.query is wrapped as an event handler, call its function directly.
+        base_query = getattr(Suplex.query, "fn", Suplex.query)
+        return InstrumentedQuery(base_query(self), page=page)
+
+    def select_rows(
+        self, table: str, columns: str = "*", filters: dict[str, str] | None = None
+    ) -> list[dict]:
+        """
+        Read under this user's row level security over the pooled REST
+        client. Used on hot read paths instead of query(), whose Suplex
+        builder opens its own connections.
+        """
+        return supabase_select(table, columns, filters=filters, access_token=self.access_token or None)
+
     def refresh_access_token(self) -> Callable | None:
         """
         Refresh JWT token using refresh token.
@@ -1,36 +1,113 @@
-import numpy as np
-import polars as pl
 import re
 import reflex as rx
 
 from ..client.components.dicts import abbr_to_state_dict
 from ..states.user_state import UserState
+from ..server.analytics import (
+    OVERVIEW_PROFILES,
+    hospital_analytics,
+    projection_select,
+    state_pay_baselines,
+)
+from ..server.cache import hospital_row_cache
+from ..server.hospitals import hospital_directory
 from ..server.exceptions import RequestFailed
+from ..server.notifications import record_event
+from ..server.supabase import supabase_select, supabase_select_all
+from .pagination import page_count
 
 from datetime import datetime
 from loguru import logger
 from typing import Any, Callable, Iterable
 
+import asyncio
 import copy
 import humanize
-import math
-import traceback
+
+
+SCORE_KEYS = ("comp_overall", "assign_overall", "staff_overall", "overall")
+
+# Fields of a hospitals_v2 row that pages render. The full row stays in
+# hospital_row_cache.
+HOSPITAL_SUMMARY_FIELDS = (
+    "hosp_id",
+    "hosp_name",
+    "hosp_addr",
+    "hosp_city",
+    "hosp_state",
+    "hosp_zip",
+    "hosp_county",
+)
+
+
+def hospital_summary(row: dict) -> dict:
+    return {key: row.get(key) for key in HOSPITAL_SUMMARY_FIELDS}
+
+
+def fetch_hospital_row(hosp_id: str, access_token: str | None = None) -> dict[str, Any]:
+    """Fetch a hospital's row from supabase."""
+    return supabase_select(
+        "hospitals_v2", filters={"hosp_id": f"eq.{hosp_id}"}, access_token=access_token
+    )[0]
+
+
+def fetch_hospital_reports(hosp_id: str) -> list[dict]:
+    """
+    Fetch a hospital's reports from supabase, projected down to the fields
+    the overview analytics read. The rows are shared by every session
+    through hospital_analytics, so they're read with the service role
+    instead of the visitor's session, and the projection carries no user
+    fields.
+    """
+    return supabase_select_all(
+        "reports",
+        projection_select(*OVERVIEW_PROFILES),
+        key="report_id",
+        filters={"hospital_id": f"eq.{hosp_id}"},
+        admin=True,
+    )
+
+
+def score_tier(value: float) -> int:
+    """1-5 tier used to color a score."""
+    return 5 if value >= 4.5 else 4 if value >= 3.5 else 3 if value >= 2.5 else 2 if value >= 1.5 else 1
+
+
+def score_display(scores: dict) -> dict:
+    """
+    {key}_display and {key}_tier for each score, with a dash and tier 0
+    where a score is missing.
+    """
+    result = {}
+    for key in SCORE_KEYS:
+        value = scores.get(key)
+        if value is not None:
+            result[f"{key}_display"] = f"{float(value):.1f}"
+            result[f"{key}_tier"] = score_tier(float(value))
+        else:
+            result[f"{key}_display"] = "—"
+            result[f"{key}_tier"] = 0
+    return result
 
 
 class HospitalState(UserState):
 
     MAX_REVIEWS_DISPLAYED = 10
 
-    # Full info for each section.
+    # Display fields of the hospital row.
     hospital_info: dict[str, Any]
-    report_info: list[dict]
-    review_info: list[dict]
+    report_count: int = 0
+
+    # Current page of reviews and how many match the review unit filter. The
+    # rest stay in the hospital's server-side review index.
+    review_page: list[dict]
+    review_count: int = 0
 
-    # Dicts of pay values extrapolated over experience.
-    extrapolated_ft_pay_hospital: dict
-    extrapolated_pt_pay_hospital: dict
-    extrapolated_ft_pay_state: dict
-    extrapolated_pt_pay_state: dict
+    # Hourly pay extrapolated over experience, indexed by years (0-26).
+    extrapolated_ft_pay_hospital: list[float]
+    extrapolated_pt_pay_hospital: list[float]
+    extrapolated_ft_pay_state: list[float]
+    extrapolated_pt_pay_state: list[float]
 
     # Dicts of averaged contract pay.
     averaged_contract_pay_hospital: dict
@@ -45,10 +122,11 @@ class HospitalState(UserState):
     contract_pay_info_hospital_limited: bool = False
     contract_pay_info_state_limited: bool = False
 
-    # Units/areas/roles pulled from reports.
+    # Units/areas/roles pulled from reports. Per unit score rows, with
+    # display fields, are backend only and read by the ratings table vars.
     units_areas_roles_for_units: list[str]
-    units_areas_roles_hospital_scores: list[dict]
     overall_hospital_scores: dict
+    _hospital_scores: list[dict] = []
 
     # User selectable fields.
     selected_unit: str = "Hospital Overall"
@@ -61,12 +139,13 @@ class HospitalState(UserState):
     ratings_sort_col: str = "overall"
     ratings_sort_asc: bool = False
 
-    # Pagination for sections.
+    # Pagination for sections. Cursor i fetches page i + 1.
     current_review_page: int = 1
+    _review_cursors: list[tuple[str, str] | None] = [None]
 
-    @rx.var
+    @rx.var(cache=True, deps=["report_count"], auto_deps=False)
     def has_report_info(self) -> bool:
-        return True if len(self.report_info) > 0 else False
+        return True if self.report_count > 0 else False
 
     @rx.var
     def hosp_id(self) -> str | None:
@@ -79,11 +158,15 @@ class HospitalState(UserState):
             cms_is_valid = bool(re.match(r"^[a-zA-Z0-9]{5,6}$", hosp_id))
         return hosp_id if cms_is_valid else None
 
-    @rx.var
+    @rx.var(
+        cache=True,
+        deps=["extrapolated_ft_pay_hospital", UserState.user_info_experience],
+        auto_deps=False,
+    )
     def ft_pay_hospital_formatted(self) -> dict:
         if self.extrapolated_ft_pay_hospital:
             exp = min(self.user_info_experience, 26)
-            hourly = self.extrapolated_ft_pay_hospital.get(exp)
+            hourly = self.extrapolated_ft_pay_hospital[exp]
             formatted_hourly = "{:.2f}".format(hourly)
             rounded_yearly = round(hourly * 36 * 52)
             formatted_yearly = "{:,}".format(rounded_yearly)
@@ -94,11 +177,15 @@ class HospitalState(UserState):
         else:
             return {}
 
-    @rx.var
+    @rx.var(
+        cache=True,
+        deps=["extrapolated_ft_pay_state", UserState.user_info_experience],
+        auto_deps=False,
+    )
     def ft_pay_state_formatted(self) -> dict:
         if self.extrapolated_ft_pay_state:
             exp = min(self.user_info_experience, 26)
-            rounded_hourly = round(self.extrapolated_ft_pay_state.get(exp), 2)
+            rounded_hourly = round(self.extrapolated_ft_pay_state[exp], 2)
             formatted_hourly = "{:.2f}".format(rounded_hourly)
             rounded_yearly = round(rounded_hourly * 36 * 52)
             formatted_yearly = "{:,}".format(rounded_yearly)
@@ -109,11 +196,15 @@ class HospitalState(UserState):
         else:
             return {}
 
-    @rx.var
+    @rx.var(
+        cache=True,
+        deps=["extrapolated_pt_pay_hospital", UserState.user_info_experience],
+        auto_deps=False,
+    )
     def pt_pay_hospital_formatted(self) -> dict:
         if self.extrapolated_pt_pay_hospital:
             exp = min(self.user_info_experience, 26)
-            hourly = self.extrapolated_pt_pay_hospital.get(exp)
+            hourly = self.extrapolated_pt_pay_hospital[exp]
             formatted_hourly = "{:.2f}".format(hourly)
             rounded_yearly = round(hourly * 36 * 52)
             formatted_yearly = "{:,}".format(rounded_yearly)
@@ -124,11 +215,15 @@ class HospitalState(UserState):
         else:
             return {}
 
-    @rx.var
+    @rx.var(
+        cache=True,
+        deps=["extrapolated_pt_pay_state", UserState.user_info_experience],
+        auto_deps=False,
+    )
     def pt_pay_state_formatted(self) -> dict:
         if self.extrapolated_pt_pay_state:
             exp = min(self.user_info_experience, 26)
-            rounded_hourly = round(self.extrapolated_pt_pay_state.get(exp), 2)
+            rounded_hourly = round(self.extrapolated_pt_pay_state[exp], 2)
             formatted_hourly = "{:.2f}".format(rounded_hourly)
             rounded_yearly = round(rounded_hourly * 36 * 52)
             formatted_yearly = "{:,}".format(rounded_yearly)
@@ -139,7 +234,17 @@ class HospitalState(UserState):
         else:
             return {}
 
-    @rx.var
+    @rx.var(
+        cache=True,
+        deps=[
+            "selected_hospital_average",
+            "extrapolated_ft_pay_hospital",
+            "extrapolated_ft_pay_state",
+            "extrapolated_pt_pay_hospital",
+            "extrapolated_pt_pay_state",
+        ],
+        auto_deps=False,
+    )
     def pay_chart_data(self) -> list[dict]:
         """Pay curve across all experience levels for recharts line chart."""
         if self.selected_hospital_average == "Full-time":
@@ -155,39 +260,25 @@ class HospitalState(UserState):
         data = []
         for year in range(0, 27):
             point: dict = {"year": year if year < 26 else "25+"}
-            if hospital_pay and year in hospital_pay:
+            if year < len(hospital_pay):
                 point["Hospital"] = round(hospital_pay[year], 2)
-            if state_pay and year in state_pay:
+            if year < len(state_pay):
                 point["State"] = round(state_pay[year], 2)
             data.append(point)
         return data
 
-    @rx.var
+    @rx.var(
+        cache=True,
+        deps=["_hospital_scores", "ratings_sort_col", "ratings_sort_asc"],
+        auto_deps=False,
+    )
     def sorted_ratings_table(self) -> list[dict]:
-        if not self.units_areas_roles_hospital_scores:
-            return []
-        result = sorted(
-            self.units_areas_roles_hospital_scores,
+        """Score rows sorted by the selected column."""
+        return sorted(
+            self._hospital_scores,
             key=lambda d: d.get(self.ratings_sort_col) or 0,
             reverse=not self.ratings_sort_asc,
         )
-        def _tier(val):
-            return 5 if val >= 4.5 else 4 if val >= 3.5 else 3 if val >= 2.5 else 2 if val >= 1.5 else 1
-
-        return [
-            {
-                **row,
-                "comp_display": f"{row['comp_overall']:.1f}",
-                "comp_tier": _tier(row["comp_overall"]),
-                "assign_display": f"{row['assign_overall']:.1f}",
-                "assign_tier": _tier(row["assign_overall"]),
-                "staff_display": f"{row['staff_overall']:.1f}",
-                "staff_tier": _tier(row["staff_overall"]),
-                "overall_display": f"{row['overall']:.1f}",
-                "overall_tier": _tier(row["overall"]),
-            }
-            for row in result
-        ]
 
     def set_ratings_sort(self, col: str) -> None:
         if self.ratings_sort_col == col:
@@ -196,77 +287,75 @@ class HospitalState(UserState):
             self.ratings_sort_col = col
             self.ratings_sort_asc = False
 
-    @rx.var
+    @rx.var(
+        cache=True,
+        deps=["_hospital_scores", "overall_hospital_scores", "selected_unit"],
+        auto_deps=False,
+    )
     def selected_unit_info(self) -> dict[str, str | int | float]:
         matched_dict = next(
             (
                 d
-                for d in self.units_areas_roles_hospital_scores
+                for d in self._hospital_scores
                 if d.get("units_areas_roles") == self.selected_unit
             ),
             None
         )
-        return matched_dict if matched_dict else self.overall_hospital_scores
+        return dict(matched_dict) if matched_dict else self.overall_hospital_scores
 
-    @rx.var
+    @rx.var(cache=True, deps=["selected_unit_info"], auto_deps=False)
     def selected_unit_display(self) -> dict:
-        info = self.selected_unit_info
-        result = {}
-        for key in ("comp_overall", "assign_overall", "staff_overall", "overall"):
-            val = info.get(key)
-            if val is not None:
-                fval = float(val)
-                result[f"{key}_display"] = f"{fval:.1f}"
-                result[f"{key}_tier"] = (
-                    5 if fval >= 4.5
-                    else 4 if fval >= 3.5
-                    else 3 if fval >= 2.5
-                    else 2 if fval >= 1.5
-                    else 1
-                )
-            else:
-                result[f"{key}_display"] = "—"
-                result[f"{key}_tier"] = 0
-        return result
-
-    @rx.var
-    def filtered_review_info(self) -> list[dict]:
-        matched_list = [review for review in self.review_info if review.get("units_areas_roles", "") == self.selected_review_unit]
-        return matched_list if matched_list else self.review_info
+        return score_display(self.selected_unit_info)
 
-    @rx.var
-    def paginated_review_info(self) -> list[dict]:
-        sorted_list = sorted(
-            self.filtered_review_info,
-            key=lambda review: datetime.fromisoformat(review["timestamp"]),
-            reverse=True,
-        )
-        if len(sorted_list) > self.MAX_REVIEWS_DISPLAYED:
-            num_pages = math.ceil(len(sorted_list) / self.MAX_REVIEWS_DISPLAYED)
-            num_pages_list = [page for page in range(1, (num_pages + 1))]
-            paginated_reports = { number: [] for number in num_pages_list}
-            current_page = 1
-            for review in sorted_list:
-                if len(paginated_reports[current_page]) >= self.MAX_REVIEWS_DISPLAYED:
-                    current_page += 1
-                paginated_reports[current_page].append(review)
-            return paginated_reports.get(self.current_review_page)
-        else:
-            return sorted_list
-
-    @rx.var
+    @rx.var(cache=True, deps=["review_count"], auto_deps=False)
     def num_review_pages(self) -> int:
-        num_pages = math.ceil(len(self.filtered_review_info) / self.MAX_REVIEWS_DISPLAYED)
-        return num_pages
+        return page_count(self.review_count, self.MAX_REVIEWS_DISPLAYED)
 
-    def next_review_page(self) -> None:
-        num_pages = math.ceil(len(self.filtered_review_info) / self.MAX_REVIEWS_DISPLAYED)
-        if self.current_review_page < num_pages:
+    async def next_review_page(self) -> None:
+        if self.current_review_page < self.num_review_pages:
             self.current_review_page += 1
+            await self.load_review_page()
 
-    def previous_review_page(self) -> None:
+    async def previous_review_page(self) -> None:
         if self.current_review_page > 1:
             self.current_review_page -= 1
+            await self.load_review_page()
+
+    async def event_state_select_review_unit(self, unit: str) -> None:
+        self.selected_review_unit = unit
+        await self.load_review_page(first=True)
+
+    async def load_review_page(self, first: bool = False) -> None:
+        """
+        Load one page of reviews for the selected unit from the hospital's
+        review index, newest first, keyed by the cursor the previous page
+        left behind.
+        """
+        if first:
+            self.current_review_page = 1
+            self._review_cursors = [None]
+
+        hosp_id = self.hosp_id
+        entry = await hospital_analytics.get_or_materialize(
+            hosp_id, lambda: fetch_hospital_reports(hosp_id)
+        )
+        reviews = entry["reviews"]
+        page, next_cursor = reviews.page(
+            self.selected_review_unit,
+            self._review_cursors[self.current_review_page - 1],
+            self.MAX_REVIEWS_DISPLAYED,
+        )
+        self._review_cursors = self._review_cursors[: self.current_review_page]
+        if next_cursor:
+            self._review_cursors.append(next_cursor)
+
+        review_page = copy.deepcopy(page)
+        for review in review_page:
+            review["time_ago"] = humanize.naturaltime(
+                datetime.fromisoformat(review["timestamp"])
+            )
+        self.review_count = reviews.count(self.selected_review_unit)
+        self.review_page = review_page
 
     def set_slider(self, value) -> None:
         self.selected_experience = value[0]
@@ -275,9 +364,11 @@ class HospitalState(UserState):
         """When user completes a report, reset hospital variables so all reports are refreshed on page visit."""
         self.reset()
 
-    def event_state_load_hospital_info(self) -> Callable | None:
+    async def event_state_load_hospital_info(self) -> Callable | None:
         """
-        Load hospital data into state from supabase.
+        Load hospital data into state from supabase. Async so sessions
+        opening the same cold hospital overlap and share one fetch, which
+        runs in a worker thread instead of blocking the event loop.
         """
         try:
             if self.hospital_info:
@@ -289,19 +380,24 @@ class HospitalState(UserState):
                     self.selected_experience = 4
                     self.selected_unit = "Hospital Overall"
                     self.selected_review_unit = "Hospital Overall"
+                    await self.load_review_page(first=True)
                     return
 
             if self.hosp_id:
-                result = self.query().table("hospitals_v2").eq("hosp_id", self.hosp_id).select("*").execute()
-                self.hospital_info = result[0]
+                # The snapshot covers every field of the summary. Hospitals
+                # added since it was built come from supabase.
+                hosp_id, access_token = self.hosp_id, self.access_token or None
+                row = hospital_directory.get(hosp_id) or await asyncio.to_thread(
+                    hospital_row_cache.get_or_set,
+                    hosp_id,
+                    lambda: fetch_hospital_row(hosp_id, access_token),
+                )
+                self.hospital_info = hospital_summary(row)
                 self.hospital_info["hosp_state_abbr"] = self.hospital_info["hosp_state"]
                 self.hospital_info["hosp_state"] = abbr_to_state_dict.get(
                     self.hospital_info["hosp_state_abbr"]
                 )
-                self.load_report_info()
-                self.load_pay_info()
-                self.load_unit_info()
-                self.load_review_info()
+                await self.load_hospital_analytics()
             else:
                 return rx.redirect("/dashboard")
 
@@ -312,412 +408,30 @@ class HospitalState(UserState):
             logger.error(e)
             return rx.toast.error("Error while loading hospital info.")
 
-    def load_report_info(self) -> None:
-        """
-        Load report data into state from supabase.
-        """
-        self.report_info = self.query().table("reports").eq(
-            "hospital_id", self.hosp_id
-        ).select("*").execute()
-
-    def load_pay_info(self) -> None:
+    async def load_hospital_analytics(self) -> None:
         """
-        Pulls pay data out of report_info and processes data to partition into
-        user digestible chunks for display.
+        Load materialized analytics for this hospital into state, building
+        them from reports if no session has visited this hospital yet, along
+        with precomputed pay baselines for the hospital's state.
         """
-        try:
-            if self.report_info:
-                pay_df = pl.DataFrame(copy.deepcopy(self.report_info))
-
-                ft_pay_hospital_df = (
-                    pay_df.filter(
-                        pl.col("compensation").struct.field("emp_type") == "Full-time"
-                    )
-                    .select(
-                        [
-                            pl.col("compensation")
-                            .struct.field("pay")
-                            .struct.field("hourly"),
-                            pl.col("compensation")
-                            .struct.field("experience")
-                            .struct.field("total"),
-                        ]
-                    )
-                    .sort(by=pl.col("total"))
-                )
-
-                ft_pay_hospital_df = self.remove_pay_outliers(
-                    ft_pay_hospital_df, "hourly"
-                )
-                ft_pay_hospital_df = self.flatten_pay(
-                    ft_pay_hospital_df, "total", "hourly"
-                )
-                self.ft_pay_hospital_info_limited = bool(len(ft_pay_hospital_df) < 10)
-                self.extrapolated_ft_pay_hospital = self.linear_regression_pay(
-                    ft_pay_hospital_df, "total", "hourly"
-                )
-                logger.debug(f"Pulled {len(ft_pay_hospital_df)} full time report(s).")
-
-                pt_pay_hospital_df = (
-                    pay_df.filter(
-                        pl.col("compensation").struct.field("emp_type") == "Part-time"
-                    )
-                    .select(
-                        [
-                            pl.col("compensation")
-                            .struct.field("pay")
-                            .struct.field("hourly"),
-                            pl.col("compensation")
-                            .struct.field("experience")
-                            .struct.field("total"),
-                        ]
-                    )
-                    .sort(by=pl.col("total"))
-                )
-
-                pt_pay_hospital_df = self.remove_pay_outliers(
-                    pt_pay_hospital_df, "hourly"
-                )
-                pt_pay_hospital_df = self.flatten_pay(
-                    pt_pay_hospital_df, "total", "hourly"
-                )
-                self.pt_pay_hospital_info_limited = bool(len(pt_pay_hospital_df) < 10)
-                self.extrapolated_pt_pay_hospital = self.linear_regression_pay(
-                    pt_pay_hospital_df, "total", "hourly"
-                )
-                logger.debug(f"Pulled {len(pt_pay_hospital_df)} part time report(s).")
-
-                contract_pay_df = (
-                    pay_df.filter(
-                        pl.col("compensation").struct.field("emp_type") == "Contract"
-                    )
-                    .select(
-                        [
-                            pl.col("compensation")
-                            .struct.field("pay")
-                            .struct.field("weekly"),
-                            pl.col("created_at"),
-                        ]
-                    )
-                    .sort(by=pl.col("created_at"))
-                )
-
-                self.contract_pay_info_hospital_limited = bool(
-                    len(contract_pay_df) < 10
-                )
-
-                if len(contract_pay_df) > 0:
-                    self.simple_average_pay(contract_pay_df, "weekly")
-                    logger.debug(
-                        f"Pulled {len(contract_pay_df)} contract report(s) and averaged them."
-                    )
-                else:
-                    logger.debug(
-                        "No contract pay data present to be loaded to state..."
-                    )
-
-        except Exception as e:
-            traceback.print_exc()
-            logger.critical(e)
-
-    @staticmethod
-    def remove_pay_outliers(
-        df_to_clean: pl.DataFrame, y_name: str, multiplier: float = 2
-    ) -> pl.DataFrame:
-        if len(df_to_clean) < 4:
-            logger.debug("Not enough entries to remove outliers.")
-            return df_to_clean
-
-        y_values = df_to_clean[y_name].to_numpy()
-        Q1 = np.percentile(y_values, 25)
-        Q3 = np.percentile(y_values, 75)
-        IQR = Q3 - Q1
-        lower_bound = Q1 - (multiplier * IQR)
-        upper_bound = Q3 + (multiplier * IQR)
-        filtered_df = df_to_clean.filter(
-            (df_to_clean[y_name] >= lower_bound) & (df_to_clean[y_name] <= upper_bound)
-        )
-        logger.debug(
-            f"Dropped {len(df_to_clean) - len(filtered_df)} report(s) as outliers."
+        hosp_id = self.hosp_id
+        entry = await hospital_analytics.get_or_materialize(
+            hosp_id, lambda: fetch_hospital_reports(hosp_id)
         )
-        return filtered_df
-
-    @staticmethod
-    def flatten_pay(
-        df_to_flatten: pl.DataFrame, x_name: str, y_name: str
-    ) -> pl.DataFrame:
-        x = df_to_flatten[x_name].to_numpy()
-        y = df_to_flatten[y_name].to_numpy()
-        unique_x = np.unique(x)
-        averaged_y = [np.mean(y[x == val]) for val in unique_x]
-        flattened_df = pl.DataFrame({x_name: unique_x, y_name: averaged_y})
-        logger.debug(
-            f"Flattened by {df_to_flatten.height - flattened_df.height} report(s)."
-        )
-        return flattened_df
-
-    @staticmethod
-    def simple_average_pay(pay_df: pl.DataFrame, y_name: str) -> dict:
-        averaged_pay = pay_df.select(
-            pl.col(f"{y_name}").mean().alias(f"averaged_{y_name}")
-        )
-        return averaged_pay.to_dict()
-
-    @staticmethod
-    def linear_regression_pay(pay_df: pl.DataFrame, x_name: str, y_name: str) -> dict:
-        MIN_NEW_RN_PAY = 20
-        MAX_NEW_RN_PAY = 55
-        MIN_PAY_PROGRESSION_SLOPE = 0.5
-        MAX_PAY_PROGRESSION_SLOPE = 4
-
-        years = pay_df[f"{x_name}"].to_numpy()
-        pay = pay_df[f"{y_name}"].to_numpy()
-        x_range = np.arange(0, 27)
-
-        if len(pay_df) == 0:
-            return {}
-
-        if len(pay_df) == 1:
-            y_range = np.full_like(x_range, pay[0], dtype=float)
-
-        elif len(pay_df) > 1:
-            m, b = np.polyfit(years, pay, 1)
-            if len(pay_df) < 10:
-                b = max(MIN_NEW_RN_PAY, min(b, MAX_NEW_RN_PAY))
-                m = max(MIN_PAY_PROGRESSION_SLOPE, min(m, MAX_PAY_PROGRESSION_SLOPE))
-            y_range = m * x_range + b
-
-        pay_dict = dict(zip(x_range, y_range))
-        final_pay_dict = {
-            int(experience): round(float(pay), 2)
-            for experience, pay in pay_dict.items()
-        }
-        return final_pay_dict
-
-    def load_unit_info(self) -> None:
-        try:
-            if self.report_info:
-                full_df = pl.DataFrame(copy.deepcopy(self.report_info))
-
-                refined_df = full_df.select(
-                    pl.coalesce(
-                        [
-                            pl.col("assignment").struct.field("unit").struct.field("entered_unit").replace("", None),
-                            pl.col("assignment").struct.field("unit").struct.field("selected_unit").replace("", None),
-                        ]
-                    ).alias("unit"),
-                    pl.coalesce(
-                        [
-                            pl.col("assignment").struct.field("area").struct.field("entered_area").replace("", None),
-                            pl.col("assignment").struct.field("area").struct.field("selected_area").replace("", None),
-                        ]
-                    ).alias("area"),
-                    pl.coalesce(
-                        [
-                            pl.col("assignment").struct.field("role").struct.field("entered_role").replace("", None),
-                            pl.col("assignment").struct.field("role").struct.field("selected_role").replace("", None),
-                        ]
-                    ).alias("role"),
-                    pl.col("compensation")
-                    .struct.field("ratings")
-                    .struct.field("overall")
-                    .cast(pl.Int8)
-                    .alias("comp_overall"),
-                    pl.col("assignment")
-                    .struct.field("ratings")
-                    .struct.field("overall")
-                    .cast(pl.Int8)
-                    .alias("assign_overall"),
-                    pl.col("staffing")
-                    .struct.field("ratings")
-                    .struct.field("overall")
-                    .cast(pl.Int8)
-                    .alias("staff_overall"),
-                ).with_columns(
-                    pl.mean_horizontal(
-                        "comp_overall", "assign_overall", "staff_overall"
-                    )
-                    .round(0)
-                    .cast(pl.Int8)
-                    .alias("overall")
-                )
-
-                sorted_units = refined_df.select(pl.col("unit")).to_dict()
-                sorted_units = sorted(
-                    list(unit for unit in set(sorted_units["unit"]) if unit)
-                )
-
-                sorted_areas = refined_df.select(pl.col("area")).to_dict()
-                sorted_areas = sorted(
-                    list(area for area in set(sorted_areas["area"]) if area)
-                )
-
-                sorted_roles = refined_df.select(pl.col("role")).to_dict()
-                sorted_roles = sorted(
-                    list(role for role in set(sorted_roles["role"]) if role)
-                )
-
-                self.units_areas_roles_for_units = (
-                    ["Hospital Overall"] + sorted_units + sorted_areas + sorted_roles
-                )
-
-                hospital_score_df = full_df.select(
-                    pl.lit("HOSPITAL").alias("units_areas_roles"),
-                    pl.col("compensation")
-                    .struct.field("ratings")
-                    .struct.field("overall")
-                    .mean()
-                    .alias("comp_overall"),
-                    pl.col("assignment")
-                    .struct.field("ratings")
-                    .struct.field("overall")
-                    .mean()
-                    .alias("assign_overall"),
-                    pl.col("staffing")
-                    .struct.field("ratings")
-                    .struct.field("overall")
-                    .mean()
-                    .alias("staff_overall"),
-                ).with_columns(
-                    pl.mean_horizontal(
-                        "comp_overall", "assign_overall", "staff_overall"
-                    )
-                    .alias("overall")
-                )
-
-                unit_score_df = (
-                    refined_df.with_columns(pl.col("unit").replace("", None))
-                    .group_by("unit")
-                    .agg(
-                        pl.col("comp_overall").mean().alias("comp_overall"),
-                        pl.col("assign_overall").mean().alias("assign_overall"),
-                        pl.col("staff_overall").mean().alias("staff_overall"),
-                        ((pl.col("comp_overall").mean() + pl.col("assign_overall").mean() + pl.col("staff_overall").mean()) / 3).alias("overall"),
-                    )
-                    .drop_nulls("unit")
-                    .rename({"unit": "units_areas_roles"})
-                )
-
-                area_score_df = (
-                    refined_df.with_columns(pl.col("area").replace("", None))
-                    .group_by("area")
-                    .agg(
-                        pl.col("comp_overall").mean().alias("comp_overall"),
-                        pl.col("assign_overall").mean().alias("assign_overall"),
-                        pl.col("staff_overall").mean().alias("staff_overall"),
-                        ((pl.col("comp_overall").mean() + pl.col("assign_overall").mean() + pl.col("staff_overall").mean()) / 3).alias("overall"),
-                    )
-                    .drop_nulls("area")
-                    .rename({"area": "units_areas_roles"})
-                )
-
-                role_score_df = (
-                    refined_df.with_columns(pl.col("role").replace("", None))
-                    .group_by("role")
-                    .agg(
-                        pl.col("comp_overall").mean().alias("comp_overall"),
-                        pl.col("assign_overall").mean().alias("assign_overall"),
-                        pl.col("staff_overall").mean().alias("staff_overall"),
-                        ((pl.col("comp_overall").mean() + pl.col("assign_overall").mean() + pl.col("staff_overall").mean()) / 3).alias("overall"),
-                    )
-                    .drop_nulls("role")
-                    .rename({"role": "units_areas_roles"})
-                )
-                units_areas_roles_scores_df = pl.concat(
-                    [unit_score_df, area_score_df, role_score_df], how="vertical"
-                )
-
-                self.overall_hospital_scores = hospital_score_df.to_dicts()[0]
-                self.units_areas_roles_hospital_scores = (
-                    units_areas_roles_scores_df.to_dicts()
-                )
-
-        except Exception as e:
-            traceback.print_exc()
-            logger.critical(e)
-
-    def load_review_info(self) -> None:
-        try:
-            if self.report_info:
-                review_df = (
-                    pl.DataFrame(copy.deepcopy(self.report_info))
-                )
-
-                refined_df = (
-                    review_df
-                    .select(
-                        pl.coalesce(
-                            [
-                                pl.col("assignment").struct.field("unit").struct.field("entered_unit").replace("", None),
-                                pl.col("assignment").struct.field("unit").struct.field("selected_unit").replace("", None),
-                            ]
-                        ).alias("unit"),
-                        pl.coalesce(
-                            [
-                                pl.col("assignment").struct.field("area").struct.field("entered_area").replace("", None),
-                                pl.col("assignment").struct.field("area").struct.field("selected_area").replace("", None),
-                            ]
-                        ).alias("area"),
-                        pl.coalesce(
-                            [
-                                pl.col("assignment").struct.field("role").struct.field("entered_role").replace("", None),
-                                pl.col("assignment").struct.field("role").struct.field("selected_role").replace("", None),
-                            ]
-                        ).alias("role"),
-
-                        pl.col("compensation").struct.field("comments").alias("comp_comments").replace("", None),
-                        pl.col("assignment").struct.field("comments").alias("assign_comments").replace("", None),
-                        pl.col("staffing").struct.field("comments").alias("staff_comments").replace("", None),
-                        pl.col("social").struct.field("likes").alias("likes"),
-                        pl.col("social").struct.field("tags").alias("tags"),
-
-                        pl.when(
-                            pl.col("modified_at").is_not_null()
-                        )
-                        .then(
-                            pl.col("modified_at").alias("timestamp")
-                        )
-                        .otherwise(
-                            pl.col("submitted_at").alias("timestamp")
-                        )
-                    )
-                    .filter(
-                        pl.any_horizontal(
-                            [
-                                pl.col("comp_comments").is_not_null(),
-                                pl.col("assign_comments").is_not_null(),
-                                pl.col("staff_comments").is_not_null(),
-                            ]
-                        )
-                    )
-                    .with_columns(
-                        pl.col("timestamp").map_elements(lambda ts: humanize.naturaltime(datetime.fromisoformat(ts)), return_dtype=pl.String).alias("time_ago")
-                    )
-                )
-
-                refined_df = (
-                    refined_df.select(
-                        pl.coalesce(
-                            [
-                                pl.col("unit"),
-                                pl.col("area"),
-                                pl.col("role")
-                            ]
-                        ).alias("units_areas_roles"),
-                        pl.col("comp_comments"),
-                        pl.col("assign_comments"),
-                        pl.col("staff_comments"),
-                        pl.col("likes"),
-                        pl.col("tags"),
-                        pl.col("timestamp"),
-                        pl.col("time_ago")
-                    )
-                )
-
-                self.review_info = refined_df.to_dicts()
+        analytics = copy.deepcopy(entry["analytics"])
+        # Score rows stay on the backend with their display fields, and are
+        # only sent to the client through the ratings table vars.
+        self._hospital_scores = [
+            {**row, **score_display(row)}
+            for row in analytics.pop("units_areas_roles_hospital_scores")
+        ]
+        for key, value in analytics.items():
+            setattr(self, key, value)
+        await self.load_review_page(first=True)
 
-        except Exception as e:
-            logger.critical(e)
+        baselines = state_pay_baselines.get(self.hospital_info["hosp_state_abbr"])
+        for key, value in copy.deepcopy(baselines).items():
+            setattr(self, key, value)
 
     def event_state_like_unlike_review(
         self, review_to_edit: dict[str, str | list | bool]
@@ -730,8 +444,11 @@ class HospitalState(UserState):
         try:
             if self.user_info["user_id"] in review_to_edit["likes"]:
                 review_to_edit["likes"].remove(self.user_info["user_id"])
+                # Lets the digest net out likes taken back before it runs.
+                event = "review_unliked"
             else:
                 review_to_edit["likes"].append(self.user_info["user_id"])
+                event = "review_liked"
 
             update_data = {
                 "report_id": review_to_edit["report_id"],
@@ -740,8 +457,17 @@ class HospitalState(UserState):
             self.query().admin().table("reports").eq(
                 "report_id", update_data["report_id"]
             ).update(update_data, return_="minimal").execute()
-
-            for review in self.review_info:
+            # Only recorded once the write went through.
+            record_event(
+                event,
+                report_id=update_data["report_id"],
+                user_id=self.user_info["user_id"],
+            )
+            hospital_analytics.update_likes(
+                self.hosp_id, update_data["report_id"], update_data["likes"]
+            )
+
+            for review in self.review_page:
                 if review["report_id"] == update_data["report_id"]:
                     review["likes"] = update_data["likes"]
                     review["likes_number"] = len(update_data["likes"])
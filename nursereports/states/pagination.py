@@ -0,0 +1,19 @@
+"""
+Slicing paginator shared by states. Backing lists are kept in display order
+when they're assigned, so a page is one slice of page_size items and a
+computed var built on it only reruns when its list or page number changes.
+"""
+
+from typing import Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+def page_slice(items: Sequence[T], page: int, page_size: int) -> list[T]:
+    """Items on a 1-based page."""
+    start = (max(page, 1) - 1) * page_size
+    return list(items[start : start + page_size])
+
+
+def page_count(total: int, page_size: int) -> int:
+    return (total + page_size - 1) // page_size
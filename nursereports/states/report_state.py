@@ -1,15 +1,18 @@
 from . import constants_types
+from ..server.analytics import hospital_analytics
+from ..server.cache import hospital_row_cache
+from ..server.moderation import PENDING_MODERATION, moderation_queue, moderation_text
+from ..server.notifications import record_event
 from ..states import HospitalState, PageState
+from .hospital_state import fetch_hospital_row, hospital_summary
 from datetime import datetime, timezone
 from loguru import logger
-import httpx
-from typing import Callable, Iterable, Literal
+from typing import AsyncIterator, Callable, Iterable, Literal
 
+import asyncio
 import copy
-import json
 import uuid
 import reflex as rx
-import textwrap
 
 # Import our .env from rx.config
 _config = rx.config.get_config()
@@ -23,8 +26,9 @@ class ReportState(PageState):
     # CMS ID pulled from URL parameters.
     hospital_id: str
 
-    # Dict of hospital data pulled from /hospital.
-    hospital_info: dict[str, str | int | list | dict | None]
+    # Display fields of the hospital row. The full row, departments included,
+    # stays in hospital_row_cache under hospital_id.
+    hospital_info: dict[str, str | None]
 
     # Generated uuid for the current report.
     report_id: str
@@ -55,7 +59,9 @@ class ReportState(PageState):
             else:
                 yield rx.redirect("/dashboard")
 
-    def event_state_edit_user_report(self, report_id: str, hospital_id: str) -> Iterable[Callable]:
+    async def event_state_edit_user_report(
+        self, report_id: str, hospital_id: str
+    ) -> AsyncIterator[Callable]:
         """
         Loads report data into state for user to make edits.
         """
@@ -69,19 +75,19 @@ class ReportState(PageState):
             self.hospital_id = hospital_id
 
             # Load report to edit into state.
-            result = self.query().table("reports").eq("report_id", report_id).select("*").execute()
+            result = self.select_rows("reports", filters={"report_id": f"eq.{report_id}"})
             report = result[0] if result else None
 
             # Load hospital info into state.
-            result = self.query().table("hospitals_v2").eq("hosp_id", self.hospital_id).select("*").execute()
-            self.hospital_info = result[0]
+            hospital_row = await self.load_hospital_row()
+            self.hospital_info = hospital_summary(hospital_row)
 
             # Set available units/areas/roles for user selection to state.
-            self.hospital_units = list(self.hospital_info.get("departments", {}).get("units", []))
+            self.hospital_units = list(hospital_row.get("departments", {}).get("units", []))
             self.hospital_units.append("I don't see my unit")
-            self.hospital_areas = list(self.hospital_info.get("departments", {}).get("areas", []))
+            self.hospital_areas = list(hospital_row.get("departments", {}).get("areas", []))
             self.hospital_areas.append("I don't see my area")
-            self.hospital_roles = list(self.hospital_info.get("departments", {}).get("roles", []))
+            self.hospital_roles = list(hospital_row.get("departments", {}).get("roles", []))
             self.hospital_roles.append("I don't see my role")
 
             # Set up report_dict
@@ -186,7 +192,22 @@ class ReportState(PageState):
             yield rx.toast.error("Error while retrieving report details.")
             yield ReportState.set_user_is_loading(False)
 
-    def event_state_create_full_report(self, hospital_id: str) -> Iterable[Callable]:
+    async def load_hospital_row(self) -> dict[str, str | int | list | dict | None]:
+        """
+        The reported hospital's row from supabase, through hospital_row_cache.
+        Read live rather than from the directory snapshot, since the
+        moderation queue adds departments between snapshot rebuilds. The
+        cache may wait on another session's fetch, so it runs in a worker
+        thread instead of on the event loop.
+        """
+        hosp_id, access_token = self.hospital_id, self.access_token or None
+        return await asyncio.to_thread(
+            hospital_row_cache.get_or_set,
+            hosp_id,
+            lambda: fetch_hospital_row(hosp_id, access_token),
+        )
+
+    async def event_state_create_full_report(self, hospital_id: str) -> AsyncIterator[Callable]:
         """
         Resets and prepares report state for user to make a new report.
         """
@@ -201,15 +222,15 @@ class ReportState(PageState):
             self.hospital_id = hospital_id
 
             # Get hospital info by CMS ID and set to state.
-            result = self.query().table("hospitals_v2").eq("hosp_id", self.hospital_id).select("*").execute()
-            self.hospital_info = result[0]
+            hospital_row = await self.load_hospital_row()
+            self.hospital_info = hospital_summary(hospital_row)
 
             # Set available units/areas/roles for user selection to state.
-            self.hospital_units = list(self.hospital_info.get("departments", {}).get("units", []))
+            self.hospital_units = list(hospital_row.get("departments", {}).get("units", []))
             self.hospital_units.append("I don't see my unit")
-            self.hospital_areas = list(self.hospital_info.get("departments", {}).get("areas", []))
+            self.hospital_areas = list(hospital_row.get("departments", {}).get("areas", []))
             self.hospital_areas.append("I don't see my area")
-            self.hospital_roles = list(self.hospital_info.get("departments", {}).get("roles", []))
+            self.hospital_roles = list(hospital_row.get("departments", {}).get("roles", []))
             self.hospital_roles.append("I don't see my role")
 
             # Set user dict data to state.
@@ -1006,6 +1027,19 @@ class ReportState(PageState):
                     close_button=True,
                 )
 
+            # Entries are moderated after the write, so mark the report unmoderated until then.
+            job_location, comments = moderation_text(
+                self.assign_input_unit,
+                self.assign_input_area,
+                self.assign_input_role,
+                self.comp_input_comments,
+                self.assign_input_comments,
+                self.staffing_input_comments,
+            )
+            self.report_dict["moderation"] = (
+                dict(PENDING_MODERATION) if job_location or comments else {"flagged": 0, "reason": ""}
+            )
+
             # Ensures that no report UUID's conflict. Submit either full report or update existing report.
             result = self.query().table("reports").eq("report_id", self.report_dict["report_id"]).select("*").execute()
             report = result[0] if result else None
@@ -1021,6 +1055,16 @@ class ReportState(PageState):
             if not report:
                 self.report_dict["submitted_at"] = str(datetime.now(timezone.utc).isoformat(timespec="seconds"))
                 self.query().table("reports").insert(self.report_dict, return_="minimal").execute()
+                record_event(
+                    "hospital_report",
+                    hosp_id=self.report_dict["hospital_id"],
+                    hosp_name=self.hospital_info.get("hosp_name", ""),
+                    report_id=self.report_dict["report_id"],
+                    user_id=self.user_claims_id,
+                )
+
+            # Fold the written report into materialized analytics for its hospital.
+            hospital_analytics.apply_report(self.report_dict["hospital_id"], copy.deepcopy(self.report_dict))
 
             # Update user data with relevant info once report is submitted.
             updated_status: str = "active"
@@ -1065,39 +1109,23 @@ class ReportState(PageState):
                 }
             )
 
-            # Moderate our unit/area/role and comment entries
-            self.moderate_user_entries()
-
-            # Send update to unit/area/role if moderation ok or unmoderated AND entries present.
-            if self.report_dict.get("moderation", {}).get("flagged", 0) in {0, 2} and (
-                self.assign_input_unit
-                or self.assign_input_area
-                or self.assign_input_role
-            ):
-                units = self.hospital_info.get("departments", {}).get("units", [])
-                updated_units = list(
-                    set(units) | set(filter(None, [self.assign_input_unit.upper()]))
-                )
-
-                areas = self.hospital_info.get("departments", {}).get("areas", [])
-                updated_areas = list(
-                    set(areas) | set(filter(None, [self.assign_input_area.upper()]))
-                )
-
-                roles = self.hospital_info.get("departments", {}).get("roles", [])
-                updated_roles = list(
-                    set(roles) | set(filter(None, [self.assign_input_role.upper()]))
+            # Moderate our unit/area/role and comment entries in the background.
+            # Department updates follow moderation in the worker.
+            if job_location or comments:
+                moderation_queue.enqueue(
+                    {
+                        "report_id": self.report_dict["report_id"],
+                        "hospital_id": self.report_dict["hospital_id"],
+                        "user_id": self.user_claims_id,
+                        "job_location": job_location,
+                        "comments": comments,
+                        "unit": self.assign_input_unit,
+                        "area": self.assign_input_area,
+                        "role": self.assign_input_role,
+                    }
                 )
-
-                hospital_updates = {}
-                hospital_updates["departments"] = {
-                    "units": updated_units,
-                    "areas": updated_areas,
-                    "roles": updated_roles,
-                }
-                self.query().admin().table("hospitals_v2").eq(
-                    "hosp_id", self.hospital_id
-                ).update(hospital_updates, return_="minimal").execute()
+            else:
+                logger.debug(f"{self.user_claims_id} hasn't entered any content to be moderated.")
 
             # Redirect user to the completed page for fireworks!
             self.reset()
@@ -1110,84 +1138,3 @@ class ReportState(PageState):
                 "Failed to submit report to database.", close_button=True
             )
             return ReportState.set_user_is_loading(False)
-
-    def moderate_user_entries(self) -> None:
-        """
-        Send all user entered fields to AI for moderation.
-        """
-        try:
-            job_location = f"{self.assign_input_unit} {self.assign_input_area} {self.assign_input_role}".strip()
-            comments = f"{self.comp_input_comments} {self.assign_input_comments} {self.staffing_input_comments}".strip()
-
-            if job_location or comments:
-                if not job_location:
-                    job_location = "EMPTY"
-                if not comments:
-                    comments = "EMPTY"
-                response = httpx.post(
-                    url=f"{_config.openrouter_api_url}",
-                    headers={
-                        "Authorization": f"Bearer {_config.openrouter_key}",
-                        "X-OpenRouter-Title": "NurseReports",
-                    },
-                    json={
-                        "model": f"{_config.openrouter_moderator_model}",
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": textwrap.dedent("""
-                                    Moderate entries for nurse review site. Output responses as JSON.
-                                    Nurses are allowed to submit info about pay, staffing, or work environment.
-                                    Under key 'flagged', output 1 for bad submissions containing violence, protected
-                                    health info, off-topic entries, spam, advertisements, racism, sexism, or doxxing.
-                                    If valid output a 0. Profanity and strong emotions OK given it's on topic.
-                                    Under key 'reason', if entry flagged give brief rationale otherwise output ''.
-                                    """),
-                            },
-                            {
-                                "role": "user",
-                                "content": f"User location or role: {job_location}. User comments: {comments}",
-                            },
-                        ],
-                        "temperature": 0.7,
-                        "max_tokens": 1024,
-                        "response_format": {"type": "json_object"},
-                    },
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                content = json.loads(response.json()["choices"][0]["message"]["content"])
-
-                # If moderation successful assign result, else assign an unmoderated result.
-                if "flagged" and "reason" in content:
-                    self.report_dict["moderation"] = content
-                else:
-                    self.report_dict["moderation"] = {
-                        "flagged": 2,
-                        "reason": "Unmoderated due to incorrectly structured moderation output.",
-                    }
-
-                # Send moderation results to report in database.
-                if self.report_dict.get("moderation", {}).get("flagged", 0) in {1, 2}:
-                    logger.debug(
-                        "User entries were either flagged or unmoderated. Sending updates to database."
-                    )
-                    data = {}
-                    data["report_id"] = self.report_id
-                    data["moderation"] = self.report_dict.get("moderation").copy()
-                    self.query().table("reports").eq(
-                        "report_id", data["report_id"]
-                    ).update(data, return_="minimal").execute()
-                else:
-                    logger.debug(
-                        f"Entries for report {self.report_id} by {self.user_claims_id} are cleared by {ai_moderation_model}"
-                    )
-
-            else:
-                logger.debug(
-                    f"{self.user_claims_id} hasn't entered any content to be moderated."
-                )
-        except Exception:
-            import traceback
-            traceback.print_exc()
-            logger.warning(f"Moderation for {self.user_claims_id} failed.")
@@ -1,11 +1,17 @@
 from ..client.components.dicts import state_to_abbr_dict
+from ..server.search import hospital_search_index
 from ..states.auth_state import AuthState
+from .pagination import page_count, page_slice
 
 from loguru import logger
 from typing import Callable, Iterable
 
+import asyncio
 import reflex as rx
 
+# Quiet period after a keystroke before suggestions are looked up.
+SUGGESTION_DEBOUNCE_SECONDS = 0.15
+
 
 class SearchState(AuthState):
     # ---------------------------------------------------------------------------
@@ -17,16 +23,16 @@ class SearchState(AuthState):
     current_search_page: int = 1
     _search_page_size: int = 10
 
-    @rx.var
+    # Bumped on every query change; lookups only apply results for the latest.
+    _query_generation: int = 0
+
+    @rx.var(cache=True, deps=["search_results", "current_search_page", "_search_page_size"], auto_deps=False)
     def paginated_search_results(self) -> list[dict]:
-        start = (self.current_search_page - 1) * self._search_page_size
-        return self.search_results[start : start + self._search_page_size]
+        return page_slice(self.search_results, self.current_search_page, self._search_page_size)
 
-    @rx.var
+    @rx.var(cache=True, deps=["search_results", "_search_page_size"], auto_deps=False)
     def num_search_pages(self) -> int:
-        if not self.search_results:
-            return 1
-        return (len(self.search_results) + self._search_page_size - 1) // self._search_page_size
+        return max(page_count(len(self.search_results), self._search_page_size), 1)
 
     search_is_loading: bool = False
     quick_search_is_loading: bool = False
@@ -44,66 +50,56 @@ class SearchState(AuthState):
     def _text_search(self, query: str, limit: int) -> list[dict]:
         """
         Return up to `limit` hospitals matching `query`.
-        Priority: hospital name matches first, then city matches to fill remainder.
-        Results are deduplicated by hosp_id.
+        Priority: hospital name matches first, then city and address matches
+        to fill remainder. Served from the in-memory hospital search index.
         """
-        cols = "hosp_name,hosp_city,hosp_state,hosp_id,hosp_addr"
-
-        # Step 1 — name matches
-        name_results: list[dict] = (
-            self.query()
-            .table("hospitals_v2")
-            .ilike("hosp_name", f"%{query}%")
-            .select(cols)
-            .execute()
-        )[:limit]
-
-        # Step 2 — fill remainder from city matches (deduplicated)
-        if len(name_results) < limit:
-            needed = limit - len(name_results)
-            seen = {h["hosp_id"] for h in name_results}
-            city_results: list[dict] = (
-                self.query()
-                .table("hospitals_v2")
-                .ilike("hosp_city", f"%{query}%")
-                .select(cols)
-                .execute()
-            )
-            for h in city_results:
-                if h["hosp_id"] not in seen and needed > 0:
-                    name_results.append(h)
-                    needed -= 1
-
-        # Normalize casing
-        for h in name_results:
-            h["hosp_city"] = h["hosp_city"].title()
-            h["hosp_addr"] = h["hosp_addr"].title()
-
-        return name_results
+        return hospital_search_index.search(query, limit)
 
     # ---------------------------------------------------------------------------
     # Event handlers
     # ---------------------------------------------------------------------------
 
-    async def event_state_update_query(self, value: str):
-        """Update search query and refresh autocomplete suggestions."""
+    def event_state_update_query(self, value: str) -> Callable | None:
+        """
+        Update search query and start a suggestion lookup for it. The query
+        is only ever set here, in keystroke order, so a slow lookup can't
+        roll back what the user typed.
+        """
         self.search_query = value
+        self._query_generation += 1
         if len(value) < 2:
             self.search_suggestions = []
             self.suggestions_visible = False
             self.quick_search_is_loading = False
-            return
+            return None
         self.quick_search_is_loading = True
-        yield
+        return SearchState.event_state_fetch_suggestions(value, self._query_generation)
+
+    @rx.event(background=True)
+    async def event_state_fetch_suggestions(self, value: str, generation: int):
+        """
+        Refresh autocomplete suggestions. Runs as a background task so
+        keystrokes don't queue behind each other; it waits out the debounce
+        window and drops itself, or its results, if a newer keystroke has
+        arrived in the meantime. Only writes the suggestion results.
+        """
+        await asyncio.sleep(SUGGESTION_DEBOUNCE_SECONDS)
+        async with self:
+            if generation != self._query_generation:
+                return
+
         try:
-            results = self._text_search(value, limit=5)
-            self.search_suggestions = results
-            self.suggestions_visible = bool(results)
+            results = await asyncio.to_thread(self._text_search, value, 5)
         except Exception as e:
             logger.warning(f"Suggestion fetch failed: {e}")
-            self.search_suggestions = []
-            self.suggestions_visible = False
-        finally:
+            results = []
+
+        async with self:
+            if generation != self._query_generation:
+                logger.debug(f"Discarded stale suggestions for '{value}'.")
+                return
+            self.search_suggestions = results
+            self.suggestions_visible = bool(results)
             self.quick_search_is_loading = False
 
     def next_search_page(self) -> None:
@@ -116,8 +112,10 @@ class SearchState(AuthState):
 
     def event_state_hide_suggestions(self) -> None:
         """Collapse the autocomplete dropdown."""
+        self._query_generation += 1
         self.suggestions_visible = False
         self.search_suggestions = []
+        self.quick_search_is_loading = False
 
     def event_state_full_search(self) -> Iterable[Callable]:
         """Run full search returning up to 20 results, then clear suggestions."""
@@ -125,6 +123,8 @@ class SearchState(AuthState):
             if len(self.search_query) < 2:
                 return rx.toast.error("Please enter at least 2 characters.")
             self.search_is_loading = True
+            self._query_generation += 1
+            self.quick_search_is_loading = False
             self.suggestions_visible = False
             self.search_suggestions = []
             self.current_search_page = 1
@@ -137,6 +137,7 @@ class SearchState(AuthState):
 
     def event_state_clear_search(self) -> None:
         """Clear all search state."""
+        self._query_generation += 1
         self.search_query = ""
         self.search_suggestions = []
         self.suggestions_visible = False
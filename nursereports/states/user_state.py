@@ -1,6 +1,10 @@
+from ..server.analytics import hospital_analytics
 from ..server.exceptions import RequestFailed
-from ..server.mailgun import mailgun_send_email
+from ..server.hospitals import hospital_directory
+from ..server.mailgun import mail_outbox
+from ..server.supabase import fan_out, supabase_select
 from ..states.auth_state import AuthState
+from .pagination import page_count, page_slice
 
 from datetime import datetime, timezone
 from loguru import logger
@@ -8,12 +12,61 @@ from typing import Callable, Iterable
 
 import copy
 import humanize
-import math
 import reflex as rx
 import time
 import traceback
 
 
+def fetch_saved_hospitals(saved: list[str], access_token: str | None = None) -> list[dict]:
+    """Display rows for saved hospital ids, from the directory where possible."""
+    if not saved:
+        return []
+
+    columns = "hosp_name,hosp_state,hosp_city,hosp_id,hosp_addr"
+    retrieved_hospitals = hospital_directory.get_many(saved, columns.split(","))
+
+    # Hospitals added since the directory snapshot was built.
+    found = {hospital["hosp_id"] for hospital in retrieved_hospitals}
+    missing = [hosp_id for hosp_id in saved if hosp_id not in found]
+    if missing:
+        retrieved_hospitals += supabase_select(
+            "hospitals_v2",
+            columns,
+            filters={"hosp_id": f"in.({','.join(missing)})"},
+            access_token=access_token,
+        )
+
+    for hospital in retrieved_hospitals:
+        hospital["hosp_city"] = hospital["hosp_city"].title()
+        hospital["hosp_addr"] = hospital["hosp_addr"].title()
+    return retrieved_hospitals
+
+
+def fetch_user_reports(user_id: str, access_token: str | None = None) -> list[dict]:
+    """A user's reports with display fields, newest first."""
+    reports = supabase_select(
+        "reports",
+        "report_id,hospital_id,assignment,hospital,created_at,modified_at",
+        filters={"user_id": f"eq.{user_id}"},
+        access_token=access_token,
+    )
+
+    for report in reports:
+        report["area"] = report["assignment"]["area"]["selected_area"] + report["assignment"]["area"]["entered_area"]
+        report["unit"] = report["assignment"]["unit"]["selected_unit"] + report["assignment"]["unit"]["entered_unit"]
+        report["role"] = report["assignment"]["role"]["selected_role"] + report["assignment"]["role"]["entered_role"]
+        report["hospital_city"] = report["hospital"]["city"].title()
+        report["hospital_state"] = report["hospital"]["state"]
+
+        report["time_ago"] = humanize.naturaltime(datetime.fromisoformat(report["created_at"]))
+        if report["modified_at"]:
+            report["time_ago"] = humanize.naturaltime(datetime.fromisoformat(report["modified_at"]))
+
+    # Kept newest first so pages are plain slices.
+    reports.sort(key=lambda report: report["modified_at"] or report["created_at"], reverse=True)
+    return reports
+
+
 class UserState(AuthState):
 
     MAX_HOSPITALS_DISPLAYED = 5
@@ -136,48 +189,24 @@ class UserState(AuthState):
         else:
             return True
 
-    @rx.var()
+    @rx.var(cache=True, deps=["user_saved_hospitals", "current_hospital_page"], auto_deps=False)
     def paginated_saved_hospitals(self) -> list[dict]:
-        if len(self.user_saved_hospitals) > self.MAX_HOSPITALS_DISPLAYED:
-            num_pages = math.ceil(len(self.user_saved_hospitals) / self.MAX_HOSPITALS_DISPLAYED)
-            num_pages_list = [ page for page in range(1, num_pages + 1) ]
-            paginated_hospitals = { number: [] for number in num_pages_list }
-            current_page = 1
-            for hospital in self.user_saved_hospitals:
-                if len(paginated_hospitals[current_page]) >= self.MAX_HOSPITALS_DISPLAYED:
-                    current_page += 1
-                paginated_hospitals[current_page].append(hospital)
-            return paginated_hospitals.get(self.current_hospital_page)
-        else:
-            return self.user_saved_hospitals
+        return page_slice(self.user_saved_hospitals, self.current_hospital_page, self.MAX_HOSPITALS_DISPLAYED)
 
-    @rx.var()
+    @rx.var(cache=True, deps=["user_reports", "current_report_page"], auto_deps=False)
     def paginated_user_reports(self) -> list[dict]:
-        if len(self.user_reports) > self.MAX_REPORTS_DISPLAYED:
-            num_pages = math.ceil(len(self.user_reports) / self.MAX_REPORTS_DISPLAYED)
-            num_pages_list = [ page for page in range(1, num_pages + 1) ]
-            paginated_reports = { number: [] for number in num_pages_list }
-            sorted_reports = sorted(self.user_reports, key=lambda report: report["modified_at"] or report["created_at"], reverse=True)
-            current_page = 1
-            for report in sorted_reports:
-                if len(paginated_reports[current_page]) >= self.MAX_REPORTS_DISPLAYED:
-                    current_page += 1
-                paginated_reports[current_page].append(report)
-            return paginated_reports.get(self.current_report_page)
-        else:
-            return sorted(self.user_reports, key=lambda report: report["modified_at"] or report["created_at"], reverse=True)
+        return page_slice(self.user_reports, self.current_report_page, self.MAX_REPORTS_DISPLAYED)
 
-    @rx.var
+    @rx.var(cache=True, deps=["user_saved_hospitals"], auto_deps=False)
     def num_hospital_pages(self) -> int:
-        return math.ceil(len(self.user_saved_hospitals) / self.MAX_HOSPITALS_DISPLAYED)
+        return page_count(len(self.user_saved_hospitals), self.MAX_HOSPITALS_DISPLAYED)
 
-    @rx.var
+    @rx.var(cache=True, deps=["user_reports"], auto_deps=False)
     def num_report_pages(self) -> int:
-        return math.ceil(len(self.user_reports) / self.MAX_REPORTS_DISPLAYED)
+        return page_count(len(self.user_reports), self.MAX_REPORTS_DISPLAYED)
 
     def next_hospital_page(self) -> None:
-        num_pages = math.ceil(len(self.user_saved_hospitals) / self.MAX_HOSPITALS_DISPLAYED)
-        if self.current_hospital_page < num_pages:
+        if self.current_hospital_page < self.num_hospital_pages:
             self.current_hospital_page += 1
 
     def previous_hospital_page(self) -> None:
@@ -185,8 +214,7 @@ class UserState(AuthState):
             self.current_hospital_page -= 1
 
     def next_report_page(self) -> None:
-        num_pages = math.ceil(len(self.user_reports) / self.MAX_REPORTS_DISPLAYED)
-        if self.current_report_page < num_pages:
+        if self.current_report_page < self.num_report_pages:
             self.current_report_page += 1
 
     def previous_report_page(self) -> None:
@@ -334,51 +362,33 @@ class UserState(AuthState):
         """
         Refreshes existing user's info in state, or creates new user if user info missing.
         """
-        result = self.query().table("users").select("*").execute()
+        result = self.select_rows("users")
         if result:
             self.user_info = result[0]
         else:
             self.create_new_user()
 
-        self.get_user_saved_hospitals()
-        self.get_user_reports()
+        # Saved hospitals and reports are independent, fetch them together. The
+        # workers get plain values and return rows, state is only set here.
+        saved = list(self.user_info.get("saved", {}).get("hospitals", []))
+        user_id = self.user_claims_id
+        access_token = self.access_token or None
+        self.user_saved_hospitals, self.user_reports = fan_out(
+            lambda: fetch_saved_hospitals(saved, access_token),
+            lambda: fetch_user_reports(user_id, access_token),
+        )
 
     def get_user_saved_hospitals(self) -> None:
         """Get or refresh saved hospitals."""
-        saved_hospital_list = self.user_info.get("saved", {}).get("hospitals", [])
-        if saved_hospital_list:
-            retrieved_hospitals = self.query().table("hospitals_v2").in_(
-                "hosp_id", saved_hospital_list
-            ).select("hosp_name,hosp_state,hosp_city,hosp_id,hosp_addr").execute()
-
-            for hospital in retrieved_hospitals:
-                hospital["hosp_city"] = hospital["hosp_city"].title()
-                hospital["hosp_addr"] = hospital["hosp_addr"].title()
-            self.user_saved_hospitals = retrieved_hospitals
-        else:
-            self.user_saved_hospitals = []
+        self.user_saved_hospitals = fetch_saved_hospitals(
+            self.user_info.get("saved", {}).get("hospitals", []), self.access_token or None
+        )
 
     def get_user_reports(self) -> None:
         """
         Get or refresh user reports.
         """
-        reports = self.query().table("reports").eq(
-            "user_id", self.user_claims_id
-        ).select("report_id,hospital_id,assignment,hospital,created_at,modified_at").execute()
-
-        if reports:
-            for report in reports:
-                report["area"] = report["assignment"]["area"]["selected_area"] + report["assignment"]["area"]["entered_area"]
-                report["unit"] = report["assignment"]["unit"]["selected_unit"] + report["assignment"]["unit"]["entered_unit"]
-                report["role"] = report["assignment"]["role"]["selected_role"] + report["assignment"]["role"]["entered_role"]
-                report["hospital_city"] = report["hospital"]["city"].title()
-                report["hospital_state"] = report["hospital"]["state"]
-
-                report["time_ago"] = humanize.naturaltime(datetime.fromisoformat(report["created_at"]))
-                if report["modified_at"]:
-                    report["time_ago"] = humanize.naturaltime(datetime.fromisoformat(report["modified_at"]))
-
-        self.user_reports = reports
+        self.user_reports = fetch_user_reports(self.user_claims_id, self.access_token or None)
 
     def update_user_info_and_sync_locally(
         self,
@@ -476,12 +486,17 @@ class UserState(AuthState):
         Removes own user's report from database.
         """
         try:
+            removed_reports = [
+                h for h in self.user_reports if report_id == h["report_id"]
+            ]
             updated_user_reports = [
                 h for h in self.user_reports if report_id != h["report_id"]
             ]
 
             self.query().table("reports").eq("report_id", report_id).delete().execute()
             self.user_reports = updated_user_reports
+            for report in removed_reports:
+                hospital_analytics.remove_report(report["hospital_id"], report_id)
 
             yield rx.toast.success("Removed report from our database.")
 
@@ -503,7 +518,7 @@ class UserState(AuthState):
 
             if wait_time >= 0:
                 if subject and text:
-                    yield mailgun_send_email(
+                    mail_outbox.enqueue(
                         "support@nursereports.org",
                         "jeremy.f.medlin@gmail.com",
                         subject,
@@ -562,9 +577,16 @@ class UserState(AuthState):
     async def event_state_update_email(self, form_data: dict):
         pass
 
+    def opt_in_preferences(self, key: str, value: bool) -> dict:
+        """Preference update for an opt-in toggle. Digests are sent to the sign-in email unless one is set."""
+        preferences = {key: value}
+        if value and not self.user_info.get("preferences", {}).get("email"):
+            preferences["email"] = self.user_claims_email
+        return preferences
+
     @rx.event
     def event_state_toggle_status_opt_in(self, value: bool):
-        self.update_user_info_and_sync_locally({"preferences": {"status_opt_in": value}})
+        self.update_user_info_and_sync_locally({"preferences": self.opt_in_preferences("status_opt_in", value)})
         if value:
             yield rx.toast.success("You'll recieve notifications about status updates.", close_button=True)
         else:
@@ -572,7 +594,7 @@ class UserState(AuthState):
 
     @rx.event
     def event_state_toggle_update_opt_in(self, value: bool):
-        self.update_user_info_and_sync_locally({"preferences": {"update_opt_in": value}})
+        self.update_user_info_and_sync_locally({"preferences": self.opt_in_preferences("update_opt_in", value)})
         if value:
             yield rx.toast.success("You'll recieve notifications about updates to the site or new features.", close_button=True)
         else:
@@ -581,7 +603,7 @@ class UserState(AuthState):
 
     @rx.event
     def event_state_toggle_social_opt_in(self, value: bool):
-        self.update_user_info_and_sync_locally({"preferences": {"social_opt_in": value}})
+        self.update_user_info_and_sync_locally({"preferences": self.opt_in_preferences("social_opt_in", value)})
         if value:
             yield rx.toast.success("You'll recieve notifications when users interact with you.", close_button=True)   
         else:
@@ -37,7 +37,8 @@ config = rx.Config(
     },
     openrouter_api_url=os.getenv("OPENROUTER_API_URL"),
     openrouter_key=os.getenv("OPENROUTER_KEY"),
-    openrouter_moderator_model="google/gemma-4-31b-it"
+    openrouter_moderator_model="google/gemma-4-31b-it",
     mailgun_url=os.getenv("MAILGUN_URL"),
     mailgun_api_key=os.getenv("MAILGUN_API_KEY"),
+    stats_token=os.getenv("STATS_TOKEN"),
 )
\ No newline at end of file
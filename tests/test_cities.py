@@ -0,0 +1,26 @@
+from nursereports.nursereports import app  # noqa: F401 - components import through the app
+from nursereports.client.components import cities, dicts
+
+
+def test_states_and_cities_in_state():
+    assert len(cities.states()) == 51
+    assert "Columbus" in cities.cities_in_state("oh")
+    assert cities.cities_in_state("XX") == []
+
+
+def test_prefix_lookup_is_case_insensitive_and_sorted():
+    matches = cities.cities_with_prefix("  dAyT", limit=50)
+
+    assert ("Dayton", "OH") in matches and ("Daytona Beach", "FL") in matches
+    assert all(city.casefold().startswith("dayt") for city, _ in matches)
+    assert [city.casefold() for city, _ in matches] == sorted(city.casefold() for city, _ in matches)
+
+
+def test_prefix_lookup_filters_and_limits():
+    assert cities.cities_with_prefix("dayton", state="oh") == [("Dayton", "OH")]
+    assert len(cities.cities_with_prefix("a", limit=3)) == 3
+    assert cities.cities_with_prefix("   ") == []
+
+
+def test_dicts_still_resolves_cities_by_state():
+    assert dicts.cities_by_state["OH"] == cities.cities_in_state("OH")
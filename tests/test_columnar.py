@@ -0,0 +1,57 @@
+from nursereports.server.analytics.columnar import reports_to_frame
+from nursereports.server.analytics.hospital import materialize_hospital_analytics
+
+
+def _report(report_id: str, **fields) -> dict:
+    """Report row in the overview projection."""
+    return {
+        "report_id": report_id,
+        "created_at": "2025-01-01T00:00:00+00:00",
+        "submitted_at": "2025-01-01T00:00:00+00:00",
+        "modified_at": None,
+        "emp_type": "Full-time",
+        "hourly": 40,
+        "weekly": None,
+        "total_experience": 5,
+        "selected_unit": "ICU",
+        "entered_unit": "",
+        "comp_overall": 4,
+        "assign_overall": 3,
+        "staff_overall": 2,
+        "comp_comments": "Fair pay.",
+        "assign_comments": "",
+        "staff_comments": "",
+        "likes": [],
+        "tags": [],
+        **fields,
+    }
+
+
+MALFORMED = _report(
+    "bad",
+    total_experience="5",
+    hourly="forty",
+    assign_overall="three",
+    comp_overall=9999,
+)
+
+
+def test_malformed_values_are_cast_or_nulled():
+    frame = reports_to_frame([_report("good"), MALFORMED])
+
+    bad = frame.row(1, named=True)
+    assert bad["total_experience"] == 5
+    assert bad["hourly"] is None
+    assert bad["assign_overall"] is None
+    assert bad["comp_overall"] is None
+    assert bad["staff_overall"] == 2
+
+
+def test_malformed_report_does_not_fail_hospital():
+    analytics = materialize_hospital_analytics([_report("good"), MALFORMED])
+
+    assert analytics["report_count"] == 2
+    assert analytics["units_areas_roles_for_units"] == ["Hospital Overall", "ICU"]
+    assert analytics["overall_hospital_scores"]["comp_overall"] == 4
+    assert len(analytics["extrapolated_ft_pay_hospital"]) == 27
+    assert [review["report_id"] for review in analytics["review_info"]] == ["good", "bad"]
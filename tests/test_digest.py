@@ -0,0 +1,124 @@
+from nursereports.server.notifications import NotificationSpool
+from nursereports.server.notifications import digest as digest_module
+from nursereports.server.notifications.digest import collect_digests, render_digest, run_digest
+
+import pytest
+
+USERS = [
+    {"id": "u1", "email": "u1@example.com", "status_opt_in": True, "social_opt_in": True,
+     "update_opt_in": True, "saved_hospitals": ["010001"]},
+    {"id": "u2", "email": "u2@example.com", "status_opt_in": True, "social_opt_in": True,
+     "update_opt_in": False, "saved_hospitals": ["010001"]},
+    {"id": "u3", "email": "", "status_opt_in": True, "saved_hospitals": ["010001"]},
+]
+OWNERS = {"r1": "u1", "r2": "u1"}
+
+
+class FakeOutbox:
+    """Marks batches sent unless they include an address in fail_for."""
+
+    def __init__(self, fail_for: set[str] = frozenset()):
+        self.fail_for = fail_for
+        self.sent: list[list[str]] = []
+        self.statuses: dict[str, dict] = {}
+
+    def enqueue(self, sender, recipients, subject, text, **fields):
+        message_id = f"m{len(self.statuses)}"
+        failed = bool(self.fail_for & set(recipients))
+        self.statuses[message_id] = {"status": "failed" if failed else "sent"}
+        if not failed:
+            self.sent.append(list(recipients))
+        return message_id
+
+    def join(self):
+        pass
+
+    def status(self, message_id):
+        return self.statuses.get(message_id)
+
+
+@pytest.fixture
+def spool(tmp_path, monkeypatch):
+    monkeypatch.setattr(digest_module, "fetch_digest_users", lambda: USERS)
+    monkeypatch.setattr(digest_module, "fetch_report_owners", lambda ids: OWNERS)
+    monkeypatch.setattr(digest_module, "MAILGUN_BATCH_LIMIT", 1)
+    return NotificationSpool(tmp_path / "events.jsonl")
+
+
+def test_events_reach_opted_in_users_with_email():
+    events = [
+        {"kind": "hospital_report", "hosp_id": "010001", "hosp_name": "Mercy", "user_id": "u2"},
+        {"kind": "report_flagged", "user_id": "u2", "reason": "Profanity."},
+        {"kind": "announcement", "text": "New feature."},
+    ]
+
+    digests = collect_digests(events, USERS, OWNERS)
+
+    assert set(digests) == {"u1", "u2"}
+    assert digests["u1"]["reports"] == {"010001": {"name": "Mercy", "count": 1}}
+    assert digests["u1"]["announcements"] == ["New feature."]
+    assert digests["u2"]["reports"] == {} and digests["u2"]["flagged"] == ["Profanity."]
+    assert digests["u2"]["announcements"] == []
+    assert render_digest(digests["u1"])[1] == 2
+
+
+def test_likes_count_each_liker_once():
+    events = [
+        {"kind": "review_liked", "report_id": "r1", "user_id": "u2"},
+        {"kind": "review_unliked", "report_id": "r1", "user_id": "u2"},
+        {"kind": "review_liked", "report_id": "r1", "user_id": "u2"},
+        {"kind": "review_liked", "report_id": "r1", "user_id": "u1"},
+        {"kind": "review_liked", "report_id": "r2", "user_id": "u2"},
+        {"kind": "review_unliked", "report_id": "r2", "user_id": "u2"},
+    ]
+
+    digests = collect_digests(events, USERS, OWNERS)
+
+    assert digests["u1"]["likes"] == {"r1": 1}
+    assert digests["u1"]["events"] == {0, 1, 2, 3}
+
+
+def test_recipients_limit_who_an_event_reaches():
+    events = [{"kind": "announcement", "text": "Hi.", "recipients": ["u2"]}]
+
+    assert collect_digests(events, USERS, OWNERS) == {}
+
+
+def test_drain_keeps_events_when_the_run_fails(spool):
+    spool.record("announcement", text="Hi.")
+
+    with pytest.raises(RuntimeError):
+        with spool.drain() as events:
+            assert len(events) == 1
+            raise RuntimeError("send failed")
+    spool.record("announcement", text="Again.")
+
+    with spool.drain() as events:
+        assert [event["text"] for event in events] == ["Hi.", "Again."]
+    with spool.drain() as events:
+        assert events == []
+
+
+def test_only_unsent_recipients_are_retried(spool):
+    spool.record("hospital_report", hosp_id="010001", hosp_name="Mercy", user_id="u9")
+    outbox = FakeOutbox(fail_for={"u2@example.com"})
+
+    run_digest(spool, outbox)
+
+    assert outbox.sent == [["u1@example.com"]]
+    assert [event["recipients"] for event in spool.read()] == [["u2"]]
+
+    retry = FakeOutbox()
+    run_digest(spool, retry)
+
+    assert retry.sent == [["u2@example.com"]]
+    assert spool.read() == []
+
+
+def test_dry_run_leaves_events(spool):
+    spool.record("announcement", text="Hi.")
+
+    digests = run_digest(spool, FakeOutbox(), dry_run=True)
+
+    assert set(digests) == {"u1"}
+    assert len(spool.read()) == 1
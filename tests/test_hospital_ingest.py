@@ -0,0 +1,78 @@
+from nursereports.server.hospitals import diff_hospitals, normalize_cms_id, read_hospital_rows
+
+import importlib
+import openpyxl
+import pytest
+
+# The package re-exports the ingest() function under the module's name.
+ingest_module = importlib.import_module("nursereports.server.hospitals.ingest")
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(10001, "010001"), (10001.0, "010001"), (" 05a123 ", "05A123"), ("12-345", None), (None, None)],
+)
+def test_normalize_cms_id(value, expected):
+    assert normalize_cms_id(value) == expected
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "hospitals.xlsx"
+    book = openpyxl.Workbook()
+    sheet = book.active
+    sheet.title = "Acute Hospitals"
+    sheet.append(["Hospital list 2025"])
+    sheet.append(["ID", "Name", "Address", "City", "State", "Zip"])
+    sheet.append([10001, "Mercy  General", "1 Main St", "Dayton", "OH", 4501])
+    sheet.append(["bad id", "Nowhere", "", "", "", ""])
+    sheet.append(["020002", "St. Luke", "2 Elm St", "Austin", "TX", "78701"])
+    book.save(path)
+    return path
+
+
+def test_workbook_rows_are_normalized(workbook):
+    rows = list(read_hospital_rows(str(workbook)))
+
+    assert rows == [
+        {"hosp_id": "010001", "hosp_name": "Mercy General", "hosp_addr": "1 Main St",
+         "hosp_city": "Dayton", "hosp_state": "OH", "hosp_zip": "04501"},
+        {"hosp_id": "020002", "hosp_name": "St. Luke", "hosp_addr": "2 Elm St",
+         "hosp_city": "Austin", "hosp_state": "TX", "hosp_zip": "78701"},
+    ]
+
+
+def test_diff_keeps_only_new_and_changed_hospitals():
+    existing = {
+        "010001": {"hosp_id": "010001", "hosp_name": "Mercy", "hosp_state": "OH"},
+        "020002": {"hosp_id": "020002", "hosp_name": "St. Luke", "hosp_state": "TX"},
+    }
+    incoming = [
+        {"hosp_id": "010001", "hosp_name": "Mercy", "hosp_state": "OH"},
+        {"hosp_id": "020002", "hosp_name": "St. Luke's", "hosp_state": "TX"},
+        {"hosp_id": "030003", "hosp_name": "Old name", "hosp_state": "AZ"},
+        {"hosp_id": "030003", "hosp_name": "Valley", "hosp_state": "AZ"},
+    ]
+
+    new, changed = diff_hospitals(incoming, existing)
+
+    assert [hospital["hosp_name"] for hospital in new] == ["Valley"]
+    assert [hospital["hosp_name"] for hospital in changed] == ["St. Luke's"]
+
+
+def test_ingest_writes_departments_only_for_new_hospitals(workbook, monkeypatch):
+    upserts = []
+    existing = [{"hosp_id": "010001", "hosp_name": "Mercy", "hosp_addr": "1 Main St",
+                 "hosp_city": "Dayton", "hosp_state": "OH", "hosp_zip": "04501"}]
+    monkeypatch.setattr(ingest_module, "supabase_select_all", lambda *args, **kwargs: existing)
+    monkeypatch.setattr(ingest_module, "supabase_upsert", lambda table, rows, **kwargs: upserts.append(rows))
+
+    assert ingest_module.ingest(str(workbook), dry_run=True) == {"existing": 1, "new": 1, "changed": 1}
+    assert upserts == []
+
+    ingest_module.ingest(str(workbook))
+
+    changed, new = upserts
+    assert changed[0]["hosp_name"] == "Mercy General" and "departments" not in changed[0]
+    assert new[0]["hosp_id"] == "020002"
+    assert new[0]["departments"] == ingest_module.EMPTY_DEPARTMENTS
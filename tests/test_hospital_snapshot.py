@@ -0,0 +1,48 @@
+from nursereports.server.hospitals import HospitalDirectory, build_snapshot
+
+import os
+
+ROWS = [
+    {"hosp_id": "020002", "hosp_name": "St. Luke", "hosp_city": "AUSTIN", "hosp_state": "TX"},
+    {"hosp_id": "010001", "hosp_name": "Mercy", "hosp_city": "DAYTON", "hosp_state": "OH",
+     "departments": {"units": ["ICU"]}},
+]
+
+
+def test_snapshot_lookups(tmp_path):
+    path = tmp_path / "hospitals.arrow"
+    assert build_snapshot(ROWS, path) == 2
+    directory = HospitalDirectory(path)
+
+    assert len(directory) == 2
+    assert directory.get("010001")["hosp_name"] == "Mercy"
+    assert "departments" not in directory.get("010001")
+    assert directory.get("999999") is None
+    assert directory.get_many(["020002", "999999", "010001"], ["hosp_id"]) == [
+        {"hosp_id": "020002"}, {"hosp_id": "010001"}
+    ]
+    assert directory.rows(["hosp_state"]) == [{"hosp_state": "OH"}, {"hosp_state": "TX"}]
+
+
+def test_missing_snapshot_falls_back(tmp_path):
+    directory = HospitalDirectory(tmp_path / "missing.arrow")
+
+    assert not directory.load()
+    assert len(directory) == 0
+    assert directory.get("010001") is None
+    assert directory.get_many(["010001"]) == []
+    assert directory.rows(["hosp_id"]) is None
+
+
+def test_rebuild_is_picked_up_and_changes_version(tmp_path):
+    path = tmp_path / "hospitals.arrow"
+    build_snapshot(ROWS[:1], path)
+    directory = HospitalDirectory(path, check_interval=0)
+    first = directory.version
+
+    build_snapshot(ROWS, path)
+    os.utime(path, (first + 10, first + 10))
+
+    assert directory.get("010001")["hosp_name"] == "Mercy"
+    assert directory.version == first + 10
+    assert not path.with_suffix(".partial").exists()
@@ -0,0 +1,110 @@
+from nursereports.server.mailgun.outbox import MailOutbox
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+import json
+import pytest
+import threading
+
+
+class FakeMailgun(ThreadingHTTPServer):
+    """Answers with the queued status codes in order, then 200."""
+
+    def __init__(self, statuses: list[int]):
+        super().__init__(("127.0.0.1", 0), FakeMailgunHandler)
+        self.statuses = list(statuses)
+        self.received: list[dict] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/messages"
+
+
+class FakeMailgunHandler(BaseHTTPRequestHandler):
+    server: FakeMailgun
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode()
+        self.server.received.append(parse_qs(body))
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        data = json.dumps({"id": f"<mg-{len(self.server.received)}>"}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def mailgun():
+    servers: list[FakeMailgun] = []
+
+    def start(statuses=()):
+        server = FakeMailgun(list(statuses))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _outbox(server, **options) -> MailOutbox:
+    return MailOutbox(backoff=0.01, url=server.url, api_key="test", **options)
+
+
+def test_message_is_sent_and_traced(mailgun):
+    server = mailgun()
+    outbox = _outbox(server)
+
+    message_id = outbox.enqueue("a@example.com", ["b@example.com", "c@example.com"], "Hi", "Hello")
+    outbox.join(timeout=5)
+
+    status = outbox.status(message_id)
+    assert status["status"] == "sent" and status["attempts"] == 1
+    assert status["mailgun_id"] == "<mg-1>"
+    assert server.received[0]["to"] == ["b@example.com", "c@example.com"]
+    assert outbox.stats() == {"pending": 0, "sent": 1, "failed": 0}
+
+
+def test_server_errors_are_retried(mailgun):
+    server = mailgun([503, 429])
+    outbox = _outbox(server)
+
+    message_id = outbox.enqueue("a@example.com", "b@example.com", "Hi", "Hello")
+    outbox.join(timeout=5)
+
+    assert outbox.status(message_id)["status"] == "sent"
+    assert outbox.status(message_id)["attempts"] == 3
+
+
+def test_client_errors_and_exhausted_retries_fail(mailgun):
+    server = mailgun([400, 500, 500])
+    outbox = _outbox(server, max_attempts=2)
+
+    rejected = outbox.enqueue("a@example.com", "b@example.com", "Hi", "Hello")
+    outbox.join(timeout=5)
+    exhausted = outbox.enqueue("a@example.com", "b@example.com", "Hi", "Hello")
+    outbox.join(timeout=5)
+
+    assert outbox.status(rejected) | {"queued_at": None} == {
+        "status": "failed", "attempts": 1, "queued_at": None, "error": "Mailgun returned 400."
+    }
+    assert outbox.status(exhausted)["attempts"] == 2
+    assert outbox.stats()["failed"] == 2
+
+
+def test_oldest_statuses_are_dropped(mailgun):
+    outbox = _outbox(mailgun(), max_statuses=2)
+
+    message_ids = [outbox.enqueue("a@example.com", "b@example.com", "Hi", str(n)) for n in range(3)]
+    outbox.join(timeout=5)
+
+    assert outbox.status(message_ids[0]) is None
+    assert all(outbox.status(message_id) for message_id in message_ids[1:])
@@ -0,0 +1,79 @@
+from nursereports.server.moderation import BatchModerator, ModerationVerdictCache, pack_batches
+from nursereports.server.moderation.stub import StubModerationServer
+
+import pytest
+import threading
+
+
+def _job(report_id: str, comments: str, location: str = "ICU") -> dict:
+    return {"report_id": report_id, "job_location": location, "comments": comments}
+
+
+@pytest.fixture
+def server():
+    server = StubModerationServer(("127.0.0.1", 0))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _moderator(server, **options) -> BatchModerator:
+    return BatchModerator(
+        backoff=0.01,
+        api_url=f"http://127.0.0.1:{server.server_address[1]}",
+        api_key="test",
+        model="test",
+        **options,
+    )
+
+
+def test_pack_batches_respects_entry_and_size_limits():
+    jobs = [_job(f"r{number}", "x" * 6, location="") for number in range(5)]
+
+    assert [len(batch) for batch in pack_batches(jobs, max_chars=100, max_entries=2)] == [2, 2, 1]
+    assert [len(batch) for batch in pack_batches(jobs, max_chars=13, max_entries=25)] == [2, 2, 1]
+    assert [len(batch) for batch in pack_batches([_job("big", "x" * 50)], max_chars=10)] == [1]
+
+
+def test_batches_map_verdicts_back_to_reports(server):
+    moderator = _moderator(server, max_entries=2, verdicts=None)
+
+    verdicts = moderator.moderate([
+        _job("r1", "Good staffing."),
+        _job("r2", "Buy my spam course."),
+        _job("r3", "Fair pay."),
+    ])
+
+    assert verdicts == {
+        "r1": {"flagged": 0, "reason": ""},
+        "r2": {"flagged": 1, "reason": "Entry contains spam."},
+        "r3": {"flagged": 0, "reason": ""},
+    }
+    assert server.requests == 2
+
+
+def test_duplicates_and_cached_entries_are_not_sent(server, tmp_path):
+    cache = ModerationVerdictCache(tmp_path / "verdicts.sqlite3")
+    cache.set("ICU", "Fair pay.", {"flagged": 0, "reason": ""})
+    moderator = _moderator(server, verdicts=cache)
+
+    verdicts = moderator.moderate([
+        _job("r1", "Fair pay."),
+        _job("r2", "Good staffing."),
+        _job("r3", "good  staffing."),
+    ])
+
+    assert server.requests == 1
+    assert verdicts["r2"] == verdicts["r3"] == {"flagged": 0, "reason": ""}
+    assert cache.get("ICU", "Good staffing.") == {"flagged": 0, "reason": ""}
+
+
+def test_failed_batches_come_back_unmoderated(server):
+    server.fail_remaining = 10
+    moderator = _moderator(server, max_attempts=2, verdicts=None)
+
+    verdicts = moderator.moderate([_job("r1", "Good staffing.")])
+
+    assert verdicts["r1"]["flagged"] == 2
+    assert server.requests == 2
@@ -0,0 +1,172 @@
+from nursereports.server.moderation import queue as queue_module
+from nursereports.server.moderation.queue import ModerationQueue, apply_department_updates
+from nursereports.server.moderation.stub import StubModerationServer
+
+import copy
+import json
+import pytest
+import threading
+
+
+class FakeHospitals:
+    """One hospitals_v2 row whose departments honour PostgREST eq/is.null filters."""
+
+    def __init__(self, departments: dict | None, concurrent: dict | None = None):
+        self.departments = departments
+        self.concurrent = concurrent
+        self.updates = 0
+
+    def select(self, table, columns="*", filters=None, admin=False, shared=True, **_):
+        assert not shared
+        return [{"departments": copy.deepcopy(self.departments)}]
+
+    def update(self, table, filters, data, admin=True, returning=None):
+        self.updates += 1
+        if self.concurrent is not None:
+            # Another worker writes between this job's read and its update.
+            self.departments, self.concurrent = self.concurrent, None
+        expected = filters["departments"]
+        if expected == "is.null":
+            matches = self.departments is None
+        else:
+            matches = json.loads(expected.removeprefix("eq.")) == self.departments
+        if not matches:
+            return []
+        self.departments = data["departments"]
+        return [{"hosp_id": "010001"}]
+
+
+@pytest.fixture
+def hospitals(monkeypatch):
+    def install(departments, concurrent=None):
+        fake = FakeHospitals(departments, concurrent)
+        monkeypatch.setattr(queue_module, "supabase_select", fake.select)
+        monkeypatch.setattr(queue_module, "supabase_update", fake.update)
+        return fake
+
+    return install
+
+
+def test_department_update_merges_into_null_departments(hospitals):
+    fake = hospitals(None)
+
+    apply_department_updates({"hospital_id": "010001", "unit": "icu", "area": None, "role": None})
+
+    assert fake.departments == {"units": ["ICU"], "areas": [], "roles": []}
+
+
+def test_department_update_keeps_a_concurrent_write(hospitals):
+    fake = hospitals(
+        {"units": ["ER"], "areas": [], "roles": []},
+        concurrent={"units": ["ER", "NICU"], "areas": [], "roles": []},
+    )
+
+    apply_department_updates({"hospital_id": "010001", "unit": "icu"})
+
+    assert fake.updates == 2
+    assert fake.departments["units"] == ["ER", "ICU", "NICU"]
+
+
+def test_department_update_skips_names_already_listed(hospitals):
+    fake = hospitals({"units": ["ICU"], "areas": [], "roles": []})
+
+    apply_department_updates({"hospital_id": "010001", "unit": "icu", "area": ""})
+
+    assert fake.updates == 0
+
+
+@pytest.fixture
+def stub_server():
+    def start(fail_first=0):
+        server = StubModerationServer(("127.0.0.1", 0), fail_first=fail_first)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    servers: list[StubModerationServer] = []
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Verdict writes, department updates and events the queue makes, by report."""
+    recorded = {"verdicts": {}, "departments": [], "events": []}
+    monkeypatch.setattr(
+        queue_module,
+        "supabase_update",
+        lambda table, filters, data, **_: recorded["verdicts"].__setitem__(
+            filters["report_id"].removeprefix("eq."), data["moderation"]
+        ),
+    )
+    monkeypatch.setattr(
+        queue_module, "apply_department_updates", lambda job: recorded["departments"].append(job["report_id"])
+    )
+    monkeypatch.setattr(
+        queue_module, "record_event", lambda kind, **fields: recorded["events"].append((kind, fields["report_id"]))
+    )
+    return recorded
+
+
+def _queue(server, max_attempts=4) -> ModerationQueue:
+    return ModerationQueue(
+        workers=2,
+        max_attempts=max_attempts,
+        backoff=0.01,
+        api_url=f"http://127.0.0.1:{server.server_address[1]}",
+        api_key="test",
+        model="test",
+        verdicts=None,
+    )
+
+
+def _job(report_id, comments):
+    return {
+        "report_id": report_id,
+        "hospital_id": "010001",
+        "user_id": "u1",
+        "job_location": "ICU",
+        "comments": comments,
+        "unit": "ICU",
+    }
+
+
+def test_queue_moves_pending_reports_to_approved_or_flagged(stub_server, writes):
+    moderation = _queue(stub_server())
+
+    moderation.enqueue(_job("r1", "Good staffing ratios."))
+    moderation.enqueue(_job("r2", "Buy my spam course."))
+    moderation.join()
+
+    assert writes["verdicts"] == {
+        "r1": {"flagged": 0, "reason": ""},
+        "r2": {"flagged": 1, "reason": "Entry contains spam."},
+    }
+    assert writes["departments"] == ["r1"]
+    assert writes["events"] == [("report_flagged", "r2")]
+    assert (moderation.completed, moderation.failed) == (2, 0)
+
+
+def test_queue_retries_server_errors(stub_server, writes):
+    server = stub_server(fail_first=2)
+    moderation = _queue(server)
+
+    moderation.enqueue(_job("r1", "Good staffing ratios."))
+    moderation.join()
+
+    assert server.requests == 3
+    assert writes["verdicts"] == {"r1": {"flagged": 0, "reason": ""}}
+
+
+def test_queue_leaves_report_pending_when_retries_run_out(stub_server, writes):
+    server = stub_server(fail_first=5)
+    moderation = _queue(server, max_attempts=2)
+
+    moderation.enqueue(_job("r1", "Good staffing ratios."))
+    moderation.join()
+
+    assert server.requests == 2
+    assert writes["verdicts"] == {}
+    assert writes["departments"] == ["r1"]
@@ -0,0 +1,56 @@
+from nursereports.server.moderation.verdicts import ModerationVerdictCache
+
+import pytest
+
+
+@pytest.fixture
+def verdicts(tmp_path):
+    return ModerationVerdictCache(tmp_path / "verdicts.sqlite3", max_entries=10)
+
+
+def test_normalized_entries_share_a_verdict(verdicts):
+    verdicts.set("ICU", "Great  team", {"flagged": 0, "reason": ""})
+
+    assert verdicts.get("icu", " great team ") == {"flagged": 0, "reason": ""}
+    assert verdicts.get("ICU", "Bad team") is None
+    assert verdicts.stats()["hits"] == verdicts.stats()["misses"] == 1
+
+
+def test_replacing_a_verdict_keeps_the_entry_count(verdicts):
+    verdicts.set("ICU", "Great team", {"flagged": 0, "reason": ""})
+    verdicts.set("ICU", "Great team", {"flagged": 1, "reason": "Spam."})
+    verdicts.set("ER", "Busy", {"flagged": 0, "reason": ""})
+
+    assert verdicts.stats()["entries"] == 2
+    assert verdicts.get("ICU", "Great team") == {"flagged": 1, "reason": "Spam."}
+
+
+def test_unresolved_verdicts_are_not_stored(verdicts):
+    verdicts.set("ICU", "Great team", {"flagged": 2, "reason": "Unmoderated."})
+
+    assert verdicts.get("ICU", "Great team") is None
+    assert verdicts.stats()["entries"] == 0
+
+
+def test_least_recently_used_verdicts_are_evicted(verdicts):
+    for number in range(10):
+        verdicts.set("ICU", f"Entry {number}", {"flagged": 0, "reason": ""})
+    verdicts.get("ICU", "Entry 0")
+    verdicts.set("ICU", "Entry 10", {"flagged": 0, "reason": ""})
+
+    assert verdicts.stats()["entries"] == 9
+    assert verdicts.evictions == 2
+    assert verdicts.get("ICU", "Entry 0") is not None
+    assert verdicts.get("ICU", "Entry 1") is None
+
+
+def test_identical_entries_moderate_once(verdicts):
+    calls = []
+
+    def moderate():
+        calls.append(1)
+        return {"flagged": 0, "reason": ""}
+
+    for _ in range(3):
+        assert verdicts.get_or_moderate("ICU", "Great team", moderate) == {"flagged": 0, "reason": ""}
+    assert len(calls) == 1
@@ -0,0 +1,36 @@
+from nursereports.nursereports import app  # noqa: F401 - states import through the app
+from nursereports.states.pagination import page_count, page_slice
+from nursereports.states.search_state import SearchState
+from nursereports.states.user_state import UserState
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    ("page", "expected"),
+    [(1, [0, 1, 2]), (2, [3, 4, 5]), (4, [9]), (5, []), (0, [0, 1, 2]), (-3, [0, 1, 2])],
+)
+def test_page_slice(page, expected):
+    assert page_slice(range(10), page, 3) == expected
+
+
+@pytest.mark.parametrize(("total", "expected"), [(0, 0), (1, 1), (5, 1), (6, 2), (11, 3)])
+def test_page_count(total, expected):
+    assert page_count(total, 5) == expected
+
+
+def test_paged_vars_only_depend_on_their_list_and_page():
+    expected = {
+        (UserState, "paginated_user_reports"): {"user_reports", "current_report_page"},
+        (UserState, "num_report_pages"): {"user_reports"},
+        (UserState, "paginated_saved_hospitals"): {"user_saved_hospitals", "current_hospital_page"},
+        (UserState, "num_hospital_pages"): {"user_saved_hospitals"},
+        (SearchState, "paginated_search_results"): {
+            "search_results", "current_search_page", "_search_page_size"
+        },
+        (SearchState, "num_search_pages"): {"search_results", "_search_page_size"},
+    }
+    for (state, name), deps in expected.items():
+        var = state.computed_vars[name]
+        assert var._cache
+        assert var._static_deps == {None: deps}
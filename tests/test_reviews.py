@@ -0,0 +1,52 @@
+from nursereports.server.analytics.reviews import ALL_UNITS, ReviewIndex
+
+
+def _review(report_id: str, day: int, unit: str = "ICU", **fields) -> dict:
+    return {
+        "report_id": report_id,
+        "timestamp": f"2025-01-{day:02d}T00:00:00+00:00",
+        "units_areas_roles": unit,
+        **fields,
+    }
+
+
+def _pages(index: ReviewIndex, unit: str | None = None, limit: int = 2) -> list[list[str]]:
+    pages, cursor = [], None
+    while True:
+        page, cursor = index.page(unit, cursor, limit)
+        pages.append([review["report_id"] for review in page])
+        if cursor is None:
+            return pages
+
+
+def test_pages_run_newest_first_without_gaps_or_repeats():
+    index = ReviewIndex([_review(f"r{day}", day) for day in (3, 1, 5, 2, 4)])
+
+    assert _pages(index) == [["r5", "r4"], ["r3", "r2"], ["r1"]]
+
+
+def test_equal_timestamps_page_by_report_id():
+    index = ReviewIndex([_review("b", 1), _review("a", 1), _review("c", 1)])
+
+    assert _pages(index) == [["c", "b"], ["a"]]
+
+
+def test_unit_pages_fall_back_to_all_reviews():
+    index = ReviewIndex([_review("r1", 1, "ICU"), _review("r2", 2, "ER"), _review("r3", 3, "ICU")])
+
+    assert _pages(index, "ICU") == [["r3", "r1"]]
+    assert index.count("ICU") == 2
+    assert index.count("NICU") == index.count(ALL_UNITS) == 3
+
+
+def test_reviews_without_valid_timestamps_are_left_out():
+    index = ReviewIndex([
+        _review("r1", 1),
+        {"report_id": "missing", "units_areas_roles": "ICU"},
+        _review("null", 2, timestamp=None),
+        _review("garbled", 3, timestamp="yesterday"),
+        _review("naive", 4, timestamp="2025-01-04T00:00:00"),
+    ])
+
+    assert _pages(index, limit=10) == [["naive", "r1"]]
+    assert not index.update("garbled", likes=["u1"])
@@ -0,0 +1,98 @@
+from nursereports.server.search.index import HospitalSearchIndex, normalize
+
+import time
+
+HOSPITALS = [
+    {"hosp_id": "010001", "hosp_name": "Mercy General", "hosp_city": "AKRON", "hosp_addr": "1 MAIN ST"},
+    {"hosp_id": "010002", "hosp_name": "Akron Children's", "hosp_city": "AKRON", "hosp_addr": "2 ELM ST"},
+    {"hosp_id": "010003", "hosp_name": "St. Luke's", "hosp_city": "MERCYVILLE", "hosp_addr": "3 OAK AVE"},
+]
+
+
+class Source:
+    """Loader whose rows, version and failures the test controls."""
+
+    def __init__(self):
+        self.version = 1
+        self.loads = 0
+        self.fail = False
+
+    def load(self) -> list[dict]:
+        self.loads += 1
+        if self.fail:
+            raise ConnectionError("supabase down")
+        return [dict(row) for row in HOSPITALS]
+
+
+def wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_normalize_collapses_punctuation():
+    assert normalize("  St. Luke's--Hospital ") == "st luke s hospital"
+
+
+def test_name_matches_rank_before_city_and_address():
+    source = Source()
+    index = HospitalSearchIndex(source.load, version=lambda: source.version)
+    index.refresh()
+
+    assert [row["hosp_id"] for row in index.search("mercy", 10)] == ["010001", "010003"]
+    assert [row["hosp_id"] for row in index.search("akron", 10)] == ["010002", "010001"]
+    assert index.search("main", 10)[0]["hosp_addr"] == "1 Main St"
+    assert index.search("a", 1) and index.search("zzz", 10) == []
+
+
+def test_results_are_copies():
+    source = Source()
+    index = HospitalSearchIndex(source.load, version=lambda: source.version)
+    index.refresh()
+
+    index.search("mercy", 1)[0]["hosp_name"] = "changed"
+
+    assert index.search("mercy", 1)[0]["hosp_name"] == "Mercy General"
+
+
+def test_search_never_loads_inline():
+    source = Source()
+    source.fail = True
+    index = HospitalSearchIndex(source.load, version=lambda: source.version)
+
+    assert index.search("mercy", 10) == []
+    wait_for(lambda: source.loads == 1 and not index._refreshing)
+
+
+def test_failed_load_backs_off():
+    source = Source()
+    source.fail = True
+    index = HospitalSearchIndex(source.load, version=lambda: source.version, retry_interval=0.2)
+
+    assert index.refresh() is False
+    for _ in range(5):
+        index.search("mercy", 10)
+    assert source.loads == 1
+
+    source.fail = False
+    time.sleep(0.25)
+    index.search("mercy", 10)
+    wait_for(lambda: len(index) == 3)
+    assert source.loads == 2
+
+
+def test_snapshot_rebuild_reloads_in_background():
+    source = Source()
+    index = HospitalSearchIndex(source.load, version=lambda: source.version)
+    index.refresh()
+
+    index.search("mercy", 10)
+    assert source.loads == 1
+
+    source.version = 2
+    # The current index answers while the reload runs.
+    assert len(index.search("mercy", 10)) == 2
+    wait_for(lambda: source.loads == 2 and not index._refreshing)
+    index.search("mercy", 10)
+    assert source.loads == 2
@@ -0,0 +1,101 @@
+from nursereports.server.analytics.store import HospitalAnalyticsStore
+from nursereports.server.cache import AsyncSingleFlight, SingleFlight
+
+from test_columnar import _report
+
+import asyncio
+import pytest
+import threading
+import time
+
+
+def test_concurrent_loads_share_one_fetch():
+    store = HospitalAnalyticsStore()
+    fetches = []
+
+    def fetch_reports():
+        fetches.append(threading.current_thread().name)
+        time.sleep(0.05)
+        return [_report("a"), _report("b", selected_unit="ER")]
+
+    async def load_twice():
+        return await asyncio.gather(
+            store.get_or_materialize("010001", fetch_reports),
+            store.get_or_materialize("010001", fetch_reports),
+        )
+
+    first, second = asyncio.run(load_twice())
+
+    assert len(fetches) == 1
+    assert fetches[0] != threading.main_thread().name
+    assert first is second
+    assert first["analytics"]["report_count"] == 2
+
+
+def test_event_loop_keeps_running_during_a_load():
+    flights = AsyncSingleFlight()
+    ticks = []
+
+    async def tick():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def run():
+        await asyncio.gather(flights.do("key", lambda: time.sleep(0.1)), tick())
+
+    asyncio.run(run())
+
+    assert len(ticks) == 5
+    assert ticks[-1] - ticks[0] < 0.1
+
+
+def test_async_followers_get_the_leaders_error():
+    flights = AsyncSingleFlight()
+
+    def fail():
+        time.sleep(0.05)
+        raise ValueError("down")
+
+    async def run():
+        return await asyncio.gather(
+            flights.do("key", fail), flights.do("key", fail), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+
+    assert [type(result) for result in results] == [ValueError, ValueError]
+    assert (flights.calls, flights.shared) == (1, 1)
+
+
+def test_threads_share_one_call():
+    flights = SingleFlight()
+    calls = []
+    results = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"rows": 1}
+
+    threads = [
+        threading.Thread(target=lambda: results.append(flights.do("key", loader)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(value is results[0][0] for value, _ in results)
+    assert all(shared for _, shared in results)
+
+
+def test_results_are_not_kept_after_the_call():
+    flights = SingleFlight()
+
+    assert flights.do("key", lambda: 1) == (1, False)
+    assert flights.do("key", lambda: 2) == (2, False)
+    with pytest.raises(KeyError):
+        flights.do("key", lambda: {}["missing"])
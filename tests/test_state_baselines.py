@@ -0,0 +1,14 @@
+from nursereports.server.analytics.state_baselines import compute_state_baselines
+
+
+def test_malformed_report_does_not_fail_baselines():
+    rows = [
+        {"state": "OH", "emp_type": "Full-time", "hourly": 40, "weekly": None, "total_experience": 5},
+        {"state": "OH", "emp_type": "Full-time", "hourly": "forty", "weekly": None, "total_experience": "x"},
+        {"state": "TX", "emp_type": "Contract", "hourly": None, "weekly": 2500, "total_experience": 3},
+    ]
+
+    baselines = compute_state_baselines(rows)
+
+    assert set(baselines) == {"OH", "TX"}
+    assert len(baselines["OH"]["extrapolated_ft_pay_state"]) == 27
@@ -0,0 +1,87 @@
+from nursereports.server.cache import ttl_cache
+from nursereports.server.cache.ttl_cache import TTLCache
+from types import SimpleNamespace
+
+import threading
+import time
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_their_ttl(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(ttl_cache, "time", SimpleNamespace(monotonic=clock))
+    cache = TTLCache("test-expiry", ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=60)
+
+    clock.now += 30
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.stats()["expirations"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache("test-lru", ttl=60, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_memory_budget_evicts_and_skips_oversized_values():
+    cache = TTLCache("test-bytes", ttl=60, max_bytes=250, sizer=lambda value: len(value))
+    cache.set("a", "x" * 100)
+    cache.set("b", "x" * 100)
+    cache.set("c", "x" * 100)
+    cache.set("huge", "x" * 300)
+
+    assert "a" not in cache and "huge" not in cache
+    assert cache.stats()["bytes"] == 200
+
+
+def test_concurrent_misses_share_one_load():
+    cache = TTLCache("test-load", ttl=60)
+    started = threading.Barrier(4)
+    loads = []
+
+    def loader():
+        loads.append(1)
+        time.sleep(0.1)
+        return {"value": 1}
+
+    def worker():
+        started.wait()
+        results.append(cache.get_or_set("key", loader))
+
+    results = []
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loads) == 1
+    assert results == [{"value": 1}] * 4
+
+
+def test_invalidation():
+    cache = TTLCache("test-invalidate", ttl=60)
+    for key in ("010001", "010002", "020001"):
+        cache.set(key, key)
+
+    cache.invalidate("020001")
+    cache.invalidate_where(lambda key: key.startswith("0100"))
+
+    assert len(cache) == 0 and cache.stats()["bytes"] == 0